@@ -0,0 +1,245 @@
+"""
+Index vectorial (in memorie) al raspunsurilor text deja evaluate, cate unul per raspuns
+de referinta. Un raspuns nou foarte apropiat (cosinus >= prag) de unul evaluat primeste
+evaluarea acestuia; ramane de calculat doar embedding-ul lui.
+
+Cautarea e un produs matrice-vector in NumPy peste toate raspunsurile referintei, sau,
+cu ANSWER_INDEX_IVF_LISTS > 0, doar peste listele (clusterele) cele mai apropiate.
+Memoria e limitata de ANSWER_INDEX_MAX_VECTORS (in total) si de
+ANSWER_INDEX_MAX_PER_REFERENCE; indexul se poate reconstrui din tabelele answer/evaluation.
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+ANSWER_INDEX_ENABLED = os.getenv("ANSWER_INDEX_ENABLED", "0") == "1"
+# Similaritatea cosinus minima fata de un raspuns evaluat pentru a-i prelua evaluarea
+ANSWER_INDEX_THRESHOLD = float(os.getenv("ANSWER_INDEX_THRESHOLD", "0.97"))
+ANSWER_INDEX_MAX_VECTORS = int(os.getenv("ANSWER_INDEX_MAX_VECTORS", "50000"))
+ANSWER_INDEX_MAX_PER_REFERENCE = int(os.getenv("ANSWER_INDEX_MAX_PER_REFERENCE", "2000"))
+# 0 = cautare exhaustiva; altfel numarul de liste IVF si cate liste se cerceteaza la o cautare
+ANSWER_INDEX_IVF_LISTS = int(os.getenv("ANSWER_INDEX_IVF_LISTS", "0"))
+ANSWER_INDEX_IVF_PROBES = int(os.getenv("ANSWER_INDEX_IVF_PROBES", "2"))
+
+# Ramurile evaluate prin similaritate semantica (singurele care ajung in index)
+SEMANTIC_MATCH_TYPES = ("hybrid_evaluation", "nash_semantic")
+
+# IVF se antreneaza abia cand fiecare lista ar avea in medie atatea raspunsuri
+_IVF_MIN_PER_LIST = 16
+_KMEANS_ITERATIONS = 5
+
+
+def reference_key(correct_answer_json: Dict[str, Any], model_id: str) -> str:
+    """
+    Cheia indexului: raspunsul corect complet (referinta, cuvinte cheie) si modelul.
+    Intrebari generate separat, dar cu acelasi raspuns corect, impart acelasi index.
+    """
+    payload = json.dumps(correct_answer_json, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(f"{model_id}\n{payload}".encode("utf-8")).hexdigest()
+
+
+class ReferenceIndex:
+    """Raspunsurile evaluate pentru o referinta; cand e plin, cele mai vechi sunt suprascrise"""
+
+    def __init__(self, dim: int, capacity: int, ivf_lists: int = 0, ivf_probes: int = 2):
+        self.capacity = max(1, capacity)
+        self.ivf_lists = ivf_lists
+        self.ivf_probes = max(1, ivf_probes)
+        self.vectors = np.empty((min(64, self.capacity), dim), dtype=np.float32)
+        self.results: List[Dict[str, Any]] = []
+        self.count = 0
+        self._next = 0  # pozitia urmatoarei scrieri cand indexul e plin
+
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self._trained_at = 0
+
+    @property
+    def allocated(self) -> int:
+        return self.vectors.shape[0]
+
+    def add(self, vector: np.ndarray, result: Dict[str, Any]):
+        if self.count < self.capacity:
+            if self.count == self.allocated:
+                grown = np.empty((min(self.allocated * 2, self.capacity), self.vectors.shape[1]), dtype=np.float32)
+                grown[:self.count] = self.vectors[:self.count]
+                self.vectors = grown
+            position = self.count
+            self.count += 1
+            self.results.append(result)
+        else:
+            position = self._next
+            self._next = (self._next + 1) % self.capacity
+            self.results[position] = result
+        self.vectors[position] = vector
+
+        if self.centroids is not None:
+            if self.assignments.shape[0] < self.allocated:
+                self.assignments = np.resize(self.assignments, self.allocated)
+            self.assignments[position] = int(np.argmax(self.centroids @ vector))
+        self._maybe_train()
+
+    def search(self, vector: np.ndarray) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """(similaritatea, evaluarea) celui mai apropiat raspuns"""
+        if self.count == 0:
+            return -1.0, None
+        if self.centroids is None:
+            candidates = None
+            similarities = self.vectors[:self.count] @ vector
+        else:
+            probes = np.argsort(-(self.centroids @ vector))[:self.ivf_probes]
+            candidates = np.flatnonzero(np.isin(self.assignments[:self.count], probes))
+            if candidates.size == 0:
+                return -1.0, None
+            similarities = self.vectors[candidates] @ vector
+        best = int(np.argmax(similarities))
+        position = best if candidates is None else int(candidates[best])
+        return float(similarities[best]), self.results[position]
+
+    def _maybe_train(self):
+        """k-means sferic pe vectorii curenti; re-antrenat cand indexul isi dubleaza dimensiunea"""
+        if self.ivf_lists <= 0 or self.count < self.ivf_lists * _IVF_MIN_PER_LIST:
+            return
+        if self._trained_at and self.count < 2 * self._trained_at:
+            return
+
+        data = self.vectors[:self.count]
+        rng = np.random.default_rng(0)
+        centroids = data[rng.choice(self.count, self.ivf_lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            assignments = np.argmax(data @ centroids.T, axis=1)
+            for cluster in range(self.ivf_lists):
+                members = data[assignments == cluster]
+                if len(members):
+                    center = members.mean(axis=0)
+                    centroids[cluster] = center / (np.linalg.norm(center) or 1.0)
+
+        self.centroids = centroids
+        self.assignments = np.empty(self.allocated, dtype=np.int32)
+        self.assignments[:self.count] = np.argmax(data @ centroids.T, axis=1)
+        self._trained_at = self.count
+
+
+class AnswerIndex:
+    """Indexurile tuturor referintelor, cu limita totala de vectori (se elimina referinta folosita cel mai demult)"""
+
+    def __init__(self, threshold: float = ANSWER_INDEX_THRESHOLD,
+                 max_vectors: int = ANSWER_INDEX_MAX_VECTORS,
+                 max_per_reference: int = ANSWER_INDEX_MAX_PER_REFERENCE,
+                 ivf_lists: int = ANSWER_INDEX_IVF_LISTS,
+                 ivf_probes: int = ANSWER_INDEX_IVF_PROBES):
+        self.threshold = threshold
+        self.max_vectors = max_vectors
+        self.max_per_reference = min(max_per_reference, max_vectors)
+        self.ivf_lists = ivf_lists
+        self.ivf_probes = ivf_probes
+        self._indexes: "OrderedDict[str, ReferenceIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: str, vector: np.ndarray) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Evaluarea (copie) unui raspuns deja evaluat, daca exista unul destul de apropiat"""
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                similarity, result = index.search(vector)
+                if result is not None and similarity >= self.threshold:
+                    self.hits += 1
+                    return similarity, copy.deepcopy(result)
+            self.misses += 1
+            return None
+
+    def add(self, key: str, vector: np.ndarray, result: Dict[str, Any]):
+        if self.max_vectors <= 0:
+            return
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = ReferenceIndex(
+                    vector.shape[0], self.max_per_reference, self.ivf_lists, self.ivf_probes
+                )
+            self._indexes.move_to_end(key)
+            index.add(vector, copy.deepcopy(result))
+            self._evict()
+
+    def _evict(self):
+        total = sum(index.count for index in self._indexes.values())
+        while total > self.max_vectors and len(self._indexes) > 1:
+            _, evicted = self._indexes.popitem(last=False)
+            total -= evicted.count
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": ANSWER_INDEX_ENABLED,
+                "references": len(self._indexes),
+                "vectors": sum(index.count for index in self._indexes.values()),
+                "max_vectors": self.max_vectors,
+                "threshold": self.threshold,
+                "ivf_lists": self.ivf_lists,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def rebuild_from_db(index: AnswerIndex, evaluator_version: str, model_id: str,
+                    encode_fn: Callable[[List[str]], np.ndarray],
+                    session_factory: Callable[[], Any], chunk_size: int = 256) -> int:
+    """
+    Reconstruieste indexul din evaluarile semantice salvate cu evaluator_version
+    (cele mai recente intai, pana la limita de memorie). Intoarce numarul de raspunsuri adaugate.
+    session_factory vine de la apelant (app.database.SessionLocal): modulele din core nu
+    depind de stratul de baza de date.
+    """
+    # modelele importa app.database (creeaza engine-ul), deci doar aici, nu la importul modulului
+    from ..models import Answer, Evaluation, Question
+
+    query = (
+        select(Answer.answer_text, Evaluation.score, Evaluation.details, Question.correct_answer)
+        .join(Evaluation, Evaluation.answer_id == Answer.id)
+        .join(Question, Answer.question_id == Question.id)
+        .where(Evaluation.evaluator == evaluator_version, Answer.answer_text.isnot(None))
+        .order_by(Evaluation.id.desc())
+    )
+    index.clear()
+    added = 0
+    db = session_factory()
+    try:
+        result = db.execute(query.execution_options(stream_results=True, yield_per=chunk_size))
+        for rows in result.partitions(chunk_size):
+            rows = [
+                row for row in rows
+                if row.answer_text.strip()
+                and (row.details or {}).get("match_type") in SEMANTIC_MATCH_TYPES
+                and "index_similarity" not in row.details  # doar evaluari calculate, nu preluate
+            ]
+            if not rows:
+                continue
+            vectors = encode_fn([row.answer_text for row in rows])
+            for row, vector in zip(rows, vectors):
+                score = float(row.score)
+                # ramurile semantice considera corect un scor >= 60
+                stored = {"is_correct": score >= 60, "score": score, "details": row.details}
+                index.add(reference_key(row.correct_answer or {}, model_id), vector, stored)
+            added += len(rows)
+            if added >= index.max_vectors:
+                break
+    finally:
+        db.close()
+    return added
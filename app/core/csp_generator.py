@@ -24,6 +24,7 @@ def genereaza_problema_csp(difficulty=2):
     
     prompt = ""
     correct_answer_str = "Eroare Generare"
+    answer_key = None  # multimea de valori (sortata) folosita de evaluator
     correct_raw = None
     
     # Lista globala de valori posibile (pentru generarea de distractori la final)
@@ -217,6 +218,7 @@ def genereaza_problema_csp(difficulty=2):
             if subtype == "MRV":
                 correct_raw = csp_solver_instance.select_variable_mrv({})
                 correct_answer_str = str(correct_raw)
+                answer_key = [str(correct_raw)]
             elif subtype == "FC":
                 var_assigned = list(problem_data["assignment"].keys())[0]
                 val_assigned = problem_data["assignment"][var_assigned]
@@ -229,6 +231,7 @@ def genereaza_problema_csp(difficulty=2):
                     pass
                 correct_raw = remaining_vals
                 correct_answer_str = "{" + ", ".join(map(str, remaining_vals)) + "}"
+                answer_key = sorted(map(str, remaining_vals))
             elif subtype == "AC3":
                 csp_solver_instance.ac3()
                 target_var = problem_data["target"]
@@ -238,6 +241,7 @@ def genereaza_problema_csp(difficulty=2):
                 except:
                     pass
                 correct_raw = remaining_vals
+                answer_key = sorted(map(str, remaining_vals))
                 if not remaining_vals:
                     correct_answer_str = "Multimea vida"
                 else:
@@ -318,13 +322,17 @@ def genereaza_problema_csp(difficulty=2):
 
     random.shuffle(options)
 
+    correct_answer = {"answer": str(correct_answer_str)}
+    if answer_key is not None:
+        correct_answer["key"] = answer_key
+
     return {
         "title": f"CSP: {subtype} ({'Usor' if difficulty == 1 else 'Mediu' if difficulty == 2 else 'Greu'})",
         "prompt": prompt,
         "question_type": "CSP_PROBLEM",
         "difficulty": difficulty,  # ADAUGAT
         "problem_instance": problem_data,
-        "correct_answer": {"answer": str(correct_answer_str)},
+        "correct_answer": correct_answer,
         "reference_solution": f"Raspunsul corect: {correct_answer_str}.",
         "chapter_name": "Satisfacerea Constrangerilor (CSP)",
         "answer_type": "multiple",
@@ -0,0 +1,129 @@
+import os
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class SentenceTransformerBackend:
+    """
+    Backend implicit: modelul SentenceTransformer in PyTorch, fp32.
+    Toate backend-urile expun encode(texts) -> np.ndarray (float32, normalizat L2).
+    """
+    name = "torch"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        # backend-ul care produce efectiv vectorii (la sidecar: cel din procesul sidecar)
+        self.embedding_backend = self.name
+        self.model = self._load()
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name, device="cpu")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+
+
+class QuantizedTorchBackend(SentenceTransformerBackend):
+    """
+    Acelasi model, cu straturile Linear cuantizate dinamic la int8.
+    Ruleaza doar pe CPU; reduce latenta si memoria fara fisiere suplimentare.
+    """
+    name = "torch-int8"
+
+    def _load(self):
+        import torch
+        model = super()._load()
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxBackend(SentenceTransformerBackend):
+    """
+    Inferenta prin ONNX Runtime (necesita sentence-transformers>=3.2 si optimum[onnxruntime]).
+    Fisierul .onnx folosit poate fi ales cu SEMANTIC_ONNX_FILE.
+    """
+    name = "onnx"
+    default_file = "onnx/model.onnx"
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+        file_name = os.getenv("SEMANTIC_ONNX_FILE", self.default_file)
+        return SentenceTransformer(
+            self.model_name,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": file_name}
+        )
+
+
+class QuantizedOnnxBackend(OnnxBackend):
+    """Modelul ONNX cuantizat int8 publicat impreuna cu modelul (varianta AVX2)"""
+    name = "onnx-int8"
+    default_file = "onnx/model_quint8_avx2.onnx"
+
+
+class SidecarBackend(SentenceTransformerBackend):
+    """
+    Modelul ruleaza in procesul sidecar (python -m cli.embedding_sidecar), partajat de toti
+    workerii; aici ramane doar clientul pe socket-ul Unix (SEMANTIC_SIDECAR_SOCKET).
+    """
+    name = "sidecar"
+
+    def _load(self):
+        from .embedding_sidecar import SidecarClient
+        client = SidecarClient(self.model_name)
+        client.encode([])  # verifica legatura si modelul sidecar-ului
+        self.embedding_backend = client.stats()["backend"]
+        return client
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (SentenceTransformerBackend, QuantizedTorchBackend, OnnxBackend, QuantizedOnnxBackend, SidecarBackend)
+}
+
+
+def load_backend(name: str, model_name: str):
+    """Construieste backend-ul de embeddings ales prin configurare (SEMANTIC_BACKEND)"""
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de embeddings necunoscut: {name} (disponibile: {', '.join(BACKENDS)})")
+    return BACKENDS[name](model_name)
+
+
+def _pair_similarities(backend, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+    answers = backend.encode([answer for answer, _ in pairs])
+    references = backend.encode([reference for _, reference in pairs])
+    return np.sum(answers * references, axis=1)
+
+
+def parity_report(reference, candidate, pairs: Sequence[Tuple[str, str]],
+                  threshold: float = 0.6, repeats: int = 3) -> Dict[str, float]:
+    """
+    Compara similaritatile (raspuns, referinta) calculate de doua backend-uri.
+    Raporteaza abaterea fata de backend-ul de referinta (fp32), cate verdicte
+    se schimba la pragul de corectitudine si latenta medie per encode.
+    """
+    expected = _pair_similarities(reference, pairs)
+    got = _pair_similarities(candidate, pairs)
+    drift = np.abs(expected - got)
+
+    def latency_ms(backend) -> float:
+        texts = [answer for answer, _ in pairs]
+        start = time.perf_counter()
+        for _ in range(repeats):
+            backend.encode(texts)
+        return (time.perf_counter() - start) * 1000.0 / repeats
+
+    return {
+        "pairs": len(pairs),
+        "max_abs_drift": float(drift.max()),
+        "mean_abs_drift": float(drift.mean()),
+        "verdict_flips": int(np.sum((expected >= threshold) != (got >= threshold))),
+        "reference_latency_ms": latency_ms(reference),
+        "candidate_latency_ms": latency_ms(candidate),
+    }
@@ -0,0 +1,176 @@
+"""
+Serviciu de embeddings partajat intre workeri (uvicorn --workers N).
+
+Procesul sidecar incarca o singura data modelul si raspunde la cereri de encode pe un
+socket Unix. Cererile tuturor workerilor intra in acelasi EncodeBatcher, deci sunt
+grupate impreuna intr-un singur apel al modelului. Workerii folosesc backend-ul
+"sidecar" (SEMANTIC_BACKEND=sidecar) si nu mai incarca modelul deloc.
+
+Protocol (pe o conexiune persistenta): fiecare mesaj e un antet JSON si un payload binar,
+fiecare precedat de lungimea lui pe 4 octeti (big-endian).
+    cerere:  {"model": ..., "texts": [...]}        sau {"op": "stats"}
+    raspuns: {"shape": [n, dim]} + n*dim float32   sau {"error": ...} / statisticile
+             (cu "model" si "backend", backend-ul care calculeaza embedding-urile)
+"""
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+from .embedding_backends import load_backend
+from .inference_queue import EncodeBatcher
+
+SEMANTIC_SIDECAR_SOCKET = os.getenv("SEMANTIC_SIDECAR_SOCKET", "/tmp/embedding-sidecar.sock")
+# Cat asteapta un worker ca sidecar-ul sa porneasca (secunde)
+SEMANTIC_SIDECAR_CONNECT_TIMEOUT = float(os.getenv("SEMANTIC_SIDECAR_CONNECT_TIMEOUT", "30"))
+
+_LENGTH = struct.Struct("!I")
+
+
+class SidecarError(RuntimeError):
+    """Sidecar-ul a refuzat cererea (ex. alt model) sau encode-ul a esuat acolo"""
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        chunk = sock.recv_into(view[received:])
+        if chunk == 0:
+            raise ConnectionError("Conexiunea cu sidecar-ul s-a inchis")
+        received += chunk
+    return bytes(buffer)
+
+
+def send_message(sock: socket.socket, header: Dict[str, Any], payload: bytes = b""):
+    data = json.dumps(header).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(data)) + data + _LENGTH.pack(len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    header = json.loads(_recv_exactly(sock, _LENGTH.unpack(_recv_exactly(sock, _LENGTH.size))[0]))
+    payload = _recv_exactly(sock, _LENGTH.unpack(_recv_exactly(sock, _LENGTH.size))[0])
+    return header, payload
+
+
+class _EncodeHandler(socketserver.BaseRequestHandler):
+    """O conexiune (de obicei cate una per worker), cu oricate cereri una dupa alta"""
+
+    def handle(self):
+        server = self.server
+        while True:
+            try:
+                header, _ = recv_message(self.request)
+            except (ConnectionError, OSError):
+                return
+
+            if header.get("op") == "stats":
+                send_message(self.request, dict(
+                    server.batcher.stats(), model=server.model_name, backend=server.backend.name
+                ))
+                continue
+            if header.get("model") != server.model_name:
+                send_message(self.request, {
+                    "error": f"Sidecar-ul ruleaza modelul {server.model_name}, nu {header.get('model')}"
+                })
+                continue
+
+            try:
+                texts = header.get("texts") or []
+                vectors = server.batcher.encode(texts) if texts else np.empty((0, server.dimension))
+                vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+                send_message(self.request, {"shape": list(vectors.shape)}, vectors.tobytes())
+            except Exception as e:
+                send_message(self.request, {"error": str(e)})
+
+
+class EmbeddingSidecar(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, backend_name: str, model_name: str,
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.model_name = model_name
+        self.backend = load_backend(backend_name, model_name)
+        self.dimension = int(self.backend.encode(["warmup"]).shape[1])
+        self.batcher = EncodeBatcher(self.backend.encode, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+        # un socket ramas de la o rulare anterioara ar bloca bind-ul
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _EncodeHandler)
+
+
+class SidecarClient:
+    """
+    Clientul folosit de workeri: o conexiune persistenta per thread (in evaluator encode-ul
+    ruleaza pe thread-ul EncodeBatcher-ului, deci practic una per worker).
+    """
+
+    def __init__(self, model_name: str, socket_path: str = SEMANTIC_SIDECAR_SOCKET,
+                 connect_timeout: float = SEMANTIC_SIDECAR_CONNECT_TIMEOUT):
+        self.model_name = model_name
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+        self._local = threading.local()
+
+    def _connect(self) -> socket.socket:
+        # la pornire workerii pot fi gata inaintea sidecar-ului
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except OSError:
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.2)
+
+    def _close(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+    def _request(self, header: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+        # o conexiune rupta (sidecar repornit) se reface o singura data; encode-ul poate fi repetat
+        for attempt in range(2):
+            if getattr(self._local, "sock", None) is None:
+                self._local.sock = self._connect()
+            try:
+                send_message(self._local.sock, header)
+                response = recv_message(self._local.sock)
+                break
+            except (ConnectionError, OSError):
+                self._close()
+                if attempt:
+                    raise
+        if "error" in response[0]:
+            raise SidecarError(response[0]["error"])
+        return response
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        header, payload = self._request({"model": self.model_name, "texts": list(texts)})
+        return np.frombuffer(payload, dtype=np.float32).reshape(header["shape"])
+
+    def stats(self) -> Dict[str, Any]:
+        return self._request({"op": "stats"})[0]
+
+
+def serve(socket_path: str, backend_name: str, model_name: str,
+          max_batch_size: int = 32, max_wait_ms: float = 5.0):
+    server = EmbeddingSidecar(socket_path, backend_name, model_name, max_batch_size, max_wait_ms)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
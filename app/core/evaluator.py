@@ -1,23 +1,569 @@
-from typing import Dict, Any,Tuple,Optional
-from sentence_transformers import SentenceTransformer, util
-import re 
-import unicodedata
+from typing import Callable, Dict, Any, Optional, List, Sequence
+import numpy as np
+import copy
+import logging
+import os
+import threading
+import time
+
+from .answer_index import ANSWER_INDEX_ENABLED, AnswerIndex, rebuild_from_db, reference_key
+from .inference_queue import AdmissionLimiter, EncodeBatcher
+from .graders import (
+    SemanticRequest, get_grader, grader_cache_stats, question_type_name, reference_texts, uses_semantic_grading
+)
+from .metrics import Counter, Histogram, register_collector
+from .reference_store import REFERENCE_STORE_PATH, build_store, load_store, static_reference_texts
+from .embedding_backends import load_backend
+from .lru_cache import TTLCache, MISSING
+
+logger = logging.getLogger(__name__)
 
 # Model pentru similaritate semantica (multilingv, suporta romana)
-semantic_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
+SEMANTIC_MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+# SEMANTIC_MODEL_ENABLED=0 -> worker doar pentru generare, nu incarca niciodata modelul
+SEMANTIC_MODEL_ENABLED = os.getenv("SEMANTIC_MODEL_ENABLED", "1") != "0"
+# SEMANTIC_MODEL_WARMUP=0 -> modelul se incarca abia la primul raspuns evaluat semantic
+SEMANTIC_MODEL_WARMUP = os.getenv("SEMANTIC_MODEL_WARMUP", "1") != "0"
+# Backend de inferenta: torch (fp32), torch-int8, onnx, onnx-int8 (vezi embedding_backends.py)
+SEMANTIC_BACKEND = os.getenv("SEMANTIC_BACKEND", "torch")
+
+# Micro-batching: cererile concurente de encode sunt grupate intr-un singur apel al modelului
+SEMANTIC_BATCH_MAX_SIZE = int(os.getenv("SEMANTIC_BATCH_MAX_SIZE", "32"))
+SEMANTIC_BATCH_MAX_WAIT_MS = float(os.getenv("SEMANTIC_BATCH_MAX_WAIT_MS", "5"))
+
+# Admission control pentru pasul semantic: cel mult SEMANTIC_MAX_CONCURRENCY cereri codifica
+# deodata, SEMANTIC_MAX_QUEUE asteapta (cel mult SEMANTIC_QUEUE_TIMEOUT secunde), restul primesc
+# 503 cu Retry-After. Cererile in asteptare tin ocupat un thread din threadpool (implicit 40),
+# deci suma celor doua trebuie sa ramana sub el, ca evaluarile structurale sa aiba thread-uri libere.
+SEMANTIC_MAX_CONCURRENCY = int(os.getenv("SEMANTIC_MAX_CONCURRENCY", "4"))
+SEMANTIC_MAX_QUEUE = int(os.getenv("SEMANTIC_MAX_QUEUE", "16"))
+SEMANTIC_QUEUE_TIMEOUT = float(os.getenv("SEMANTIC_QUEUE_TIMEOUT", "10"))
+SEMANTIC_RETRY_AFTER = int(os.getenv("SEMANTIC_RETRY_AFTER", "5"))
+
+# Raspunsurile lungi (modelul trunchiaza la ~128 de tokeni) sunt impartite in ferestre de
+# SEMANTIC_WINDOW_WORDS cuvinte care se suprapun pe SEMANTIC_WINDOW_OVERLAP cuvinte; cel mult
+# SEMANTIC_MAX_WINDOWS ferestre (distribuite pe tot raspunsul), scorurile combinate cu max sau mean
+SEMANTIC_WINDOW_WORDS = int(os.getenv("SEMANTIC_WINDOW_WORDS", "80"))
+SEMANTIC_WINDOW_OVERLAP = int(os.getenv("SEMANTIC_WINDOW_OVERLAP", "20"))
+SEMANTIC_MAX_WINDOWS = int(os.getenv("SEMANTIC_MAX_WINDOWS", "8"))
+SEMANTIC_WINDOW_POOLING = os.getenv("SEMANTIC_WINDOW_POOLING", "max")
+
+# Eticheta salvata in evaluation.evaluator; se schimba odata cu regulile de punctare,
+# iar raspunsurile vechi pot fi re-evaluate cu python -m cli.regrade_answers
+# v2 (intrebarile cu correct_answer["key"]), fata de algorithmic_evaluator, cu aceleasi reguli de punctare:
+#   - CSP (FC/AC3): pe langa comparatia pe textul afisat, e corecta si multimea egala cu cheia
+#     (valori cu mai multe cuvinte, spatii/diacritice diferite, orice ordine)
+#   - CSP (MRV): raspunsul trebuie sa numeasca variabila ca pe un cuvant; inainte era acceptat
+#     orice raspuns care continea numele ei ca subsir (ex. "y" pentru "Y" in "Variabila Xy")
+#   - Nash: raspunsul e comparat fara diacritice, deci "(Sus, Stânga)" e recunoscut
+EVALUATOR_VERSION = "algorithmic_evaluator_v2"
+
+# Identificatorul spatiului de embeddings (modelul + backend-ul care l-a produs).
+# Cu SEMANTIC_BACKEND=sidecar backend-ul real e aflat de la sidecar la incarcarea modelului
+SEMANTIC_MODEL_ID = f"{SEMANTIC_MODEL_NAME}/{SEMANTIC_BACKEND}"
+
+# Cache pentru embedding-urile raspunsurilor si pentru rezultatele evaluarii (0 = dezactivat)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
+EMBEDDING_CACHE_TTL = float(os.getenv("EMBEDDING_CACHE_TTL", "3600"))
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "4096"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "600"))
+
+_embedding_cache = TTLCache(EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_TTL)
+_result_cache = TTLCache(RESULT_CACHE_SIZE, RESULT_CACHE_TTL)
+# Raspunsurile evaluate semantic, pentru refolosirea evaluarii la raspunsuri aproape identice
+_answer_index = AnswerIndex()
+
+# Metrici (expuse la /metrics)
+GRADES_TOTAL = Counter(
+    "evaluator_grades_total", "Raspunsuri evaluate (fara cele servite din cache)",
+    ("question_type", "match_type")
+)
+GRADE_DURATION = Histogram(
+    "evaluator_grade_duration_seconds", "Durata evaluarii unui raspuns, inclusiv encode-ul semantic",
+    ("question_type", "match_type")
+)
+ENCODE_DURATION = Histogram("semantic_encode_duration_seconds", "Durata unui apel encode al modelului semantic")
+ENCODE_BATCH_SIZE = Histogram(
+    "semantic_encode_batch_size", "Numarul de texte dintr-un apel encode",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+def normalize_answer(text: Optional[str]) -> str:
+    """Elimina spatiile de la capete si comprima spatiile multiple (cheia din cache-uri)"""
+    return " ".join((text or "").split())
+
+
+class SemanticModelUnavailable(RuntimeError):
+    """Modelul semantic este dezactivat in acest proces (SEMANTIC_MODEL_ENABLED=0)"""
+
+
+class SemanticOverloaded(RuntimeError):
+    """Coada evaluarii semantice e plina; cererea poate fi reincercata dupa retry_after secunde"""
+
+    def __init__(self, retry_after: int = SEMANTIC_RETRY_AFTER):
+        super().__init__("Prea multe evaluari semantice in curs, reincercati in curand")
+        self.retry_after = retry_after
+
+
+_semantic_model = None
+_semantic_model_lock = threading.Lock()
+# Embedding-urile textelor de referinta statice, mapate din fisier (vezi reference_store.py)
+_reference_store = None
+# Dimensiunea embedding-urilor modelului curent, cunoscuta dupa primul encode
+_embedding_dim = None
+
+
+def get_semantic_model():
+    """
+    Incarca backend-ul de embeddings (SEMANTIC_BACKEND) la prima folosire, o singura data per proces.
+    Importul evaluatorului ramane ieftin: rutele de generare nu platesc incarcarea modelului.
+    """
+    global _semantic_model, SEMANTIC_MODEL_ID
+    if _semantic_model is None:
+        if not SEMANTIC_MODEL_ENABLED:
+            raise SemanticModelUnavailable("Modelul semantic este dezactivat pe acest worker")
+        with _semantic_model_lock:
+            if _semantic_model is None:
+                model = load_backend(SEMANTIC_BACKEND, SEMANTIC_MODEL_NAME)
+                SEMANTIC_MODEL_ID = f"{SEMANTIC_MODEL_NAME}/{model.embedding_backend}"
+                load_reference_store(model.encode)
+                _semantic_model = model
+    return _semantic_model
+
+
+def load_reference_store(encode_fn=None, rebuild: bool = False):
+    """
+    Deschide depozitul de embeddings pentru textele statice. Daca lipseste sau a fost
+    construit pentru alte texte/alt model (ori rebuild=True), il reconstruieste cu encode_fn.
+    """
+    global _reference_store
+    texts = [normalize_answer(text) for text in static_reference_texts()]
+    store = None if rebuild else load_store(REFERENCE_STORE_PATH, SEMANTIC_MODEL_ID, texts)
+    if store is None and encode_fn is not None:
+        try:
+            store = build_store(REFERENCE_STORE_PATH, SEMANTIC_MODEL_ID, texts, encode_fn)
+        except OSError as e:
+            # ex. sistem de fisiere read-only: textele se codifica la cerere, ca inainte
+            logger.warning("depozitul de embeddings nu a putut fi scris: %s", e)
+    _reference_store = store
+    return store
+
+
+def semantic_model_id() -> str:
+    """SEMANTIC_MODEL_ID curent (pentru alte module: la sidecar se schimba dupa incarcarea modelului)"""
+    return SEMANTIC_MODEL_ID
+
+
+def is_semantic_model_loaded() -> bool:
+    return _semantic_model is not None
+
+
+def warmup_semantic_model():
+    """Incarca modelul si ruleaza un encode de proba (apelat la pornirea aplicatiei)"""
+    if SEMANTIC_MODEL_ENABLED:
+        encode_texts(["warmup"])
+
+
+def _encode_batch(texts: List[str]) -> np.ndarray:
+    model = get_semantic_model()
+    start = time.perf_counter()
+    vectors = model.encode(texts)
+    ENCODE_DURATION.observe(time.perf_counter() - start)
+    ENCODE_BATCH_SIZE.observe(len(texts))
+    return vectors
+
+
+_admission = AdmissionLimiter(SEMANTIC_MAX_CONCURRENCY, SEMANTIC_MAX_QUEUE, SEMANTIC_QUEUE_TIMEOUT)
+
+_encode_batcher = EncodeBatcher(
+    _encode_batch,
+    max_batch_size=SEMANTIC_BATCH_MAX_SIZE,
+    max_wait_ms=SEMANTIC_BATCH_MAX_WAIT_MS
+)
+
+
+def _known_embedding(text: str):
+    """Embedding-ul din depozitul static sau din cache (MISSING daca trebuie calculat)"""
+    if _reference_store is not None:
+        vec = _reference_store.get(text)
+        if vec is not None:
+            return vec
+    return _embedding_cache.get((SEMANTIC_MODEL_ID, text))
+
+
+def encode_texts(texts) -> np.ndarray:
+    """
+    Calculeaza embedding-urile (float32, normalizate) pentru o lista de texte.
+    Trece prin coada de micro-batching, impreuna cu cererile celorlalte thread-uri.
+    Textele deja codificate recent vin din cache, fara sa mai ajunga la model.
+    """
+    if not SEMANTIC_MODEL_ENABLED:
+        raise SemanticModelUnavailable("Modelul semantic este dezactivat pe acest worker")
+
+    global _embedding_dim
+    texts = [normalize_answer(text) for text in texts]
+    vectors = [_known_embedding(text) for text in texts]
+
+    missing = list(dict.fromkeys(text for text, vec in zip(texts, vectors) if vec is MISSING))
+    if missing:
+        encoded = dict(zip(missing, _encode_batcher.encode(missing)))
+        for text, vec in encoded.items():
+            _embedding_cache.put((SEMANTIC_MODEL_ID, text), np.array(vec))
+        vectors = [encoded[text] if vec is MISSING else vec for text, vec in zip(texts, vectors)]
+
+    vectors = np.stack(vectors)
+    _embedding_dim = vectors.shape[1]
+    return vectors
+
+
+def inference_stats() -> Dict[str, Any]:
+    """Statistici despre coada de inferenta (adancime, dimensiunea loturilor) si admission control"""
+    return dict(_encode_batcher.stats(), admission=_admission.stats())
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss pentru cache-ul de embeddings si cel de rezultate"""
+    return {
+        "embedding_cache": _embedding_cache.stats(),
+        "result_cache": _result_cache.stats(),
+        "grader_cache": grader_cache_stats(),
+    }
+
+
+def answer_index_stats() -> Dict[str, Any]:
+    return _answer_index.stats()
+
+
+def rebuild_answer_index(session_factory, **kwargs) -> int:
+    """Reincarca indexul de raspunsuri din evaluarile salvate cu EVALUATOR_VERSION"""
+    return rebuild_from_db(_answer_index, EVALUATOR_VERSION, SEMANTIC_MODEL_ID, encode_answers,
+                           session_factory, **kwargs)
+
+
+@register_collector
+def _collect_stats():
+    """Statisticile cozii si ale cache-urilor, citite doar la scrape"""
+    queue = _encode_batcher.stats()
+    yield ("semantic_queue_depth", "gauge", "Cereri de encode in asteptare",
+           [({}, queue["queue_depth"])])
+    admission = _admission.stats()
+    yield ("semantic_admission_active", "gauge", "Cereri care ruleaza pasul semantic",
+           [({}, admission["active"])])
+    yield ("semantic_admission_waiting", "gauge", "Cereri care asteapta un loc pentru pasul semantic",
+           [({}, admission["waiting"])])
+    yield ("semantic_admission_rejected_total", "counter", "Cereri refuzate cu 503 (coada plina)",
+           [({}, admission["rejected"])])
+    caches = cache_stats()
+    for stat, type_name, documentation in (
+            ("hits", "counter", "Cautari gasite in cache"),
+            ("misses", "counter", "Cautari negasite in cache"),
+            ("size", "gauge", "Intrari in cache")):
+        yield (f"evaluator_cache_{stat}" + ("_total" if type_name == "counter" else ""), type_name, documentation,
+               [({"cache": name}, values[stat]) for name, values in sorted(caches.items())])
+    if ANSWER_INDEX_ENABLED:
+        index = _answer_index.stats()
+        yield ("answer_index_hits_total", "counter", "Evaluari refolosite de la un raspuns apropiat",
+               [({}, index["hits"])])
+        yield ("answer_index_misses_total", "counter", "Cautari in index fara raspuns destul de apropiat",
+               [({}, index["misses"])])
+        yield ("answer_index_vectors", "gauge", "Raspunsuri pastrate in index", [({}, index["vectors"])])
+
+
+def embedding_to_blob(embedding) -> bytes:
+    """Serializeaza un embedding compact (float16) pentru stocare in baza de date"""
+    return np.asarray(embedding, dtype=np.float16).tobytes()
+
+
+def blob_to_embedding(blob: bytes) -> np.ndarray:
+    """Inversul lui embedding_to_blob"""
+    return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+
+
+def blob_to_matrix(blob: bytes, rows: int, dim: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    Embedding-urile referintelor (rows x dim) stocate unul dupa altul; None daca blob-ul nu are
+    rows randuri (de ex. referintele intrebarii s-au schimbat dupa ce a fost calculat)
+    """
+    flat = blob_to_embedding(blob)
+    if rows < 1 or flat.size % rows or (dim is not None and flat.size != rows * dim):
+        return None
+    return flat.reshape(rows, -1)
+
+
+def _stored_references(blob: Optional[bytes], rows: int) -> Optional[np.ndarray]:
+    """
+    Matricea referintelor din blob, daca se potriveste cu referintele si cu modelul curent.
+    Pana la primul encode dimensiunea nu e cunoscuta, deci blob-ul nu e folosit (referintele
+    se codifica in acelasi lot cu raspunsul).
+    """
+    if blob is None or _embedding_dim is None:
+        return None
+    return blob_to_matrix(blob, rows, _embedding_dim)
+
+
+def stored_reference_embedding(question) -> Optional[bytes]:
+    """
+    Embedding-ul referintelor salvat pe intrebare, daca a fost calculat cu modelul curent
+    (SEMANTIC_MODEL_ID) si are cate un rand pentru fiecare referinta; nu codifica nimic
+    """
+    if question.reference_embedding is None or question.reference_embedding_model != SEMANTIC_MODEL_ID:
+        return None
+    rows = len(reference_texts(question.correct_answer or {}))
+    if blob_to_matrix(question.reference_embedding, rows, _embedding_dim) is None:
+        return None
+    return question.reference_embedding
+
+
+def set_reference_embedding(question, blob: bytes):
+    """Salveaza pe obiectul Question embedding-ul calculat in timpul evaluarii (commit-ul e al apelantului)"""
+    question.reference_embedding = blob
+    question.reference_embedding_model = SEMANTIC_MODEL_ID
+
+
+def ensure_reference_embedding(question) -> Optional[bytes]:
+    """
+    Returneaza embedding-ul textului de referinta al intrebarii (cu parafraze din
+    reference_texts: embedding-urile tuturor, unul dupa altul, in acelasi blob).
+    Daca lipseste (sau a fost calculat cu alt model/backend ori pentru alte referinte) il calculeaza o singura data,
+    incarcand modelul daca e nevoie, si il seteaza pe obiectul Question; salvarea ramane in grija apelantului (db.commit).
+    Pe un worker fara model (SEMANTIC_MODEL_ENABLED=0) returneaza None: embedding-ul se completeaza la prima evaluare.
+    """
+    stored = stored_reference_embedding(question)
+    if stored is not None:
+        return stored
+
+    references = reference_texts(question.correct_answer or {})
+    if not references or not uses_semantic_grading(question.question_type):
+        return None
+
+    if not SEMANTIC_MODEL_ENABLED:
+        return None
+
+    set_reference_embedding(question, embedding_to_blob(encode_texts(list(references))))
+    return question.reference_embedding
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def answer_windows(text: str) -> List[str]:
+    """
+    Ferestrele de cuvinte in care se codifica un raspuns: raspunsul intreg daca e scurt,
+    altfel ferestre suprapuse, cel mult SEMANTIC_MAX_WINDOWS, alese uniform de la inceput la sfarsit.
+    """
+    words = text.split()
+    size = SEMANTIC_WINDOW_WORDS
+    if size <= 0 or len(words) <= size:
+        return [text]
 
-def normalize_text(text: str) -> str:
-    """elimina diacritice, normalizeaza textul"""
-    text = ''.join(
-        c for c in unicodedata.normalize('NFD', text)
-        if unicodedata.category(c) != 'Mn'
-    )
-    return text.lower()
+    step = max(1, size - SEMANTIC_WINDOW_OVERLAP)
+    starts = list(range(0, len(words) - size + 1, step))
+    if starts[-1] + size < len(words):
+        starts.append(len(words) - size)
+    if len(starts) > SEMANTIC_MAX_WINDOWS > 0:
+        last = len(starts) - 1
+        starts = [starts[round(i * last / max(1, SEMANTIC_MAX_WINDOWS - 1))] for i in range(SEMANTIC_MAX_WINDOWS)]
+        starts = list(dict.fromkeys(starts))
+    return [" ".join(words[start:start + size]) for start in starts]
 
 
-def evaluate_answer(correct_answer_json: Dict[str, Any], user_answer: str, question_type: str) -> Dict[str, Any]:
+def semantic_vectors_batch(requests: Sequence[SemanticRequest]):
+    """
+    Embedding-urile (ferestrele raspunsului, referintele) pentru mai multe cereri, cu un singur apel encode.
+    In batch intra ferestrele tuturor raspunsurilor + referintele care nu au embedding precalculat,
+    deci cu embedding-urile de referinta stocate modelul codifica doar raspunsul utilizatorului.
+    """
+    texts = []
+    positions = {}
+
+    def slot(text: str) -> int:
+        if text not in positions:
+            positions[text] = len(texts)
+            texts.append(text)
+        return positions[text]
+
+    pairs = []
+    for req in requests:
+        user_slots = [slot(window) for window in answer_windows(req.user_answer)]
+        stored = _stored_references(req.reference_embedding, len(req.reference_texts))
+        ref_slots = [slot(text) for text in req.reference_texts] if stored is None else None
+        pairs.append((user_slots, stored, ref_slots))
+
+    vectors = encode_texts(texts)
+
+    return [
+        (vectors[user_slots], stored if stored is not None else vectors[ref_slots])
+        for user_slots, stored, ref_slots in pairs
+    ]
+
+
+def _pooled_similarity(windows: np.ndarray, references: np.ndarray) -> float:
+    """
+    Similaritatea raspunsului: pentru fiecare fereastra, maximul peste referinte;
+    apoi fereastra unica sau max/mean peste ferestre.
+    """
+    if len(references) == 1:
+        similarities = [_cosine(window, references[0]) for window in windows]
+    else:
+        # cosinusul fata de toate referintele dintr-un singur produs de matrice
+        scores = (windows @ references.T) / np.outer(np.linalg.norm(windows, axis=1), np.linalg.norm(references, axis=1))
+        similarities = scores.max(axis=1).tolist()
+    if len(similarities) == 1:
+        return similarities[0]
+    if SEMANTIC_WINDOW_POOLING == "mean":
+        return float(np.mean(similarities))
+    return max(similarities)
+
+
+def _answer_vector(windows: np.ndarray) -> np.ndarray:
+    """Un singur vector pentru raspuns (media normalizata a ferestrelor), pentru indexul de raspunsuri"""
+    if len(windows) == 1:
+        return windows[0]
+    mean = windows.mean(axis=0)
+    return mean / (np.linalg.norm(mean) or 1.0)
+
+
+def encode_answers(texts: Sequence[str]) -> np.ndarray:
+    """Vectorul fiecarui raspuns (ferestrele codificate intr-un singur apel encode), ca la evaluare"""
+    windows = [answer_windows(normalize_answer(text)) for text in texts]
+    vectors = encode_texts([window for answer in windows for window in answer])
+    bounds = np.cumsum([0] + [len(answer) for answer in windows])
+    return np.stack([_answer_vector(vectors[start:end]) for start, end in zip(bounds[:-1], bounds[1:])])
+
+
+def semantic_similarity_batch(requests: Sequence[SemanticRequest]) -> List[float]:
+    """Similaritatile cosinus pentru mai multe cereri cu un singur apel encode"""
+    return [_pooled_similarity(windows, references) for windows, references in semantic_vectors_batch(requests)]
+
+
+def evaluate_answer(correct_answer_json: Dict[str, Any], user_answer: str, question_type,
+                    reference_embedding: Optional[bytes] = None,
+                    question_id: Optional[int] = None,
+                    on_reference_embedding: Optional[Callable[[bytes], None]] = None) -> Dict[str, Any]:
     """
     Evalueaza rapsunsul in functie de tipul intrebarii
+    reference_embedding: embedding-urile precalculate ale referintelor (vezi stored_reference_embedding)
+    on_reference_embedding: primeste embedding-ul referintelor daca a fost calculat acum (pentru salvare)
+    question_type: QuestionTypeEnum sau numele lui
+    question_id: daca e dat, graderul compilat si rezultatul pentru (intrebare, raspuns normalizat)
+    sunt pastrate in cache
+    """
+    return evaluate_answers_batch(
+        [(correct_answer_json, user_answer, question_type, reference_embedding)],
+        question_ids=[question_id],
+        on_reference_embedding=(
+            (lambda _, blob: on_reference_embedding(blob)) if on_reference_embedding is not None else None
+        )
+    )[0]
+
+
+def evaluate_answers_batch(items: Sequence[tuple],
+                           question_ids: Optional[Sequence[Optional[int]]] = None,
+                           on_reference_embedding: Optional[Callable[[int, bytes], None]] = None,
+                           admission: bool = True) -> List[Dict[str, Any]]:
+    """
+    Evalueaza mai multe raspunsuri deodata.
+    items: tupluri (correct_answer_json, user_answer, question_type[, reference_embedding])
+    question_ids: id-urile intrebarilor (paralel cu items), pentru cache-urile de gradere si rezultate
+    on_reference_embedding(index, blob): apelat pentru elementele care au ajuns la pasul semantic
+        fara embedding de referinta utilizabil; referintele lor au fost codificate in acelasi lot
+    admission=False: pasul semantic nu trece prin admission control (job-urile de fundal, care
+        codifica o singura bucata odata, nu trebuie oprite de un 503 destinat cererilor HTTP)
+
+    Potrivirile structurale ruleaza imediat, iar toate raspunsurile care au nevoie
+    de scor semantic trec printr-un singur apel encode. Rezultatele sunt aceleasi
+    ca la apelarea evaluate_answer pentru fiecare element.
+    """
+    # raspunsurile sunt evaluate exact cum au fost trimise; forma normalizata e doar cheia din cache.
+    # Gradere precum alegerea multipla depind de spatiile din interior ("programare\ndinamica"),
+    # deci un raspuns care nu e deja in forma normalizata nu foloseste cache-ul de rezultate
+    keys = [
+        (question_ids[i], item[1])
+        if question_ids is not None and question_ids[i] is not None and item[1] == normalize_answer(item[1])
+        else None
+        for i, item in enumerate(items)
+    ]
+
+    results = []
+    durations = {}  # index -> secunde, doar pentru raspunsurile evaluate acum
+    to_cache = []
+    for item, key in zip(items, keys):
+        cached = _result_cache.get(key) if key is not None else MISSING
+        if cached is not MISSING:
+            results.append(copy.deepcopy(cached))
+            continue
+        question_id = key[0] if key is not None else None
+        start = time.perf_counter()
+        results.append(_evaluate(*item, question_id=question_id))
+        durations[len(results) - 1] = time.perf_counter() - start
+        if key is not None:
+            to_cache.append(len(results) - 1)
+
+    pending = [i for i, result in enumerate(results) if isinstance(result, SemanticRequest)]
+    if pending:
+        # doar pasul semantic trece prin admission control; potrivirile structurale nu asteapta
+        if admission and not _admission.acquire():
+            raise SemanticOverloaded()
+        start = time.perf_counter()
+        try:
+            vectors = semantic_vectors_batch([results[i] for i in pending])
+        finally:
+            if admission:
+                _admission.release()
+        for i, (windows, references) in zip(pending, vectors):
+            if on_reference_embedding is not None and not _has_stored_references(results[i]):
+                on_reference_embedding(i, embedding_to_blob(references))
+            results[i] = _finish_semantic(items[i][0], results[i], windows, references)
+        # encode-ul e comun: fiecare raspuns din lot a asteptat dupa tot lotul
+        batch_duration = time.perf_counter() - start
+        for i in pending:
+            durations[i] += batch_duration
+
+    for i, duration in durations.items():
+        details = results[i]["details"]
+        labels = (question_type_name(items[i][2]), details.get("match_type") or details.get("error", "unknown"))
+        GRADES_TOTAL.inc(*labels)
+        GRADE_DURATION.observe(duration, *labels)
+
+    for i in to_cache:
+        _result_cache.put(keys[i], copy.deepcopy(results[i]))
+    return results
+
+
+def _has_stored_references(request: SemanticRequest) -> bool:
+    return _stored_references(request.reference_embedding, len(request.reference_texts)) is not None
+
+
+def _finish_semantic(correct_answer_json: Dict[str, Any], request: SemanticRequest,
+                     windows: np.ndarray, references: np.ndarray) -> Dict[str, Any]:
+    """
+    Scorul semantic al unei cereri. Cu ANSWER_INDEX_ENABLED=1, un raspuns aproape identic
+    cu unul deja evaluat pentru acelasi raspuns corect primeste evaluarea acestuia.
+    """
+    if not ANSWER_INDEX_ENABLED:
+        return request.finish(_pooled_similarity(windows, references))
+
+    index_key = reference_key(correct_answer_json, SEMANTIC_MODEL_ID)
+    user_vec = _answer_vector(windows)
+    reused = _answer_index.lookup(index_key, user_vec)
+    if reused is not None:
+        neighbour_similarity, result = reused
+        result["details"]["index_similarity"] = round(neighbour_similarity, 4)
+        return result
+
+    result = request.finish(_pooled_similarity(windows, references))
+    _answer_index.add(index_key, user_vec, result)
+    return result
+
+
+def _evaluate(correct_answer_json: Dict[str, Any], user_answer: str, question_type,
+              reference_embedding: Optional[bytes] = None,
+              question_id: Optional[int] = None):
+    """
+    Evalueaza cu graderul tipului de intrebare. Returneaza rezultatul final sau
+    un SemanticRequest cand scorul depinde de modelul semantic.
     """
     # Verificare răspuns gol - scor 0
     if not user_answer or user_answer.strip() == "":
@@ -29,505 +575,6 @@ def evaluate_answer(correct_answer_json: Dict[str, Any], user_answer: str, quest
                 "message": "Răspuns lipsă sau gol"
             }
         }
-    
-    #normalizare
-    user_answer_norm = user_answer.lower().replace(" ", "").strip()
-
-    #intrebare de tip minmax
-    if question_type == "MINIMAX_TREE":
-        #valorile corecte
-        correct_root = correct_answer_json.get("root_value")
-        correct_leaves = correct_answer_json.get("visited_leaves")
-
-        if correct_root is None or correct_leaves is None:
-            if "reference_text" not in correct_answer_json:
-                return {
-                    "is_correct": False,
-                    "score": 0.0,
-                    "details": {"error": "missing_correct_answer_data"}
-                }
-
-            ref_text = correct_answer_json["reference_text"]
-            # Extragem cele doua nr corecte
-            nums = re.findall(r"\d+", ref_text)
-            if len(nums) >= 2:
-                correct_root = int(nums[0])
-                correct_leaves = int(nums[1])
-            else:
-                return {
-                    "is_correct": False,
-                    "score": 0.0,
-                    "details": {"error": "invalid_reference_format"}
-                }
-
-        # Extragem nr din raspunsul studentului
-        user_nums = re.findall(r"\d+", user_answer)
-        #versiune normalizata a raspunsului
-        user_answer_lower = user_answer.lower()
-        user_answer_normalized = normalize_text(user_answer)
-        
-        # Cuvinte cheie
-        root_keywords = [
-            "radacina", "root",
-            "valoare", "maxim", "minim", "max", "min",
-            "rezultat", "scor"
-        ]
-        leaves_keywords = [
-            "frunza","frunze", "leaf", "leaves",
-            "noduri", "nod final", "terminal", "vizitate"
-        ]
-
-        #daca utilizatorul nu a scirs niciun numar -> raspuns imposibil de evaluat
-        if len(user_nums) == 0:
-            return {
-                "is_correct": False,
-                "score": 0.0,
-                "details": {
-                    "match_type": "minimax_no_numbers",
-                    "expected": {"root": correct_root, "leaves": correct_leaves},
-                    "got": None
-                }
-            }
-        
-        #impart textul în propoziții
-        sentences = re.split(r'[.!?;]', user_answer_lower)
-        sentences_normalized = [normalize_text(s) for s in sentences]
-        
-        def find_number_with_context(num_str: str) -> Tuple[Optional[str], str]:
-            """
-            Găsește contextul unei cifre în text NORMALIZAT.
-            Returnează (tip_identificat, propoziția_completă)
-            """
-            for i, sentence_norm in enumerate(sentences_normalized):
-                if num_str in sentence_norm:
-                    #verific propozitia conține cuvinte cheie
-                    has_root = any(kw in sentence_norm for kw in root_keywords)
-                    has_leaves = any(kw in sentence_norm for kw in leaves_keywords)
-                    
-                    if has_root and not has_leaves:
-                        return ("root", sentences[i].strip())
-                    elif has_leaves and not has_root:
-                        return ("leaves", sentences[i].strip())
-                    else:
-                        return (None, sentences[i].strip())
-            return (None, "")
-        
-        #construiesc maparea numar -> context
-        number_contexts = {}
-        for num_str in user_nums:
-            context_type, sentence = find_number_with_context(num_str)
-            number_contexts[int(num_str)] = {
-                "type": context_type,
-                "sentence": sentence
-            }
-        
-        # Cazul cu 1 numar
-        if len(user_nums) == 1:
-            user_val = int(user_nums[0])
-            ctx = number_contexts[user_val]
-
-            #nr reprezina radacina si e corect-> 50%
-            if ctx["type"] == "root" and user_val == correct_root:
-                return {
-                    "is_correct": False,
-                    "score": 50.0,
-                    "details": {
-                        "match_type": "minimax_partial_root_only",
-                        "expected": {"root": correct_root, "leaves": correct_leaves},
-                        "got": {"root": user_val, "leaves": None}
-                    }
-                }
-            #nr reprezinta frunza si e corect -> 50%
-            elif ctx["type"] == "leaves" and user_val == correct_leaves:
-                return {
-                    "is_correct": False,
-                    "score": 50.0,
-                    "details": {
-                        "match_type": "minimax_partial_leaves_only",
-                        "expected": {"root": correct_root, "leaves": correct_leaves},
-                        "got": {"root": None, "leaves": user_val}
-                    }
-                }
-            #nr corect dar context ambiguu -> 40%
-            elif user_val in [correct_root, correct_leaves]:
-                return {
-                    "is_correct": False,
-                    "score": 40.0,
-                    "details": {
-                        "match_type": "minimax_partial_ambiguous",
-                        "expected": {"root": correct_root, "leaves": correct_leaves},
-                        "got": user_val,
-                        "message": "Un număr corect, dar nu este clar dacă este rădăcina sau frunzele"
-                    }
-                }
-            #nr gresit -> 0%
-            else:
-                return {
-                    "is_correct": False,
-                    "score": 0.0,
-                    "details": {
-                        "match_type": "minimax_partial_incorrect",
-                        "expected": {"root": correct_root, "leaves": correct_leaves},
-                        "got": user_val
-                    }
-                }
-        
-        # Cazul cu 2 numere
-        elif len(user_nums) == 2:
-            u1 = int(user_nums[0])
-            u2 = int(user_nums[1])
-
-            #contextele fiecarui numar
-            ctx1 = number_contexts.get(u1, {})
-            ctx2 = number_contexts.get(u2, {})
-            
-            type1 = ctx1.get("type")
-            type2 = ctx2.get("type")
-            
-            #identific ce număr corespunde la ce
-            identified_root = None
-            identified_leaves = None
-            
-            if type1 == "root":
-                identified_root = u1
-            if type1 == "leaves":
-                identified_leaves = u1
-            if type2 == "root":
-                identified_root = u2
-            if type2 == "leaves":
-                identified_leaves = u2
-            
-            # CAZUL 1: Ambele identificate clar
-            if identified_root is not None and identified_leaves is not None:
-                #corect 100%
-                if identified_root == correct_root and identified_leaves == correct_leaves:
-                    return {
-                        "is_correct": True,
-                        "score": 100.0,
-                        "details": {
-                            "match_type": "minimax_explicit_correct",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": identified_root, "leaves": identified_leaves}
-                        }
-                    }
-                #nr identificate corect dar inversate 70%
-                elif identified_root == correct_leaves and identified_leaves == correct_root:
-                    return {
-                        "is_correct": False,
-                        "score": 70.0,
-                        "details": {
-                            "match_type": "minimax_inverted",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": identified_root, "leaves": identified_leaves},
-                            "message": "Numerele sunt corecte, dar rădăcina și frunzele sunt inversate"
-                        }
-                    }
-                #complet gresit
-                else:
-                    return {
-                        "is_correct": False,
-                        "score": 0.0,
-                        "details": {
-                            "match_type": "minimax_incorrect",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": identified_root, "leaves": identified_leaves}
-                        }
-                    }
-            
-            # CAZUL 2: Doar unul identificat
-            elif identified_root is not None and identified_leaves is None:
-                if identified_root == correct_root:
-                    other_num = u2 if identified_root == u1 else u1
-                    if other_num == correct_leaves:
-                        return {
-                            "is_correct": True,
-                            "score": 85.0,
-                            "details": {
-                                "match_type": "minimax_one_labeled_correct",
-                                "expected": {"root": correct_root, "leaves": correct_leaves},
-                                "got": {"root": identified_root, "leaves": other_num},
-                                "message": "Rădăcina este etichetată corect, celălalt număr este corect dar neetichetat"
-                            }
-                        }
-                    #doar root e corect -> 50%
-                    else:
-                        return {
-                            "is_correct": False,
-                            "score": 50.0,
-                            "details": {
-                                "match_type": "minimax_partial_root_identified",
-                                "expected": {"root": correct_root, "leaves": correct_leaves},
-                                "got": {"root": identified_root, "leaves": None}
-                            }
-                        }
-                    #radacina identificata gresit
-                else:
-                    return {
-                        "is_correct": False,
-                        "score": 0.0,
-                        "details": {
-                            "match_type": "minimax_partial_root_incorrect",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": identified_root, "leaves": None}
-                        }
-                    }
-            #doar frunzele sunt identificate
-            elif identified_leaves is not None and identified_root is None:
-                if identified_leaves == correct_leaves:
-                    other_num = u2 if identified_leaves == u1 else u1
-                    if other_num == correct_root:
-                        return {
-                            "is_correct": True,
-                            "score": 85.0,
-                            "details": {
-                                "match_type": "minimax_one_labeled_correct",
-                                "expected": {"root": correct_root, "leaves": correct_leaves},
-                                "got": {"root": other_num, "leaves": identified_leaves},
-                                "message": "Frunzele sunt etichetate corect, celălalt număr este corect dar neetichetat"
-                            }
-                        }
-                    else:
-                        return {
-                            "is_correct": False,
-                            "score": 50.0,
-                            "details": {
-                                "match_type": "minimax_partial_leaves_identified",
-                                "expected": {"root": correct_root, "leaves": correct_leaves},
-                                "got": {"root": None, "leaves": identified_leaves}
-                            }
-                        }
-                else:
-                    return {
-                        "is_correct": False,
-                        "score": 0.0,
-                        "details": {
-                            "match_type": "minimax_partial_leaves_incorrect",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": None, "leaves": identified_leaves}
-                        }
-                    }
-            
-            # CAZUL 3: Niciunul identificat
-            else:
-                #daca utilizatorul scrie fix cele 2 numere ->75%
-                if {u1, u2} == {correct_root, correct_leaves}:
-                    return {
-                        "is_correct": True,
-                        "score": 75.0,
-                        "details": {
-                            "match_type": "minimax_correct_unlabeled",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": (u1, u2),
-                            "message": "Numerele sunt corecte, dar nu sunt etichetate clar"
-                        }
-                    }
-                #altfel 0%
-                else:
-                    return {
-                        "is_correct": False,
-                        "score": 0.0,
-                        "details": {
-                            "match_type": "minimax_incorrect_unlabeled",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": (u1, u2)
-                        }
-                    }
-        
-        # Cazul cu 3+ numere
-        else:
-            potential_root = None
-            potential_leaves = None
-
-            #cautam daca macar un numar apare in context corect
-            for num_str in user_nums:
-                num = int(num_str)
-                ctx = number_contexts.get(num, {})
-                
-                if ctx.get("type") == "root" and num in [correct_root, correct_leaves]:
-                    potential_root = num
-                elif ctx.get("type") == "leaves" and num in [correct_root, correct_leaves]:
-                    potential_leaves = num
-
-            #daca ambele sunt identificate corect
-            if potential_root is not None and potential_leaves is not None:
-                if potential_root == correct_root and potential_leaves == correct_leaves:
-                    return {
-                        "is_correct": True,
-                        "score": 90.0,
-                        "details": {
-                            "match_type": "minimax_correct_with_extra_numbers",
-                            "expected": {"root": correct_root, "leaves": correct_leaves},
-                            "got": {"root": potential_root, "leaves": potential_leaves},
-                            "message": "Răspunsul corect identificat, dar există numere suplimentare în text"
-                        }
-                    }
-            
-            return {
-                "is_correct": False,
-                "score": 0.0,
-                "details": {
-                    "match_type": "minimax_too_many_numbers",
-                    "expected": {"root": correct_root, "leaves": correct_leaves},
-                    "got": [int(n) for n in user_nums]
-                }
-            }
-
-    if question_type == "CSP_PROBLEM":
-        correct_raw = correct_answer_json.get("answer", "").lower().replace(" ", "")
-        
-        # Extrage valorile din răspunsul corect (elimină acolade și spații)
-        correct_clean = correct_raw.replace("{", "").replace("}", "").replace(" ", "")
-        
-        # Normalizează răspunsul utilizatorului (elimină acolade și spații)
-        user_clean = user_answer_norm.replace("{", "").replace("}", "")
-        
-        # Verifică dacă răspunsul utilizatorului conține exact aceleași valori
-        # Acceptă atât "{1,3}" cât și "1,3" sau "1, 3"
-        if correct_clean and (correct_clean in user_clean or correct_raw in user_answer_norm):
-            return {
-                "is_correct": True,
-                "score": 100.0,
-                "details": {"match_type": "csp_flexible", "expected": correct_raw, "user_provided": user_clean}
-            }
-        
-        # Verificare inversă pentru ordine diferită (ex: "3,1" vs "1,3")
-        if correct_clean and len(correct_clean) > 0:
-            correct_values = sorted(correct_clean.split(","))
-            user_values = sorted([v.strip() for v in user_clean.split(",") if v.strip()])
-            
-            if correct_values == user_values:
-                return {
-                    "is_correct": True,
-                    "score": 100.0,
-                    "details": {"match_type": "csp_unordered", "expected": correct_raw, "user_provided": user_clean}
-                }
-        
-        return {
-            "is_correct": False,
-            "score": 0.0,
-            "details": {"match_type": "csp_mismatch", "expected": correct_raw, "user_provided": user_clean}
-        }
-
-    if question_type == "GAME_MATRIX":
-        has_nash = correct_answer_json.get("has_nash", True)
-        correct_text = correct_answer_json.get("answer", "") or correct_answer_json.get("answer_text", "")
-        correct_text_norm = normalize_text(correct_text).replace(" ", "")
-        reference_text = correct_answer_json.get("reference_text", "")
-        
-        no_nash_keywords = ["nuexista", "nuare", "noexiste", "fara", "nimic"]
-        user_says_no_nash = any(kw in user_answer_norm for kw in no_nash_keywords)
-        
-        if not has_nash and user_says_no_nash:
-            return {
-                "is_correct": True,
-                "score": 100.0,
-                "details": {"match_type": "nash_no_equilibrium_correct"}
-            }
-        
-        if has_nash and user_says_no_nash:
-            return {
-                "is_correct": False,
-                "score": 0.0,
-                "details": {"match_type": "nash_wrong_no_equilibrium", "expected": correct_text}
-            }
-        
-        if not has_nash and not user_says_no_nash:
-            return {
-                "is_correct": False,
-                "score": 0.0,
-                "details": {"match_type": "nash_wrong_cell_given", "expected": "Nu există echilibru Nash pur"}
-            }
-        
-        # Verificare exacta pentru raspunsuri scurte
-        if correct_text_norm and correct_text_norm in user_answer_norm:
-            return {
-                "is_correct": True,
-                "score": 100.0,
-                "details": {"match_type": "nash_exact_match", "expected": correct_text}
-            }
-        
-        # Verificare prin strategii mentionate
-        nash_equilibria = correct_answer_json.get("nash_equilibria", [])
-        row_names = ["sus", "mijloc", "jos"]
-        col_names = ["stanga", "centru", "dreapta"]
-        
-        matched_equilibria = 0
-        for eq in nash_equilibria:
-            if eq[0] < len(row_names) and eq[1] < len(col_names):
-                row_name = row_names[eq[0]]
-                col_name = col_names[eq[1]]
-                if row_name in user_answer_norm and col_name in user_answer_norm:
-                    matched_equilibria += 1
-        
-        if matched_equilibria > 0:
-            score = min(100.0, (matched_equilibria / len(nash_equilibria)) * 100) if nash_equilibria else 100.0
-            return {
-                "is_correct": score >= 50,
-                "score": score,
-                "details": {"match_type": "nash_strategy_match", "matched": matched_equilibria, "total": len(nash_equilibria)}
-            }
-        
-        # Fallback: evaluare semantica pentru raspunsuri explicative
-        if reference_text:
-            embeddings = semantic_model.encode([user_answer, reference_text], convert_to_tensor=True)
-            similarity = util.cos_sim(embeddings[0], embeddings[1]).item()
-            final_score = max(0, min(100, similarity * 100))
-            
-            return {
-                "is_correct": final_score >= 60,
-                "score": round(final_score, 2),
-                "details": {"match_type": "nash_semantic", "similarity": round(similarity, 4)}
-            }
-        
-        return {
-            "is_correct": False,
-            "score": 0.0,
-            "details": {"match_type": "nash_no_match", "expected": correct_text}
-        }
-
-    if "answer" in correct_answer_json and "reference_text" not in correct_answer_json:
-        correct_answer_text = correct_answer_json["answer"].lower().strip()
-        is_correct = user_answer_norm == correct_answer_text.replace(" ", "")
-        return {
-            "is_correct": is_correct,
-            "score": 100.0 if is_correct else 0.0,
-            "details": {"match_type": "exact_multiple_choice"}
-        }
-
-
-    # Evaluare hibrida: Sentence Transformers + Keywords
-    if "reference_text" in correct_answer_json:
-        reference_text = correct_answer_json["reference_text"]
-        
-        # 1. Similaritate semantica (60%)
-        embeddings = semantic_model.encode([user_answer, reference_text], convert_to_tensor=True)
-        similarity = util.cos_sim(embeddings[0], embeddings[1]).item()
-        semantic_score = similarity
-        
-        # 2. Keyword matching (40%)
-        keyword_score = 0.0
-        keywords = correct_answer_json.get("keywords", [])
-        if keywords:
-            user_answer_normalized = normalize_text(user_answer)
-            matched = sum(1 for kw in keywords if normalize_text(kw) in user_answer_normalized)
-            keyword_score = matched / len(keywords)
-        
-        # Combina scorurile
-        if keywords:
-            combined = (semantic_score * 0.6) + (keyword_score * 0.4)
-        else:
-            combined = semantic_score
-        
-        final_score = max(0, min(100, combined * 100))
-        
-        return {
-            "is_correct": final_score >= 60,
-            "score": round(final_score, 2),
-            "details": {
-                "match_type": "hybrid_evaluation",
-                "semantic_score": round(semantic_score, 4),
-                "keyword_score": round(keyword_score, 4) if keywords else None
-            }
-        }
 
-    return {"is_correct": False, "score": 0.0, "details": {"error": "invalid_format"}}
+    grader = get_grader(correct_answer_json, question_type, question_id)
+    return grader.grade(user_answer, reference_embedding)
@@ -36,25 +36,41 @@ TEXT_KNOWLEDGE = [
         "strategy_name": "A* Search",
         "chapter_name": "Algoritmi de cautare si CSP",
         "keywords": ["euristica", "cost", "optim", "cale", "g(n)", "h(n)", "f(n)"],
-        "description": "Algoritmul A* este un algoritm de cautare informata care utilizeaza o functie de evaluare f(n) = g(n) + h(n), unde g(n) este costul de la start la nodul curent si h(n) este euristica (estimarea costului pana la destinatie)."
+        "description": "Algoritmul A* este un algoritm de cautare informata care utilizeaza o functie de evaluare f(n) = g(n) + h(n), unde g(n) este costul de la start la nodul curent si h(n) este euristica (estimarea costului pana la destinatie).",
+        "paraphrases": [
+            "A* extinde mereu nodul cu f(n) minim, adunand costul drumului parcurs g(n) cu estimarea euristica h(n) a costului ramas pana la tinta.",
+            "Cautarea A* combina costul real de la nodul de start cu o euristica ce estimeaza distanta pana la scop; cu o euristica admisibila gaseste calea optima."
+        ]
     },
     {
         "strategy_name": "Backtracking",
         "chapter_name": "Algoritmi de cautare si CSP",
         "keywords": ["recursiv", "solutie", "stare", "valid", "cautare", "adancime", "backtrack"],
-        "description": "Backtracking este o tehnica de rezolvare sistematica care exploreaza recursiv spatiul solutiilor, revenind (backtracking) cand intalneste o stare invalida."
+        "description": "Backtracking este o tehnica de rezolvare sistematica care exploreaza recursiv spatiul solutiilor, revenind (backtracking) cand intalneste o stare invalida.",
+        "paraphrases": [
+            "Backtracking construieste solutia pas cu pas, recursiv, si se intoarce la alegerea anterioara de indata ce solutia partiala nu mai poate fi completata valid.",
+            "Se incearca pe rand valorile posibile pentru fiecare pas; cand o alegere duce intr-o stare invalida se renunta la ea si se incearca urmatoarea."
+        ]
     },
     {
         "strategy_name": "CSP (Constraint Satisfaction)",
         "chapter_name": "Algoritmi de cautare si CSP",
         "keywords": ["variabile", "domenii", "constrangeri", "atribuire", "consistent"],
-        "description": "CSP se ocupa cu probleme definite prin variabile, domenii de valori si constrangeri intre variabile, cautand atribuiri consistente."
+        "description": "CSP se ocupa cu probleme definite prin variabile, domenii de valori si constrangeri intre variabile, cautand atribuiri consistente.",
+        "paraphrases": [
+            "O problema de satisfacere a constrangerilor are un set de variabile, fiecare cu domeniul ei, si cauta o atribuire a tuturor variabilelor care respecta toate constrangerile.",
+            "In CSP fiecarei variabile i se alege o valoare din domeniu astfel incat nicio constrangere dintre variabile sa nu fie incalcata."
+        ]
     },
     {
         "strategy_name": "Programare Dinamica",
         "chapter_name": "Strategii algoritmice",
         "keywords": ["subprobleme", "optim", "suprapunere", "memoizare", "tabel"],
-        "description": "Programarea dinamica rezolva probleme prin descompunere in subprobleme suprapuse, memorand solutiile pentru a evita recalcularea."
+        "description": "Programarea dinamica rezolva probleme prin descompunere in subprobleme suprapuse, memorand solutiile pentru a evita recalcularea.",
+        "paraphrases": [
+            "Programarea dinamica imparte problema in subprobleme care se repeta si salveaza rezultatul fiecareia intr-un tabel, ca sa fie calculata o singura data.",
+            "Solutia optima se construieste din solutiile optime ale subproblemelor, retinute prin memoizare sau completate de jos in sus intr-un tabel."
+        ]
     }
 ]
 
@@ -310,6 +326,7 @@ def genereaza_intrebare_strategie(answer_type="multiple", chapter_filter=None, d
         strategy_name = strategy_data["strategy_name"]
         keywords = strategy_data["keywords"]
         description = strategy_data["description"]
+        paraphrases = strategy_data.get("paraphrases", [])
         chapter_name = strategy_data["chapter_name"]
 
         prompt_text = (
@@ -326,7 +343,7 @@ def genereaza_intrebare_strategie(answer_type="multiple", chapter_filter=None, d
             "question_type": "A_STAR_DESCRIPTION",
             "difficulty": difficulty,
             "problem_instance": {"strategy": strategy_name},
-            "correct_answer": {"keywords": keywords, "reference_text": description},
+            "correct_answer": {"keywords": keywords, "reference_text": description, "reference_texts": paraphrases},
             "reference_solution": description,
             "chapter_name": chapter_name,
             "answer_type": "text"
@@ -0,0 +1,706 @@
+"""
+Evaluatoare pe tipuri de intrebari.
+
+Fiecare tip din QuestionTypeEnum are (in EVALUATORS sau implicit) o clasa cu compile(correct_answer_json),
+care pregateste o singura data tot ce nu depinde de raspuns (valori asteptate normalizate,
+cuvinte cheie compilate) intr-un grader imuabil. grader.grade(user_answer) face doar
+munca ce tine de raspunsul trimis. Graderele compilate sunt pastrate in cache dupa id-ul intrebarii.
+
+Pentru MINIMAX_TREE, CSP_PROBLEM si GAME_MATRIX generatoarele salveaza si o cheie canonica
+in correct_answer["key"]: [radacina, frunze], multimea valorilor ramase, respectiv celulele
+(linie, coloana) ale echilibrelor. Cu cheia, evaluarea compara direct raspunsul parsat cu ea;
+intrebarile mai vechi (fara cheie) sunt evaluate ca inainte, pe textul afisat.
+"""
+import os
+import re
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..utils.text import normalize_text
+from .keyword_matcher import KeywordMatcher, compile_keywords
+from .lru_cache import TTLCache, MISSING
+
+# Cache pentru graderele compilate, dupa id-ul intrebarii (0 = dezactivat)
+GRADER_CACHE_SIZE = int(os.getenv("GRADER_CACHE_SIZE", "4096"))
+GRADER_CACHE_TTL = float(os.getenv("GRADER_CACHE_TTL", "3600"))
+
+_grader_cache = TTLCache(GRADER_CACHE_SIZE, GRADER_CACHE_TTL)
+
+
+class SemanticRequest(NamedTuple):
+    """
+    Evaluare care mai are nevoie doar de similaritatea semantica.
+    finish(similarity) construieste rezultatul final.
+    """
+    user_answer: str
+    reference_texts: Tuple[str, ...]  # referinta principala + parafraze; scorul e maximul similaritatilor
+    reference_embedding: Optional[bytes]
+    finish: Callable[[float], Dict[str, Any]]
+
+
+def reference_texts(correct_answer_json: Dict[str, Any]) -> Tuple[str, ...]:
+    """reference_text urmat de parafrazele din reference_texts (fara duplicate sau texte goale)"""
+    texts = [correct_answer_json.get("reference_text")] + list(correct_answer_json.get("reference_texts") or [])
+    return tuple(dict.fromkeys(text for text in texts if text))
+
+
+def _compact(text: str) -> str:
+    """Litere mici, fara spatii (forma in care se compara raspunsurile scurte)"""
+    return text.lower().replace(" ", "").strip()
+
+
+# Cuvinte cheie pentru etichetarea numerelor din raspunsurile MINIMAX_TREE
+MINIMAX_ROOT_KEYWORDS = (
+    "radacina", "root",
+    "valoare", "maxim", "minim", "max", "min",
+    "rezultat", "scor"
+)
+MINIMAX_LEAVES_KEYWORDS = (
+    "frunza", "frunze", "leaf", "leaves",
+    "noduri", "nod final", "terminal", "vizitate"
+)
+_MINIMAX_ROOT_MATCHER = compile_keywords(MINIMAX_ROOT_KEYWORDS)
+_MINIMAX_LEAVES_MATCHER = compile_keywords(MINIMAX_LEAVES_KEYWORDS)
+
+# Un numar sau un separator de propozitie
+_MINIMAX_TOKEN_RE = re.compile(r"(\d+)|[.!?;]")
+
+
+class MinimaxNumber(NamedTuple):
+    """Un numar din raspuns, pozitia lui si eticheta propozitiei ("root", "leaves" sau None)"""
+    value: int
+    position: int
+    label: Optional[str]
+
+
+def _sentence_label(sentence: str) -> Optional[str]:
+    sentence_norm = normalize_text(sentence)
+    has_root = bool(_MINIMAX_ROOT_MATCHER.find(sentence_norm))
+    has_leaves = bool(_MINIMAX_LEAVES_MATCHER.find(sentence_norm))
+    if has_root and not has_leaves:
+        return "root"
+    if has_leaves and not has_root:
+        return "leaves"
+    return None
+
+
+def extract_minimax_numbers(text: str) -> List[MinimaxNumber]:
+    """
+    Parcurge raspunsul o singura data: numerele sunt etichetate dupa cuvintele cheie
+    din propozitia in care apar (nu dupa prima propozitie care le contine ca subsir,
+    deci "1" nu mai preia eticheta propozitiei cu "12").
+    """
+    text = text.lower()
+    numbers = []
+    pending = []  # numerele propozitiei curente
+    start = 0
+
+    def close_sentence(end: int):
+        if pending:
+            label = _sentence_label(text[start:end])
+            numbers.extend(MinimaxNumber(value, pos, label) for value, pos in pending)
+            pending.clear()
+
+    for m in _MINIMAX_TOKEN_RE.finditer(text):
+        if m.group(1) is not None:
+            pending.append((int(m.group(1)), m.start()))
+        else:
+            close_sentence(m.start())
+            start = m.end()
+    close_sentence(len(text))
+    return numbers
+
+
+# rezultat -> (match_type, is_correct, score, message)
+_MINIMAX_OUTCOMES = {
+    "no_numbers": ("minimax_no_numbers", False, 0.0, None),
+    # un singur numar
+    "root_only": ("minimax_partial_root_only", False, 50.0, None),
+    "leaves_only": ("minimax_partial_leaves_only", False, 50.0, None),
+    "ambiguous": ("minimax_partial_ambiguous", False, 40.0,
+                  "Un număr corect, dar nu este clar dacă este rădăcina sau frunzele"),
+    "single_incorrect": ("minimax_partial_incorrect", False, 0.0, None),
+    # doua numere, ambele etichetate
+    "explicit_correct": ("minimax_explicit_correct", True, 100.0, None),
+    "inverted": ("minimax_inverted", False, 70.0,
+                 "Numerele sunt corecte, dar rădăcina și frunzele sunt inversate"),
+    "incorrect": ("minimax_incorrect", False, 0.0, None),
+    # doua numere, unul etichetat
+    "root_labeled_other_correct": ("minimax_one_labeled_correct", True, 85.0,
+                                   "Rădăcina este etichetată corect, celălalt număr este corect dar neetichetat"),
+    "leaves_labeled_other_correct": ("minimax_one_labeled_correct", True, 85.0,
+                                     "Frunzele sunt etichetate corect, celălalt număr este corect dar neetichetat"),
+    "root_identified": ("minimax_partial_root_identified", False, 50.0, None),
+    "leaves_identified": ("minimax_partial_leaves_identified", False, 50.0, None),
+    "root_incorrect": ("minimax_partial_root_incorrect", False, 0.0, None),
+    "leaves_incorrect": ("minimax_partial_leaves_incorrect", False, 0.0, None),
+    # doua numere, neetichetate
+    "correct_unlabeled": ("minimax_correct_unlabeled", True, 75.0,
+                          "Numerele sunt corecte, dar nu sunt etichetate clar"),
+    "incorrect_unlabeled": ("minimax_incorrect_unlabeled", False, 0.0, None),
+    # 3+ numere
+    "correct_with_extra_numbers": ("minimax_correct_with_extra_numbers", True, 90.0,
+                                   "Răspunsul corect identificat, dar există numere suplimentare în text"),
+    "too_many_numbers": ("minimax_too_many_numbers", False, 0.0, None),
+}
+
+# doua numere cu o singura eticheta: (eticheta, numarul etichetat e corect, celalalt e corect) -> rezultat
+_MINIMAX_ONE_LABEL = {
+    ("root", True, True): "root_labeled_other_correct",
+    ("root", True, False): "root_identified",
+    ("root", False, True): "root_incorrect",
+    ("root", False, False): "root_incorrect",
+    ("leaves", True, True): "leaves_labeled_other_correct",
+    ("leaves", True, False): "leaves_identified",
+    ("leaves", False, True): "leaves_incorrect",
+    ("leaves", False, False): "leaves_incorrect",
+}
+
+
+def _classify_minimax(tokens: Sequence[MinimaxNumber], correct_root: int, correct_leaves: int) -> Tuple[str, Any]:
+    """Alege randul din _MINIMAX_OUTCOMES si valoarea raportata la "got" """
+    expected = {"root": correct_root, "leaves": correct_leaves}
+
+    if not tokens:
+        return "no_numbers", None
+
+    if len(tokens) == 1:
+        value, _, label = tokens[0]
+        if label is not None and value == expected[label]:
+            got = {"root": None, "leaves": None}
+            got[label] = value
+            return label + "_only", got
+        if value in (correct_root, correct_leaves):
+            return "ambiguous", value
+        return "single_incorrect", value
+
+    if len(tokens) == 2:
+        identified = {"root": None, "leaves": None}
+        for value, _, label in tokens:
+            if label is not None:
+                identified[label] = value
+        values = tuple(token.value for token in tokens)
+
+        if identified["root"] is not None and identified["leaves"] is not None:
+            if identified == expected:
+                return "explicit_correct", identified
+            if (identified["root"], identified["leaves"]) == (correct_leaves, correct_root):
+                return "inverted", identified
+            return "incorrect", identified
+
+        if identified["root"] is None and identified["leaves"] is None:
+            if set(values) == {correct_root, correct_leaves}:
+                return "correct_unlabeled", values
+            return "incorrect_unlabeled", values
+
+        label = "root" if identified["root"] is not None else "leaves"
+        other_label = "leaves" if label == "root" else "root"
+        labeled = identified[label]
+        other = values[1] if labeled == values[0] else values[0]
+        outcome = _MINIMAX_ONE_LABEL[(label, labeled == expected[label], other == expected[other_label])]
+        if outcome.endswith("_other_correct"):
+            identified[other_label] = other
+        return outcome, identified
+
+    # 3+ numere: conteaza doar daca ambele valori corecte apar etichetate corect
+    potential = {"root": None, "leaves": None}
+    for value, _, label in tokens:
+        if label is not None and value in (correct_root, correct_leaves):
+            potential[label] = value
+    if potential == expected:
+        return "correct_with_extra_numbers", potential
+    return "too_many_numbers", [token.value for token in tokens]
+
+
+def _minimax_result(outcome: str, correct_root: int, correct_leaves: int, got: Any) -> Dict[str, Any]:
+    match_type, is_correct, score, message = _MINIMAX_OUTCOMES[outcome]
+    details = {
+        "match_type": match_type,
+        "expected": {"root": correct_root, "leaves": correct_leaves},
+        "got": got
+    }
+    if message:
+        details["message"] = message
+    return {"is_correct": is_correct, "score": score, "details": details}
+
+
+class ErrorGrader(NamedTuple):
+    """Raspunsul corect al intrebarii nu poate fi folosit; orice raspuns primeste 0"""
+    details: Dict[str, Any]
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        return {"is_correct": False, "score": 0.0, "details": dict(self.details)}
+
+
+class MinimaxGrader(NamedTuple):
+    correct_root: int
+    correct_leaves: int
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        # Extragem numerele si eticheta propozitiei in care apare fiecare, intr-o singura trecere
+        tokens = extract_minimax_numbers(user_answer)
+        outcome, got = _classify_minimax(tokens, self.correct_root, self.correct_leaves)
+        return _minimax_result(outcome, self.correct_root, self.correct_leaves, got)
+
+
+class CspGrader(NamedTuple):
+    correct_raw: str
+    correct_clean: str
+    correct_values: Optional[Tuple[str, ...]]
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        user_answer_norm = _compact(user_answer)
+        # Normalizează răspunsul utilizatorului (elimină acolade și spații)
+        user_clean = user_answer_norm.replace("{", "").replace("}", "")
+
+        # Verifică dacă răspunsul utilizatorului conține exact aceleași valori
+        # Acceptă atât "{1,3}" cât și "1,3" sau "1, 3"
+        if self.correct_clean and (self.correct_clean in user_clean or self.correct_raw in user_answer_norm):
+            return {
+                "is_correct": True,
+                "score": 100.0,
+                "details": {"match_type": "csp_flexible", "expected": self.correct_raw, "user_provided": user_clean}
+            }
+
+        # Verificare inversă pentru ordine diferită (ex: "3,1" vs "1,3")
+        if self.correct_values is not None:
+            user_values = tuple(sorted(v.strip() for v in user_clean.split(",") if v.strip()))
+            if user_values == self.correct_values:
+                return {
+                    "is_correct": True,
+                    "score": 100.0,
+                    "details": {"match_type": "csp_unordered", "expected": self.correct_raw, "user_provided": user_clean}
+                }
+
+        return {
+            "is_correct": False,
+            "score": 0.0,
+            "details": {"match_type": "csp_mismatch", "expected": self.correct_raw, "user_provided": user_clean}
+        }
+
+
+# Raspunsuri CSP care inseamna multimea vida (forma compacta, normalizata)
+EMPTY_SET_ANSWERS = ("multimeavida", "vida", "∅")
+_SET_GROUP_RE = re.compile(r"\{([^{}]*)\}")
+_VALUE_SPLIT_RE = re.compile(r"[,;]")
+_WORD_RE = re.compile(r"\w+")
+
+
+def csp_token(value: Any) -> str:
+    """
+    Forma in care se compara o valoare CSP, aceeasi pentru cheie si pentru raspuns:
+    fara diacritice, litere mici, fara spatii ("Verde  deschis" -> "verdedeschis")
+    """
+    return "".join(normalize_text(str(value)).split())
+
+
+def parse_value_set(text: str) -> FrozenSet[str]:
+    """
+    Multimea de valori dintr-un raspuns CSP: continutul acoladelor daca exista,
+    altfel tot raspunsul, impartit la virgule ("{1, 3}", "3,1", "{Verde deschis, Rosu}").
+    """
+    if csp_token(text) in EMPTY_SET_ANSWERS:
+        return frozenset()
+    groups = _SET_GROUP_RE.findall(text)
+    body = ",".join(groups) if groups else text
+    return frozenset(token for token in map(csp_token, _VALUE_SPLIT_RE.split(body)) if token)
+
+
+class CspKeyGrader(NamedTuple):
+    """
+    Raspunsul corect ca multime de valori (correct_answer["key"]). Raspunsurile acceptate
+    de comparatia pe textul afisat (CspGrader, ex. cu valori in plus) raman acceptate.
+    """
+    values: FrozenSet[str]
+    display: CspGrader
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        user_values = parse_value_set(user_answer)
+        is_correct = user_values == self.values
+        if not is_correct:
+            display_result = self.display.grade(user_answer)
+            if display_result["is_correct"]:
+                return display_result
+        return {
+            "is_correct": is_correct,
+            "score": 100.0 if is_correct else 0.0,
+            "details": {
+                "match_type": "csp_key_match" if is_correct else "csp_mismatch",
+                "expected": sorted(self.values),
+                "user_provided": sorted(user_values)
+            }
+        }
+
+
+def _names_variable(words: Sequence[str], variable: str) -> bool:
+    """Cuvintele consecutive din raspuns formeaza numele variabilei ("tara a" sau "taraa" pentru "Tara A")"""
+    for start in range(len(words)):
+        joined = ""
+        for word in words[start:]:
+            joined += word
+            if len(joined) >= len(variable):
+                break
+        if joined == variable:
+            return True
+    return False
+
+
+class CspVariableGrader(NamedTuple):
+    """MRV: raspunsul e corect daca numeste variabila din cheie ("X", "Variabila X", "X are cele mai putine valori")"""
+    variable: str  # cuvintele numelui, lipite (vezi _names_variable)
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        words = _WORD_RE.findall(normalize_text(user_answer))
+        is_correct = _names_variable(words, self.variable)
+        return {
+            "is_correct": is_correct,
+            "score": 100.0 if is_correct else 0.0,
+            "details": {
+                "match_type": "csp_variable_match" if is_correct else "csp_mismatch",
+                "expected": self.variable,
+                "user_provided": " ".join(words)
+            }
+        }
+
+
+def _finish_nash_semantic(similarity: float) -> Dict[str, Any]:
+    final_score = max(0, min(100, similarity * 100))
+    return {
+        "is_correct": final_score >= 60,
+        "score": round(final_score, 2),
+        "details": {"match_type": "nash_semantic", "similarity": round(similarity, 4)}
+    }
+
+
+NO_NASH_KEYWORDS = ("nuexista", "nuare", "noexiste", "fara", "nimic")
+NASH_ROW_NAMES = ("sus", "mijloc", "jos")
+NASH_COL_NAMES = ("stanga", "centru", "dreapta")
+
+
+class NashGrader(NamedTuple):
+    has_nash: bool
+    correct_text: str
+    correct_text_norm: str
+    reference_texts: Tuple[str, ...]
+    strategy_pairs: Tuple[Tuple[str, str], ...]  # (linie, coloana) pentru fiecare echilibru
+    total_equilibria: int
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        user_answer_norm = _compact(user_answer)
+        user_says_no_nash = any(kw in user_answer_norm for kw in NO_NASH_KEYWORDS)
+
+        if not self.has_nash and user_says_no_nash:
+            return {
+                "is_correct": True,
+                "score": 100.0,
+                "details": {"match_type": "nash_no_equilibrium_correct"}
+            }
+
+        if self.has_nash and user_says_no_nash:
+            return {
+                "is_correct": False,
+                "score": 0.0,
+                "details": {"match_type": "nash_wrong_no_equilibrium", "expected": self.correct_text}
+            }
+
+        if not self.has_nash and not user_says_no_nash:
+            return {
+                "is_correct": False,
+                "score": 0.0,
+                "details": {"match_type": "nash_wrong_cell_given", "expected": "Nu există echilibru Nash pur"}
+            }
+
+        # Verificare exacta pentru raspunsuri scurte
+        if self.correct_text_norm and self.correct_text_norm in user_answer_norm:
+            return {
+                "is_correct": True,
+                "score": 100.0,
+                "details": {"match_type": "nash_exact_match", "expected": self.correct_text}
+            }
+
+        # Verificare prin strategii mentionate
+        matched_equilibria = sum(
+            1 for row_name, col_name in self.strategy_pairs
+            if row_name in user_answer_norm and col_name in user_answer_norm
+        )
+        if matched_equilibria > 0:
+            total = self.total_equilibria
+            score = min(100.0, (matched_equilibria / total) * 100) if total else 100.0
+            return {
+                "is_correct": score >= 50,
+                "score": score,
+                "details": {"match_type": "nash_strategy_match", "matched": matched_equilibria, "total": total}
+            }
+
+        # Fallback: evaluare semantica pentru raspunsuri explicative
+        if self.reference_texts:
+            return SemanticRequest(user_answer, self.reference_texts, reference_embedding, _finish_nash_semantic)
+
+        return {
+            "is_correct": False,
+            "score": 0.0,
+            "details": {"match_type": "nash_no_match", "expected": self.correct_text}
+        }
+
+
+class NashKeyGrader(NamedTuple):
+    """
+    Echilibrele din correct_answer["key"] (multimea vida = fara echilibru pur), punctate cu
+    aceleasi reguli ca NashGrader; raspunsul e comparat fara diacritice ("(Sus, Stânga)")
+    """
+    cells: FrozenSet[Tuple[int, int]]
+    correct_text: str
+    correct_text_norm: str
+    reference_texts: Tuple[str, ...]
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        user_answer_norm = _compact(normalize_text(user_answer))
+        user_says_no_nash = any(kw in user_answer_norm for kw in NO_NASH_KEYWORDS)
+
+        if user_says_no_nash:
+            if not self.cells:
+                return {
+                    "is_correct": True,
+                    "score": 100.0,
+                    "details": {"match_type": "nash_no_equilibrium_correct"}
+                }
+            return {
+                "is_correct": False,
+                "score": 0.0,
+                "details": {"match_type": "nash_wrong_no_equilibrium", "expected": self.correct_text}
+            }
+
+        if not self.cells:
+            return {
+                "is_correct": False,
+                "score": 0.0,
+                "details": {"match_type": "nash_wrong_cell_given", "expected": "Nu există echilibru Nash pur"}
+            }
+
+        if self.correct_text_norm and self.correct_text_norm in user_answer_norm:
+            return {
+                "is_correct": True,
+                "score": 100.0,
+                "details": {"match_type": "nash_exact_match", "expected": self.correct_text}
+            }
+
+        # echilibrele ale caror strategii (linie si coloana) apar in raspuns, din totalul lor
+        matched = sum(
+            1 for row, col in self.cells
+            if NASH_ROW_NAMES[row] in user_answer_norm and NASH_COL_NAMES[col] in user_answer_norm
+        )
+        if matched > 0:
+            score = min(100.0, matched / len(self.cells) * 100)
+            return {
+                "is_correct": score >= 50,
+                "score": score,
+                "details": {"match_type": "nash_strategy_match", "matched": matched, "total": len(self.cells)}
+            }
+
+        if self.reference_texts:
+            return SemanticRequest(user_answer, self.reference_texts, reference_embedding,
+                                   _finish_nash_semantic)
+
+        return {
+            "is_correct": False,
+            "score": 0.0,
+            "details": {"match_type": "nash_no_match", "expected": self.correct_text}
+        }
+
+
+class ExactChoiceGrader(NamedTuple):
+    answer_compact: str
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        is_correct = _compact(user_answer) == self.answer_compact
+        return {
+            "is_correct": is_correct,
+            "score": 100.0 if is_correct else 0.0,
+            "details": {"match_type": "exact_multiple_choice"}
+        }
+
+
+class HybridGrader(NamedTuple):
+    """Evaluare hibrida: similaritate semantica (60%) + cuvinte cheie (40%)"""
+    reference_texts: Tuple[str, ...]
+    keywords: Optional[KeywordMatcher]
+
+    def grade(self, user_answer: str, reference_embedding: Optional[bytes] = None):
+        # 1. Keyword matching - nu depinde de model
+        keyword_score = self.keywords.score(normalize_text(user_answer)) if self.keywords else 0.0
+        # 2. Similaritate semantica - calculata de apelant
+        return SemanticRequest(user_answer, self.reference_texts, reference_embedding,
+                               partial(self.finish_semantic, keyword_score))
+
+    def finish_semantic(self, keyword_score: float, similarity: float) -> Dict[str, Any]:
+        semantic_score = similarity
+
+        # Combina scorurile
+        if self.keywords:
+            combined = (semantic_score * 0.6) + (keyword_score * 0.4)
+        else:
+            combined = semantic_score
+
+        final_score = max(0, min(100, combined * 100))
+
+        return {
+            "is_correct": final_score >= 60,
+            "score": round(final_score, 2),
+            "details": {
+                "match_type": "hybrid_evaluation",
+                "semantic_score": round(semantic_score, 4),
+                "keyword_score": round(keyword_score, 4) if self.keywords else None
+            }
+        }
+
+
+class QuestionEvaluator:
+    """
+    Evaluatorul implicit: raspuns exact ("answer") sau text de referinta evaluat hibrid.
+    Subclasele suprascriu compile pentru tipurile cu raspuns structurat.
+    """
+    # False: graderele nu cer niciodata similaritate semantica (embedding-ul referintei e inutil)
+    semantic = True
+
+    @staticmethod
+    def compile(correct_answer_json: Dict[str, Any]):
+        if "answer" in correct_answer_json and "reference_text" not in correct_answer_json:
+            return ExactChoiceGrader(_compact(correct_answer_json["answer"]))
+
+        if "reference_text" in correct_answer_json:
+            keywords = correct_answer_json.get("keywords", [])
+            # cuvintele cheie sunt normalizate si compilate o singura data (cache),
+            # apoi gasite toate dintr-o singura trecere prin raspuns
+            matcher = (
+                compile_keywords(tuple(keywords), correct_answer_json.get("whole_word_keywords", False))
+                if keywords else None
+            )
+            return HybridGrader(reference_texts(correct_answer_json) or (correct_answer_json["reference_text"],), matcher)
+
+        return ErrorGrader({"error": "invalid_format"})
+
+
+class MinimaxEvaluator(QuestionEvaluator):
+    semantic = False
+
+    @staticmethod
+    def compile(correct_answer_json: Dict[str, Any]):
+        if "key" in correct_answer_json:
+            correct_root, correct_leaves = correct_answer_json["key"]
+            return MinimaxGrader(correct_root, correct_leaves)
+
+        # intrebari generate inainte de correct_answer["key"]
+        correct_root = correct_answer_json.get("root_value")
+        correct_leaves = correct_answer_json.get("visited_leaves")
+
+        if correct_root is None or correct_leaves is None:
+            if "reference_text" not in correct_answer_json:
+                return ErrorGrader({"error": "missing_correct_answer_data"})
+
+            # Extragem cele doua nr corecte din textul de referinta
+            nums = re.findall(r"\d+", correct_answer_json["reference_text"])
+            if len(nums) < 2:
+                return ErrorGrader({"error": "invalid_reference_format"})
+            correct_root = int(nums[0])
+            correct_leaves = int(nums[1])
+
+        return MinimaxGrader(correct_root, correct_leaves)
+
+
+class CspEvaluator(QuestionEvaluator):
+    semantic = False
+
+    @staticmethod
+    def compile(correct_answer_json: Dict[str, Any]):
+        if "key" in correct_answer_json:
+            key = [csp_token(v) for v in correct_answer_json["key"]]
+            # MRV: cheia e [variabila], iar raspunsul afisat e numele ei (multimile FC/AC3 au acolade)
+            answer = str(correct_answer_json.get("answer", ""))
+            if len(key) == 1 and "{" not in answer and csp_token(answer) == key[0]:
+                return CspVariableGrader("".join(_WORD_RE.findall(normalize_text(answer))))
+            return CspKeyGrader(frozenset(key), _display_csp_grader(correct_answer_json))
+
+        # intrebari generate inainte de correct_answer["key"]: comparatie pe textul afisat
+        return _display_csp_grader(correct_answer_json)
+
+
+def _display_csp_grader(correct_answer_json: Dict[str, Any]) -> CspGrader:
+    correct_raw = correct_answer_json.get("answer", "").lower().replace(" ", "")
+    # Extrage valorile din răspunsul corect (elimină acolade și spații)
+    correct_clean = correct_raw.replace("{", "").replace("}", "")
+    correct_values = tuple(sorted(correct_clean.split(","))) if correct_clean else None
+    return CspGrader(correct_raw, correct_clean, correct_values)
+
+
+class NashEvaluator(QuestionEvaluator):
+
+    @staticmethod
+    def compile(correct_answer_json: Dict[str, Any]):
+        correct_text = correct_answer_json.get("answer", "") or correct_answer_json.get("answer_text", "")
+        if "key" in correct_answer_json:
+            return NashKeyGrader(
+                cells=frozenset(
+                    (row, col) for row, col in correct_answer_json["key"]
+                    if row < len(NASH_ROW_NAMES) and col < len(NASH_COL_NAMES)
+                ),
+                correct_text=correct_text,
+                correct_text_norm=_compact(normalize_text(correct_text)),
+                reference_texts=reference_texts(correct_answer_json)
+            )
+
+        # intrebari generate inainte de correct_answer["key"]
+        nash_equilibria = correct_answer_json.get("nash_equilibria", [])
+        strategy_pairs = tuple(
+            (NASH_ROW_NAMES[eq[0]], NASH_COL_NAMES[eq[1]])
+            for eq in nash_equilibria
+            if eq[0] < len(NASH_ROW_NAMES) and eq[1] < len(NASH_COL_NAMES)
+        )
+        return NashGrader(
+            has_nash=correct_answer_json.get("has_nash", True),
+            correct_text=correct_text,
+            correct_text_norm=normalize_text(correct_text).replace(" ", ""),
+            reference_texts=reference_texts(correct_answer_json),
+            strategy_pairs=strategy_pairs,
+            total_equilibria=len(nash_equilibria)
+        )
+
+
+# Tip de intrebare (numele din QuestionTypeEnum) -> evaluator; celelalte tipuri folosesc QuestionEvaluator.
+# Cheile sunt nume, nu membrii enum-ului: app.models importa stratul de baza de date.
+EVALUATORS: Dict[str, type] = {
+    "MINIMAX_TREE": MinimaxEvaluator,
+    "CSP_PROBLEM": CspEvaluator,
+    "GAME_MATRIX": NashEvaluator,
+}
+
+
+def question_type_name(question_type) -> str:
+    """Accepta atat QuestionTypeEnum cat si numele lui"""
+    return getattr(question_type, "name", question_type)
+
+
+def uses_semantic_grading(question_type) -> bool:
+    """Tipul de intrebare poate ajunge la evaluarea semantica (deci la embedding-ul referintei)"""
+    return EVALUATORS.get(question_type_name(question_type), QuestionEvaluator).semantic
+
+
+def compile_grader(correct_answer_json: Dict[str, Any], question_type):
+    evaluator = EVALUATORS.get(question_type_name(question_type), QuestionEvaluator)
+    return evaluator.compile(correct_answer_json)
+
+
+def get_grader(correct_answer_json: Dict[str, Any], question_type, question_id: Optional[int] = None):
+    """Graderul intrebarii; cu question_id este compilat o singura data si luat din cache"""
+    if question_id is None:
+        return compile_grader(correct_answer_json, question_type)
+
+    key = (question_id, question_type_name(question_type))
+    grader = _grader_cache.get(key)
+    if grader is MISSING:
+        grader = compile_grader(correct_answer_json, question_type)
+        _grader_cache.put(key, grader)
+    return grader
+
+
+def grader_cache_stats() -> Dict[str, Any]:
+    return _grader_cache.stats()
@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+
+class EncodeBatcher:
+    """
+    Coada de inferenta cu micro-batching pentru modelul semantic.
+
+    Fiecare apelant (thread din threadpool-ul FastAPI) pune textele in coada si
+    primeste un Future. Un singur thread de lucru aduna cererile timp de cel mult
+    max_wait_ms sau pana la max_batch_size texte, ruleaza un singur encode pe tot
+    lotul si imparte rezultatul inapoi pe Future-uri.
+    """
+
+    def __init__(self, encode_fn: Callable[[List[str]], Any],
+                 max_batch_size: int = 32,
+                 max_wait_ms: float = 5.0):
+        """
+        :param encode_fn: functia care codifica o lista de texte (ex. model.encode)
+        :param max_batch_size: cate texte intra cel mult intr-un lot
+        :param max_wait_ms: cat asteapta primul text din lot dupa altele
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue = deque()  # (texte, future)
+        self._queued_texts = 0
+        self._cond = threading.Condition()
+        self._worker = None
+
+        # statistici
+        self._batches = 0
+        self._batched_texts = 0
+        self._batched_requests = 0
+        self._largest_batch = 0
+        self._last_batch_size = 0
+
+    def submit(self, texts: Sequence[str]) -> Future:
+        """Pune textele in coada; Future-ul primeste embedding-urile lor (in aceeasi ordine)"""
+        future = Future()
+        texts = list(texts)
+        with self._cond:
+            self._queue.append((texts, future))
+            self._queued_texts += len(texts)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="encode-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return future
+
+    def encode(self, texts: Sequence[str]):
+        """Varianta blocanta a lui submit"""
+        return self.submit(texts).result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "queue_depth": len(self._queue),
+                "queued_texts": self._queued_texts,
+                "batches": self._batches,
+                "batched_requests": self._batched_requests,
+                "batched_texts": self._batched_texts,
+                "avg_batch_size": round(self._batched_texts / self._batches, 2) if self._batches else 0.0,
+                "largest_batch": self._largest_batch,
+                "last_batch_size": self._last_batch_size,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+            }
+
+    def _next_batch(self):
+        """Asteapta cereri si scoate din coada urmatorul lot"""
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            # fereastra de colectare: pana se umple lotul sau expira timpul
+            deadline = time.monotonic() + self.max_wait
+            while self._queued_texts < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = []
+            size = 0
+            # o cerere mai mare decat max_batch_size merge singura
+            while self._queue and (not batch or size + len(self._queue[0][0]) <= self.max_batch_size):
+                texts, future = self._queue.popleft()
+                batch.append((texts, future))
+                size += len(texts)
+            self._queued_texts -= size
+
+            self._batches += 1
+            self._batched_requests += len(batch)
+            self._batched_texts += size
+            self._largest_batch = max(self._largest_batch, size)
+            self._last_batch_size = size
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            try:
+                vectors = self.encode_fn(texts)
+            except BaseException as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future in batch:
+                future.set_result(vectors[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+
+
+class AdmissionLimiter:
+    """
+    Limiteaza cate cereri ruleaza deodata pasul semantic (max_concurrency) si cate
+    asteapta dupa un loc (max_queue). Peste coada, acquire() refuza imediat: apelantul
+    raspunde 503 in loc sa tina ocupat un thread din threadpool-ul FastAPI.
+    max_concurrency <= 0: fara limita.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected = 0
+
+    def acquire(self) -> bool:
+        """Ocupa un loc (asteptand cel mult timeout secunde); False daca cererea e refuzata"""
+        if self.max_concurrency <= 0:
+            return True
+        with self._cond:
+            if self._active >= self.max_concurrency:
+                if self._waiting >= self.max_queue:
+                    self._rejected += 1
+                    return False
+                self._waiting += 1
+                try:
+                    admitted = self._cond.wait_for(lambda: self._active < self.max_concurrency, self.timeout)
+                finally:
+                    self._waiting -= 1
+                if not admitted:
+                    self._rejected += 1
+                    return False
+            self._active += 1
+            self._admitted += 1
+            return True
+
+    def release(self):
+        if self.max_concurrency <= 0:
+            return
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "active": self._active,
+                "waiting": self._waiting,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+            }
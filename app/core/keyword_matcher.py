@@ -0,0 +1,107 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Sequence, Set
+
+from ..utils.text import normalize_text
+
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """
+    Construieste o expresie regulata sub forma de trie din cuvinte.
+    Ramurile unui nod incep cu caractere diferite, iar sufixele optionale sunt
+    greedy, deci la fiecare pozitie se incearca intai cel mai lung cuvant.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # sfarsit de cuvant
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Pozitia index din text nu este un caracter de cuvant (sau e in afara textului)"""
+    return index < 0 or index >= len(text) or not _WORD_CHAR_RE.match(text[index])
+
+
+def _occurs(needle: str, haystack: str, whole_word: bool) -> bool:
+    """needle apare in haystack (cu capetele lui haystack considerate limite de cuvant)"""
+    if not whole_word:
+        return needle in haystack
+    start = haystack.find(needle)
+    while start != -1:
+        if _is_boundary(haystack, start - 1) and _is_boundary(haystack, start + len(needle)):
+            return True
+        start = haystack.find(needle, start + 1)
+    return False
+
+
+class KeywordMatcher:
+    """
+    Cuvinte cheie normalizate si compilate o singura data intr-o expresie regulata (trie).
+
+    La fiecare pozitie din raspuns expresia gaseste cel mai lung cuvant cheie care incepe
+    acolo; cuvintele cheie continute in acesta (ex. "alpha" in "alpha-beta") sunt
+    precalculate, deci toate potrivirile ies dintr-o singura trecere prin text,
+    indiferent de numarul de cuvinte cheie (costurile sunt in `python -m cli.bench_keywords`).
+
+    whole_word=True: un cuvant cheie conteaza doar daca nu e lipit de alte litere/cifre.
+    """
+
+    def __init__(self, keywords: Sequence[str], whole_word: bool = False):
+        self.keywords = tuple(keywords)
+        self.whole_word = whole_word
+        self.normalized = tuple(normalize_text(kw) for kw in self.keywords)
+
+        distinct = sorted({kw for kw in self.normalized if kw})
+
+        self._implied: Dict[str, FrozenSet[str]] = {}
+        self._pattern = None
+        if distinct:
+            self._implied = {
+                kw: frozenset(other for other in distinct if _occurs(other, kw, whole_word))
+                for kw in distinct
+            }
+            body = "(" + _trie_pattern(distinct) + ")"
+            if whole_word:
+                self._pattern = re.compile(r"(?<!\w)(?=" + body + r"(?!\w))")
+            else:
+                self._pattern = re.compile("(?=" + body + ")")
+
+    def find(self, text_normalized: str) -> Set[str]:
+        """Cuvintele cheie (normalizate) care apar in textul deja normalizat"""
+        found = set()
+        if "" in self.normalized:
+            found.add("")  # ca la `"" in text`
+        if self._pattern is not None:
+            for m in self._pattern.finditer(text_normalized):
+                longest = m.group(1)
+                if longest not in found:
+                    found |= self._implied[longest]
+        return found
+
+    def score(self, text_normalized: str) -> float:
+        """Fractiunea cuvintelor cheie (cu repetitii, ca in lista originala) gasite in text"""
+        if not self.keywords:
+            return 0.0
+        found = self.find(text_normalized)
+        return sum(1 for kw in self.normalized if kw in found) / len(self.keywords)
+
+
+@lru_cache(maxsize=1024)
+def compile_keywords(keywords: tuple, whole_word: bool = False) -> KeywordMatcher:
+    """KeywordMatcher din cache: aceeasi lista de cuvinte cheie se compileaza o singura data"""
+    return KeywordMatcher(keywords, whole_word)
@@ -1,101 +1,147 @@
 import random
-from typing import Dict, Any
-from .minimax_solver import MinMaxSolver
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
+import numpy as np
+
+from .minimax_batch import solve_uniform_batch
+from .minimax_solver import FlatMinMaxSolver, flatten_tree
+from .tree_encoding import TREE_ENCODING, encode_flat_tree
+
+# Cheia din Question.metadata_ sub care se salveaza traseul Alpha-Beta
+ALPHABETA_TRACE_KEY = "alphabeta_trace"
+
+
+class MinimaxDifficulty(NamedTuple):
+    depths: Tuple[int, ...]  # adancimile posibile (adancimea arborelui e exact una dintre ele)
+    min_leaves: int
+    max_leaves: int
+    root_three: float        # probabilitatea ca radacina sa aiba 3 copii in loc de 2
+    inner_three: float       # la fel, pentru celelalte noduri interne
+
+
+MINIMAX_DIFFICULTY = {
+    1: MinimaxDifficulty(depths=(2,), min_leaves=3, max_leaves=4, root_three=0.0, inner_three=0.0),     # Easy
+    2: MinimaxDifficulty(depths=(2, 3), min_leaves=5, max_leaves=7, root_three=0.0, inner_three=0.0),  # Medium
+    3: MinimaxDifficulty(depths=(3,), min_leaves=8, max_leaves=12, root_three=0.6, inner_three=0.3),   # Hard
+}
+
+
+def _min_leaves(height: int) -> int:
+    """Cele mai putine frunze ale unui subarbore cu inaltimea exact `height` (lant de noduri cu 2 copii)"""
+    return height + 1
 
-def count_leaves(node: Dict[str, Any]) -> int:
-    """Numara frunzele din arbore
-        Un nod e considerat frunza daca are campul "value"
-    """
-    if "value" in node: #este frunza
-        return 1
-    children = node.get("children", [])
-    return sum(count_leaves(child) for child in children)
 
+def _max_leaves(height: int, max_children: int) -> int:
+    return max_children ** height
 
-def _gen_random_tree(max_depth: int, difficulty: int, current_depth: int = 0) -> Dict[str, Any]:
+
+def _split(total: int, lower: List[int], upper: int, rng: random.Random) -> List[int]:
+    """Imparte aleator `total` in parti cu parte[i] >= lower[i] si parte[i] <= upper (presupune ca se poate)"""
+    parts = []
+    for i, low in enumerate(lower):
+        rest_lower = sum(lower[i + 1:])
+        rest_upper = upper * (len(lower) - i - 1)
+        part = rng.randint(max(low, total - rest_upper), min(upper, total - rest_lower))
+        parts.append(part)
+        total -= part
+    return parts
+
+
+def _build_tree(leaves: int, height: int, exact: bool, depth: int,
+                root_three: float, inner_three: float, rng: random.Random) -> Dict[str, Any]:
     """
-    Genereaza recursiv un arbore MIN/MAX
-    - Frunzele apar la adancime maxima sau aleator
-    - Nodurile altereaza intre MAX(nivel par) si MIN(impar)
-    - Nr copii:
-        - radacina poate avea 3 copii
-        - toate celelalte noduri 2 copii
-    - frunzele primesc valori radnom intre 1 si 20
+    Subarbore cu exact `leaves` frunze si inaltimea cel mult `height`
+    (exact `height` daca exact=True); MAX pe nivelurile pare, MIN pe cele impare.
     """
+    if (leaves == 1 and not exact) or height == 0:
+        return {"value": rng.randint(1, 20)}
 
-    #daca am atins adancimea max-> generez frunza
-    if current_depth >= max_depth:
-        return {
-            "id": f"leaf_{random.randint(1000, 9999)}",
-            "value": random.randint(1, 20)
-        }
+    three = root_three if depth == 0 else inner_three
+    max_children = 3 if inner_three > 0 else 2
+    child_upper = _max_leaves(height - 1, max_children)
+    child_exact = _min_leaves(height - 1) if exact else 1
 
-    #previn generarea arborilor mari
-    early_stop_chance = (0.4 if difficulty == 1 else 0.1) * current_depth
-    if current_depth >= 1 and random.random() < early_stop_chance:
-        return {
-            "id": f"leaf_{random.randint(1000, 9999)}",
-            "value": random.randint(1, 20)
-        }
-    
-    #doar 2 copii pe nod (poate 3 la radacina)
-    if current_depth == 0:
-        # La Easy/Medium radacina are 2 copii, la Hard poate avea 3
-        num_children = 3 if (difficulty == 3 and random.random() < 0.6) else 2
-    else:
-        # La Hard permitem ocazional 3 copii și în noduri intermediare
-        num_children = 3 if (difficulty == 3 and random.random() < 0.3) else 2
+    def feasible(count: int) -> bool:
+        return child_exact + count - 1 <= leaves <= count * child_upper
+
+    preferred = 3 if three > 0 and rng.random() < three else 2
+    fallback = 2 if preferred == 3 else 3
+    num_children = preferred if feasible(preferred) or not three else fallback
 
-    #determin tipul nodului in functie de nivel
-    node_type = "MAX" if current_depth % 2 == 0 else "MIN"
+    # un copil ales aleator atinge inaltimea ceruta; ceilalti pot fi frunze sau subarbori mai scunzi
+    deep_child = rng.randrange(num_children) if exact else -1
+    lower = [child_exact if i == deep_child else 1 for i in range(num_children)]
+    parts = _split(leaves, lower, child_upper, rng)
 
     return {
-        "id": f"node_{current_depth}_{random.randint(1000, 9999)}",
-        "type": node_type,
+        "type": "MAX" if depth % 2 == 0 else "MIN",
         "children": [
-            _gen_random_tree(max_depth, difficulty, current_depth + 1)
-            for _ in range(num_children)
+            _build_tree(part, height - 1, i == deep_child, depth + 1, root_three, inner_three, rng)
+            for i, part in enumerate(parts)
         ]
     }
 
 
-def genereaza_intrebare_minimax(answer_type: str = "multiple", difficulty: int = 2) -> Dict[str, Any]:
+def _tree_fits(leaf_count: int, depth: int, root_three: float, inner_three: float) -> bool:
+    if depth == 0:
+        return leaf_count == 1
+    root_children = 3 if root_three > 0 else 2
+    max_children = 3 if inner_three > 0 else 2
+    return _min_leaves(depth) <= leaf_count <= root_children * _max_leaves(depth - 1, max_children)
+
+
+def genereaza_arbore_minimax(leaf_count: int, depth: int,
+                             root_three: float = 0.0, inner_three: float = 0.0,
+                             rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """
-    Generează o întrebare minimax cu arbori MICI (4-10 frunze).
+    Construieste direct un arbore MIN/MAX cu exact `leaf_count` frunze si adancimea exact `depth`
+    (fara generari repetate). Nodurile interne au 2 copii (sau 3, cu probabilitatile date);
+    frunzele primesc valori intre 1 si 20. Nodurile nu au id: in forma salvata (tree_encoding)
+    id-ul e pozitia nodului.
     """
+    if not _tree_fits(leaf_count, depth, root_three, inner_three):
+        raise ValueError(f"Nu exista arbore cu {leaf_count} frunze si adancimea {depth}")
+    return _build_tree(leaf_count, depth, True, 0, root_three, inner_three, rng or random.Random())
 
-    if difficulty == 1:  # Easy
-        max_depth = 2
-        min_leaves, max_leaves = 3, 4
-    elif difficulty == 2:  # Medium
-        max_depth = random.choice([2, 3])
-        min_leaves, max_leaves = 5, 7
-    else:  # Hard (3)
-        max_depth = 3
-        min_leaves, max_leaves = 8, 12
-
-    max_attempts = 20
-    tree = None
-    leaf_count = 0
-
-    for attempt in range(max_attempts):
-        tree = _gen_random_tree(max_depth, difficulty)
-        leaf_count = count_leaves(tree)
-
-        if min_leaves <= leaf_count <= max_leaves:
-            break
-
-        # Dacă eșuează repetat, forțăm o structură minimă
-        if attempt == max_attempts - 1:
-            max_depth = 2 if difficulty < 3 else 3
-    
-    # Solver MinMax cu Alpha-Beta
-    solver = MinMaxSolver(tree)
-    root_value, visited_leaves = solver.solve()
+
+def genereaza_intrebare_minimax(answer_type: str = "multiple", difficulty: int = 2,
+                                seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Generează o întrebare minimax cu arbori MICI (3-12 frunze).
+    Numarul de frunze si adancimea se aleg intai (in limitele dificultatii), apoi arborele
+    e construit exact cu ele. Cu acelasi seed se obtine aceeasi intrebare.
+    """
+    rng = random.Random(seed)
+    params = MINIMAX_DIFFICULTY.get(difficulty, MINIMAX_DIFFICULTY[3])
+
+    # combinatiile posibile; ex. la Medium 5-7 frunze nu incap la adancimea 2 cu 2 copii pe nod
+    targets = [
+        (depth, leaves)
+        for depth in params.depths
+        for leaves in range(params.min_leaves, params.max_leaves + 1)
+        if _tree_fits(leaves, depth, params.root_three, params.inner_three)
+    ]
+    max_depth, leaf_count = rng.choice(targets)
+    tree = genereaza_arbore_minimax(leaf_count, max_depth, params.root_three, params.inner_three, rng)
+
+    # Solver MinMax cu Alpha-Beta; traseul (salvat cu intrebarea) se obtine in aceeasi parcurgere
+    flat_tree = flatten_tree(tree)
+    solver = FlatMinMaxSolver(flat_tree)
+    root_value, visited_leaves, trace = solver.solve_traced()
     
     root_type = tree.get("type", "MAX")
+    encoded_tree = encode_flat_tree(flat_tree)  # forma compacta salvata si trimisa frontend-ului
+
+    question = _build_question(encoded_tree, root_type, leaf_count, max_depth,
+                               root_value, visited_leaves, answer_type, difficulty, rng)
+    question["metadata_"] = {ALPHABETA_TRACE_KEY: trace}
+    return question
 
+
+def _build_question(encoded_tree: Dict[str, Any], root_type: str, leaf_count: int, tree_depth: int,
+                    root_value: int, visited_leaves: int,
+                    answer_type: str, difficulty: int, rng: random.Random) -> Dict[str, Any]:
+    """Intrebarea (enunt, raspuns corect, variante) pentru un arbore deja rezolvat"""
     #Solutia de referinta
     reference_solution = (
         f"Aplicand MinMax cu optimizarea Alpha-Beta pe arborele dat, cu rădăcina de tip {root_type}, "
@@ -119,15 +165,16 @@ def genereaza_intrebare_minimax(answer_type: str = "multiple", difficulty: int =
             "question_type": "MINIMAX_TREE",
             "difficulty": 3,
             "problem_instance": {
-                "tree": tree,
+                "tree": encoded_tree,
                 "root_type": root_type,
                 "total_leaves": leaf_count,
-                "tree_depth": max_depth
+                "tree_depth": tree_depth
             },
             "correct_answer": {
                 "reference_text": reference_solution,
                 "root_value":root_value,
                 "visited_leaves":visited_leaves,
+                "key": [root_value, visited_leaves],
                 "keywords": [
                     "minmax", "alpha", "beta", "taiere", "pruning",
                     "MAX", "MIN", "radacina", "frunze",
@@ -162,11 +209,11 @@ def genereaza_intrebare_minimax(answer_type: str = "multiple", difficulty: int =
 
     #completam pana avem 4 optuni
     while len(options) < 4:
-        dv = random.randint(-3, 3)
-        dl = random.randint(-2, 3)
+        dv = rng.randint(-3, 3)
+        dl = rng.randint(-2, 3)
         add_distractor(dv, dl)
     
-    random.shuffle(options)
+    rng.shuffle(options)
     
     return {
         "title": "MinMax cu Alpha-Beta pe arbore de joc",
@@ -174,18 +221,47 @@ def genereaza_intrebare_minimax(answer_type: str = "multiple", difficulty: int =
         "question_type": "MINIMAX_TREE",
         "difficulty": difficulty,
         "problem_instance": {
-            "tree": tree,
+            "tree": encoded_tree,
             "root_type": root_type,
             "total_leaves": leaf_count,
-            "tree_depth": max_depth
+            "tree_depth": tree_depth
         },
         "correct_answer": {
             "answer": correct_str,
             "root_value":root_value,
-            "visited_leaves":visited_leaves
+            "visited_leaves":visited_leaves,
+            "key": [root_value, visited_leaves]
         },
         "reference_solution": reference_solution,
         "chapter_name": "Algoritmi de cautare si CSP",
         "answer_type": "multiple",
         "options": options
-    }
\ No newline at end of file
+    }
+
+
+def genereaza_intrebari_minimax_lot(count: int, branching: int = 2, depth: int = 3,
+                                    answer_type: str = "multiple", difficulty: int = 3,
+                                    seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Genereaza multe intrebari deodata (banca de intrebari offline), cu arbori uniformi:
+    `branching` copii pe fiecare nod intern, frunzele la adancimea `depth`, radacina MAX.
+    Frunzele sunt trase cu NumPy si toti arborii sunt rezolvati intr-un singur lot.
+    Traseul Alpha-Beta nu e calculat aici; endpoint-ul care il serveste il calculeaza la prima cerere.
+    """
+    leaf_count = branching ** depth
+    leaves = np.random.default_rng(seed).integers(1, 21, size=(count, leaf_count))
+    rng = random.Random(seed)  # pentru variantele gresite
+    root_values, visited = solve_uniform_batch(leaves, branching, depth)
+
+    # toti arborii au aceeasi forma: tipurile si aritatile sunt comune
+    types = "".join(("X" if level % 2 == 0 else "N") * branching ** level for level in range(depth))
+    types += "L" * leaf_count
+    arity = [branching] * (len(types) - leaf_count)
+
+    return [
+        _build_question(
+            {"encoding": TREE_ENCODING, "types": types, "arity": list(arity), "values": tree_leaves},
+            "MAX", leaf_count, depth, root_value, visited_leaves, answer_type, difficulty, rng
+        )
+        for tree_leaves, root_value, visited_leaves in zip(leaves.tolist(), root_values.tolist(), visited.tolist())
+    ]
@@ -1,5 +1,7 @@
 import math
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, NamedTuple, Tuple, Union
+
+import numpy as np
 
 
 class MinMaxSolver:
@@ -95,3 +97,218 @@ class MinMaxSolver:
         )
         #valoarea calculata in radacina + nr total de frunze vizitate
         return value, self.visited_leaves
+
+    def solve_traced(self) -> Tuple[int, int, Dict[str, Any]]:
+        """
+        Ca solve(), plus traseul parcurgerii (vezi FlatMinMaxSolver.solve_traced);
+        id-urile nodurilor sunt pozitiile lor in ordinea pe niveluri, ca in tree_encoding.
+        """
+        return FlatMinMaxSolver(flatten_tree(self.tree)).solve_traced()
+
+
+# ---------------------------------------------------------
+# VARIANTA PE TABLOURI (arbori mari)
+# ---------------------------------------------------------
+# Tipurile nodurilor in FlatTree.kind
+LEAF, MAX_NODE, MIN_NODE = 0, 1, 2
+
+
+class FlatTree(NamedTuple):
+    """
+    Arborele in tablouri paralele, nodurile in ordinea parcurgerii pe niveluri (BFS):
+    copiii unui nod sunt consecutivi, de la first_child[i] la first_child[i] + child_count[i].
+    Radacina e nodul 0. Tipul MAX/MIN alterneaza pe niveluri pornind de la radacina,
+    exact ca in MinMaxSolver (campul "type" al nodurilor interne nu e folosit).
+    """
+    kind: np.ndarray         # int8: LEAF / MAX_NODE / MIN_NODE
+    first_child: np.ndarray  # int64
+    child_count: np.ndarray  # int64
+    value: np.ndarray        # valoarea frunzelor (0 la nodurile interne)
+
+    @property
+    def num_nodes(self) -> int:
+        return int(self.kind.shape[0])
+
+    @property
+    def num_leaves(self) -> int:
+        return int(np.count_nonzero(self.kind == LEAF))
+
+
+def flatten_tree(tree: Dict[str, Any]) -> FlatTree:
+    """Transforma arborele JSON (formatul din generator) in FlatTree, iterativ"""
+    nodes = [tree]
+    kinds = [MAX_NODE if tree.get("type", "MAX") == "MAX" else MIN_NODE]
+    first_child: List[int] = []
+    child_count: List[int] = []
+    values: List[Any] = []
+
+    position = 0
+    while position < len(nodes):
+        node = nodes[position]
+        if "value" in node:
+            kinds[position] = LEAF
+            first_child.append(0)
+            child_count.append(0)
+            values.append(node["value"])
+        else:
+            children = node.get("children", [])
+            child_kind = MIN_NODE if kinds[position] == MAX_NODE else MAX_NODE
+            first_child.append(len(nodes))
+            child_count.append(len(children))
+            values.append(0)
+            nodes.extend(children)
+            kinds.extend([child_kind] * len(children))
+        position += 1
+
+    # valorile intregi raman intregi (solve() le intoarce asa cum sunt in JSON)
+    value_dtype = np.int64 if all(isinstance(v, int) for v in values) else np.float64
+    return FlatTree(
+        kind=np.array(kinds, dtype=np.int8),
+        first_child=np.array(first_child, dtype=np.int64),
+        child_count=np.array(child_count, dtype=np.int64),
+        value=np.array(values, dtype=value_dtype),
+    )
+
+
+class FlatMinMaxSolver:
+    """
+    Acelasi MinMax cu Alpha-Beta ca MinMaxSolver, dar pe FlatTree si fara recursivitate:
+    nu depinde de limita de recursivitate si nu face cautari in dictionare la fiecare nod.
+    solve() intoarce aceleasi (valoare_radacina, frunze_vizitate) ca MinMaxSolver.solve().
+    """
+
+    def __init__(self, tree: Union[FlatTree, Dict[str, Any]]):
+        self.tree = tree if isinstance(tree, FlatTree) else flatten_tree(tree)
+        self.visited_leaves = 0
+
+    def solve(self) -> Tuple[int, int]:
+        # listele Python se indexeaza mult mai repede decat tablourile numpy, element cu element
+        kind = self.tree.kind.tolist()
+        first_child = self.tree.first_child.tolist()
+        child_count = self.tree.child_count.tolist()
+        values = self.tree.value.tolist()
+
+        if kind[0] == LEAF:
+            self.visited_leaves = 1
+            return values[0], 1
+
+        # nodul curent e tinut in variabile locale; stiva pastreaza starea stramosilor
+        visited = 0
+        stack = []
+        next_child = first_child[0]
+        end = next_child + child_count[0]
+        maximizing = kind[0] == MAX_NODE
+        value = -math.inf if maximizing else math.inf
+        alpha, beta = -math.inf, math.inf
+
+        while True:
+            if next_child < end and alpha < beta:
+                child = next_child
+                next_child += 1
+                child_kind = kind[child]
+                if child_kind == LEAF:
+                    visited += 1
+                    child_value = values[child]
+                else:
+                    # cobor in copil; alpha si beta se mostenesc de la parinte
+                    stack.append((next_child, end, value, alpha, beta, maximizing))
+                    next_child = first_child[child]
+                    end = next_child + child_count[child]
+                    maximizing = child_kind == MAX_NODE
+                    value = -math.inf if maximizing else math.inf
+                    continue
+            else:
+                # nod terminat (toti copiii sau taiere): valoarea lui urca la parinte
+                if not stack:
+                    break
+                child_value = value
+                next_child, end, value, alpha, beta, maximizing = stack.pop()
+
+            if maximizing:
+                if child_value > value:
+                    value = child_value
+                if value > alpha:
+                    alpha = value
+            else:
+                if child_value < value:
+                    value = child_value
+                if value < beta:
+                    beta = value
+
+        self.visited_leaves = visited
+        return value, visited
+
+    def solve_traced(self) -> Tuple[int, int, Dict[str, Any]]:
+        """
+        Aceeasi parcurgere ca solve(), care inregistreaza si traseul (solve() ramane neschimbat):
+            - leaf_order: frunzele, in ordinea vizitarii
+            - nodes: [nod, alpha, beta, valoare] pentru fiecare nod intern vizitat, la iesirea
+              din el (deci in postordine); None inseamna -inf/+inf
+            - pruned: muchiile [parinte, copil] taiate (copiii nevizitati dupa alpha >= beta)
+        Nodurile sunt identificate prin pozitia lor in FlatTree.
+        """
+        kind = self.tree.kind.tolist()
+        first_child = self.tree.first_child.tolist()
+        child_count = self.tree.child_count.tolist()
+        values = self.tree.value.tolist()
+
+        leaf_order: List[int] = []
+        exits: List[List[Any]] = []
+        pruned: List[List[int]] = []
+        trace = {"leaf_order": leaf_order, "nodes": exits, "pruned": pruned}
+
+        if kind[0] == LEAF:
+            leaf_order.append(0)
+            self.visited_leaves = 1
+            return values[0], 1, trace
+
+        stack = []
+        node = 0
+        next_child = first_child[0]
+        end = next_child + child_count[0]
+        maximizing = kind[0] == MAX_NODE
+        value = -math.inf if maximizing else math.inf
+        alpha, beta = -math.inf, math.inf
+
+        while True:
+            if next_child < end and alpha < beta:
+                child = next_child
+                next_child += 1
+                child_kind = kind[child]
+                if child_kind == LEAF:
+                    leaf_order.append(child)
+                    child_value = values[child]
+                else:
+                    stack.append((node, next_child, end, value, alpha, beta, maximizing))
+                    node = child
+                    next_child = first_child[child]
+                    end = next_child + child_count[child]
+                    maximizing = child_kind == MAX_NODE
+                    value = -math.inf if maximizing else math.inf
+                    continue
+            else:
+                exits.append([node, _finite(alpha), _finite(beta), _finite(value)])
+                pruned.extend([node, skipped] for skipped in range(next_child, end))
+                if not stack:
+                    break
+                child_value = value
+                node, next_child, end, value, alpha, beta, maximizing = stack.pop()
+
+            if maximizing:
+                if child_value > value:
+                    value = child_value
+                if value > alpha:
+                    alpha = value
+            else:
+                if child_value < value:
+                    value = child_value
+                if value < beta:
+                    beta = value
+
+        self.visited_leaves = len(leaf_order)
+        return value, self.visited_leaves, trace
+
+
+def _finite(number):
+    """-inf/+inf nu exista in JSON (si nici in JSONB)"""
+    return None if number in (math.inf, -math.inf) else number
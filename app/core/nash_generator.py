@@ -70,6 +70,8 @@ def genereaza_intrebare_nash(answer_type: str = "multiple", difficulty: int = 2)
             matrix = [[(random.randint(-10, 20), random.randint(-10, 20)) for _ in range(cols)] for _ in range(rows)]
     
     nash_list = find_pure_nash(matrix)
+    # cheia canonica pentru evaluator: celulele (linie, coloana) ale echilibrelor
+    answer_key = sorted([r, c] for r, c in nash_list)
     
     row_strategies = ["Sus", "Mijloc", "Jos"][:rows]
     col_strategies = ["Stânga", "Centru", "Dreapta"][:cols]
@@ -130,6 +132,7 @@ def genereaza_intrebare_nash(answer_type: str = "multiple", difficulty: int = 2)
                 "nash_equilibria": nash_list,
                 "has_nash": has_nash,
                 "answer_text": correct_answer,
+                "key": answer_key,
                 "keywords": ["nash", "echilibru", "best response", "strategie"]
             },
             "reference_solution": reference_solution,
@@ -173,7 +176,8 @@ def genereaza_intrebare_nash(answer_type: str = "multiple", difficulty: int = 2)
         "correct_answer": {
             "answer": correct_answer,
             "nash_equilibria": nash_list,
-            "has_nash": has_nash
+            "has_nash": has_nash,
+            "key": answer_key
         },
         "reference_solution": reference_solution,
         "chapter_name": "Teoria Jocurilor",
@@ -0,0 +1,92 @@
+"""
+Embedding-urile textelor de referinta statice (descrierile din TEXT_KNOWLEDGE si
+referintele THEORY din STRATEGY_KNOWLEDGE, cu parafrazele lor), precalculate intr-un
+fisier .npy. Workerii il deschid cu np.load(mmap_mode="r"), deci toate procesele
+impart aceleasi pagini de memorie.
+
+Langa .npy, un index .json retine textele (randul fiecaruia) si amprenta
+(modelul + textele). Un fisier construit pentru alte texte sau alt model e ignorat
+si reconstruit automat la incarcarea modelului; python -m cli.build_reference_store
+il reconstruieste explicit.
+"""
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .generator import TEXT_KNOWLEDGE
+from .strategy_knowledge import STRATEGY_KNOWLEDGE, theory_reference_texts
+
+# Fisierele <cale>.npy si <cale>.json
+REFERENCE_STORE_PATH = os.getenv("REFERENCE_STORE_PATH", "reference_embeddings")
+
+
+def static_reference_texts() -> List[str]:
+    """Textele de referinta care nu depind de intrebarea generata"""
+    texts = []
+    for entry in TEXT_KNOWLEDGE:
+        texts.append(entry["description"])
+        texts.extend(entry.get("paraphrases", []))
+    for strategy_name, strategy_info in STRATEGY_KNOWLEDGE.items():
+        reference_text, paraphrases = theory_reference_texts(strategy_name, strategy_info)
+        texts.append(reference_text)
+        texts.extend(paraphrases)
+    return texts
+
+
+def fingerprint(model_id: str, texts: Sequence[str]) -> str:
+    digest = hashlib.sha1(model_id.encode("utf-8"))
+    for text in texts:
+        digest.update(b"\0" + text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ReferenceStore:
+    def __init__(self, vectors: np.ndarray, rows: Dict[str, int], store_fingerprint: str):
+        self.vectors = vectors
+        self.rows = rows
+        self.fingerprint = store_fingerprint
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Randul (vedere in fisierul mapat) pentru text, None daca textul nu e in depozit"""
+        row = self.rows.get(text)
+        return self.vectors[row] if row is not None else None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def load_store(path: str, model_id: str, texts: Sequence[str]) -> Optional[ReferenceStore]:
+    """Depozitul de pe disc, daca exista si a fost construit pentru exact aceste texte si acest model"""
+    expected = fingerprint(model_id, texts)
+    try:
+        with open(path + ".json") as f:
+            index = json.load(f)
+        if index.get("fingerprint") != expected:
+            return None
+        vectors = np.load(path + ".npy", mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if vectors.shape[0] != len(index["texts"]):
+        return None
+    return ReferenceStore(vectors, {text: row for row, text in enumerate(index["texts"])}, expected)
+
+
+def build_store(path: str, model_id: str, texts: Sequence[str],
+                encode_fn: Callable[[List[str]], np.ndarray]) -> ReferenceStore:
+    """Codifica textele si scrie atomic .npy, apoi .json (indexul valideaza fisierul doar dupa ce exista)"""
+    unique = list(dict.fromkeys(texts))
+    vectors = np.ascontiguousarray(encode_fn(unique), dtype=np.float32)
+
+    suffix = f".{os.getpid()}.tmp"  # mai multi workeri pot reconstrui in acelasi timp
+    with open(path + ".npy" + suffix, "wb") as f:
+        np.save(f, vectors)
+    os.replace(path + ".npy" + suffix, path + ".npy")
+    with open(path + ".json" + suffix, "w") as f:
+        json.dump({"model": model_id, "fingerprint": fingerprint(model_id, texts), "texts": unique},
+                  f, ensure_ascii=False)
+    os.replace(path + ".json" + suffix, path + ".json")
+
+    return load_store(path, model_id, texts)
@@ -0,0 +1,188 @@
+"""
+Re-evaluarea in masa a raspunsurilor salvate, dupa o schimbare a evaluatorului.
+
+Raspunsurile (impreuna cu intrebarea lor) sunt citite cu un cursor pe server, in bucati
+de chunk_size randuri, evaluate cu evaluate_answers_batch si salvate ca randuri noi in
+`evaluation`, sub eticheta EVALUATOR_VERSION. Evaluarile vechi raman neatinse.
+Dupa fiecare bucata se scrie un checkpoint (ultimul answer.id procesat), deci un job
+intrerupt continua de unde a ramas; raspunsurile care au deja o evaluare cu aceeasi
+versiune sunt oricum sarite.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import exists, insert, select
+
+from ..database import SessionLocal
+from ..models import Answer, Evaluation, Question
+from .evaluator import EVALUATOR_VERSION, evaluate_answers_batch, semantic_model_id
+
+REGRADE_CHUNK_SIZE = int(os.getenv("REGRADE_CHUNK_SIZE", "500"))
+# Directorul in care se pastreaza checkpoint-urile (cate un fisier per versiune de evaluator)
+REGRADE_CHECKPOINT_DIR = os.getenv("REGRADE_CHECKPOINT_DIR", ".")
+
+
+def checkpoint_path(evaluator_version: str) -> str:
+    return os.path.join(REGRADE_CHECKPOINT_DIR, f"regrade-{evaluator_version}.json")
+
+
+def load_checkpoint(path: str, evaluator_version: str) -> int:
+    """Ultimul answer.id re-evaluat pentru versiunea data (0 daca nu exista checkpoint)"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if data.get("evaluator") != evaluator_version:
+        return 0
+    return int(data.get("last_answer_id", 0))
+
+
+def save_checkpoint(path: str, evaluator_version: str, last_answer_id: int):
+    # scriere atomica: un job oprit in timpul scrierii nu lasa un fisier corupt
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"evaluator": evaluator_version, "last_answer_id": last_answer_id}, f)
+    os.replace(tmp_path, path)
+
+
+def pending_answers_query(evaluator_version: str, after_id: int = 0):
+    """Raspunsurile cu id > after_id care nu au inca o evaluare cu versiunea data, in ordinea id-ului"""
+    already_graded = exists().where(
+        Evaluation.answer_id == Answer.id,
+        Evaluation.evaluator == evaluator_version
+    )
+    return (
+        select(
+            Answer.id.label("answer_id"),
+            Answer.answer_text,
+            Question.id.label("question_id"),
+            Question.question_type,
+            Question.correct_answer,
+            Question.reference_embedding,
+            Question.reference_embedding_model,
+        )
+        .join(Question, Answer.question_id == Question.id)
+        .where(Answer.id > after_id, ~already_graded)
+        .order_by(Answer.id)
+    )
+
+
+def _grade_rows(rows):
+    """Evalueaza o bucata de randuri si intoarce valorile pentru insert-ul in `evaluation`"""
+    model_id = semantic_model_id()
+    results = evaluate_answers_batch(
+        [
+            (
+                row.correct_answer or {},
+                row.answer_text,
+                row.question_type,
+                row.reference_embedding if row.reference_embedding_model == model_id else None,
+            )
+            for row in rows
+        ],
+        question_ids=[row.question_id for row in rows],
+        # job-ul are propriul ritm (o bucata odata); limita e pentru cererile HTTP
+        admission=False
+    )
+    return [
+        {
+            "answer_id": row.answer_id,
+            "evaluator": EVALUATOR_VERSION,
+            "score": result["score"],
+            "details": result["details"],
+        }
+        for row, result in zip(rows, results)
+    ]
+
+
+def regrade_answers(chunk_size: int = REGRADE_CHUNK_SIZE,
+                    checkpoint_file: Optional[str] = None,
+                    limit: Optional[int] = None,
+                    session_factory=SessionLocal,
+                    report: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Ruleaza re-evaluarea cu EVALUATOR_VERSION si intoarce statisticile finale.
+    checkpoint_file: implicit checkpoint_path(EVALUATOR_VERSION)
+    limit: opreste dupa (aproximativ, la granita unei bucati) atatea raspunsuri
+    report: apelat dupa fiecare bucata cu statisticile curente (randuri, randuri/sec)
+    """
+    checkpoint_file = checkpoint_file or checkpoint_path(EVALUATOR_VERSION)
+    start_after = load_checkpoint(checkpoint_file, EVALUATOR_VERSION)
+
+    stats = {
+        "evaluator": EVALUATOR_VERSION,
+        "started_after_id": start_after,
+        "last_answer_id": start_after,
+        "processed": 0,
+        "chunks": 0,
+        "elapsed_seconds": 0.0,
+        "rows_per_second": 0.0,
+    }
+    started = time.perf_counter()
+
+    # citirea (cursor pe server) si scrierea folosesc conexiuni separate:
+    # commit-ul dupa fiecare bucata nu inchide cursorul
+    read_db = session_factory()
+    write_db = session_factory()
+    try:
+        query = pending_answers_query(EVALUATOR_VERSION, start_after)
+        result = read_db.execute(query.execution_options(stream_results=True, yield_per=chunk_size))
+        for rows in result.partitions(chunk_size):
+            write_db.execute(insert(Evaluation), _grade_rows(rows))
+            write_db.commit()
+
+            stats["last_answer_id"] = rows[-1].answer_id
+            save_checkpoint(checkpoint_file, EVALUATOR_VERSION, stats["last_answer_id"])
+
+            stats["processed"] += len(rows)
+            stats["chunks"] += 1
+            elapsed = time.perf_counter() - started
+            stats["elapsed_seconds"] = round(elapsed, 2)
+            stats["rows_per_second"] = round(stats["processed"] / elapsed, 1) if elapsed > 0 else 0.0
+            if report is not None:
+                report(dict(stats))
+            if limit is not None and stats["processed"] >= limit:
+                break
+    finally:
+        read_db.close()
+        write_db.close()
+    return stats
+
+
+# Starea job-ului pornit din API (un singur job pe proces)
+_job_lock = threading.Lock()
+_job_status: Dict[str, Any] = {"running": False}
+
+
+def regrade_status() -> Dict[str, Any]:
+    with _job_lock:
+        return dict(_job_status)
+
+
+def try_start_regrade_job() -> bool:
+    """Marcheaza job-ul ca pornit; False daca ruleaza deja unul"""
+    with _job_lock:
+        if _job_status.get("running"):
+            return False
+        _job_status.clear()
+        _job_status.update({"running": True, "evaluator": EVALUATOR_VERSION, "processed": 0})
+        return True
+
+
+def run_regrade_job(chunk_size: int = REGRADE_CHUNK_SIZE):
+    """Corpul job-ului din API; progresul e vizibil prin regrade_status()"""
+    def report(stats: Dict[str, Any]):
+        with _job_lock:
+            _job_status.update(stats)
+
+    try:
+        stats = regrade_answers(chunk_size, report=report)
+        report(stats)
+    except Exception as e:
+        report({"error": str(e)})
+    finally:
+        report({"running": False})
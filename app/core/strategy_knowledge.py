@@ -0,0 +1,91 @@
+"""
+Baza de cunostinte despre strategii, folosita de intrebarile THEORY (custom_question_api)
+si de depozitul de embeddings pentru textele de referinta statice (reference_store).
+"""
+from typing import Any, Dict, List, Tuple
+
+# Baza de cunoștințe despre strategii
+STRATEGY_KNOWLEDGE = {
+    "A* Search": {
+        "description": "algoritm de căutare informată care folosește euristica",
+        "characteristics": "Utilizează funcția de evaluare f(n) = g(n) + h(n)",
+        "usage": "Când avem o euristică bună pentru estimarea costului",
+        "complexity": "O(b^d) timp și spațiu în cel mai rău caz",
+        "paraphrases": [
+            "A* alege mereu nodul cu cel mai mic f(n) = g(n) + h(n): costul drumului de până acum plus estimarea euristică a costului rămas.",
+            "Căutare informată care, cu o euristică admisibilă, găsește drumul de cost minim; în cel mai rău caz timpul și memoria sunt O(b^d)."
+        ]
+    },
+    "Backtracking": {
+        "description": "tehnică recursivă de explorare sistematică a soluțiilor",
+        "characteristics": "Explorează spațiul soluțiilor și revine când găsește o stare invalidă",
+        "usage": "Când trebuie să găsim toate soluțiile sau să verificăm constrângeri",
+        "complexity": "O(k^n) în cel mai rău caz, unde k este numărul de opțiuni",
+        "paraphrases": [
+            "Construiește soluția pas cu pas, recursiv, și se întoarce la alegerea anterioară când soluția parțială încalcă o constrângere.",
+            "Încearcă pe rând toate variantele pentru fiecare pas și renunță la o ramură de îndată ce devine invalidă; în cel mai rău caz O(k^n)."
+        ]
+    },
+    "BFS": {
+        "description": "algoritm de căutare nevizată care explorează în lățime",
+        "characteristics": "Explorează nodurile nivel cu nivel folosind o coadă",
+        "usage": "Când căutăm calea cea mai scurtă în grafuri neponderate",
+        "complexity": "O(b^d) timp și spațiu",
+        "paraphrases": [
+            "Parcurge graful nivel cu nivel cu ajutorul unei cozi, deci găsește drumul cu cele mai puține muchii în grafuri neponderate.",
+            "Căutare în lățime: vizitează întâi toți vecinii nodului curent, apoi vecinii acestora; timp și memorie O(b^d)."
+        ]
+    },
+    "DFS": {
+        "description": "algoritm de căutare nevizată care explorează în adâncime",
+        "characteristics": "Explorează pe o ramură cât mai adânc posibil înainte de backtrack",
+        "usage": "Când spațiul soluțiilor este adânc și soluțiile sunt frecvente",
+        "complexity": "O(b^m) timp și O(bm) spațiu",
+        "paraphrases": [
+            "Merge pe o ramură cât mai adânc, folosind o stivă sau recursivitate, și revine doar când nu mai are unde înainta.",
+            "Căutare în adâncime cu memorie mică, O(bm), dar care nu garantează drumul cel mai scurt; timpul este O(b^m)."
+        ]
+    },
+    "Programare Dinamica": {
+        "description": "metodă de rezolvare prin descompunere în subprobleme suprapuse",
+        "characteristics": "Memorează soluțiile subproblemelor pentru a evita recalcularea",
+        "usage": "Când problema are subprobleme suprapuse și substructură optimă",
+        "complexity": "Depinde de problema specifică, de obicei O(n^2) sau O(n*m)",
+        "paraphrases": [
+            "Împarte problema în subprobleme care se repetă și păstrează rezultatul fiecăreia într-un tabel, ca să nu fie recalculată.",
+            "Soluția optimă se obține din soluțiile optime ale subproblemelor, calculate o singură dată prin memoizare sau de jos în sus."
+        ]
+    },
+    "Greedy": {
+        "description": "algoritm care face alegeri local optime la fiecare pas",
+        "characteristics": "Ia decizia cea mai bună în momentul curent fără să privească înainte",
+        "usage": "Când alegerea locală optimă conduce la soluția globală optimă",
+        "complexity": "Variază, de obicei O(n log n) sau O(n^2)",
+        "paraphrases": [
+            "La fiecare pas alege varianta care pare cea mai bună acum, fără să revină asupra deciziilor luate.",
+            "Construiește soluția prin alegeri locale optime; este rapid, dar dă optimul global doar pentru problemele cu proprietatea de alegere greedy."
+        ]
+    },
+    "Divide et Impera": {
+        "description": "metodă care împarte problema în subprobleme mai mici",
+        "characteristics": "Divide problema, rezolvă subproblemele și combină rezultatele",
+        "usage": "Când problema poate fi împărțită în subprobleme independente",
+        "complexity": "De obicei O(n log n)",
+        "paraphrases": [
+            "Împarte problema în subprobleme independente mai mici, le rezolvă recursiv și combină rezultatele, ca la sortarea prin interclasare.",
+            "Problema se descompune până la cazuri simple, rezolvate direct, iar soluțiile parțiale se combină; de obicei O(n log n)."
+        ]
+    }
+}
+
+
+def theory_reference_texts(strategy_name: str, strategy_info: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """Textul de referinta al unei intrebari THEORY cu raspuns text si parafrazele lui"""
+    reference_text = (
+        f"{strategy_name} este un {strategy_info['description']}. "
+        f"{strategy_info['characteristics']}. "
+        f"Se folosește {strategy_info['usage']}. "
+        f"Complexitatea este {strategy_info['complexity']}."
+    )
+    paraphrases = [f"{strategy_name}: {paraphrase}" for paraphrase in strategy_info["paraphrases"]]
+    return reference_text, paraphrases
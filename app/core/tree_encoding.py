@@ -0,0 +1,87 @@
+"""
+Codificarea compacta a arborilor MINIMAX_TREE (problem_instance["tree"]), folosita la
+salvare si in raspunsurile API:
+
+    {"encoding": "level_order", "types": "XNNLLLL", "arity": [2, 2, 2], "values": [3, 7, 1, 9]}
+
+Nodurile sunt in ordinea parcurgerii pe niveluri (BFS), iar id-ul unui nod e pozitia lui.
+- types:  cate un caracter pe nod: X = MAX, N = MIN, L = frunza
+- arity:  numarul de copii al fiecarui nod intern, in ordinea nodurilor
+- values: valorile frunzelor, in ordinea nodurilor
+
+Formatul vechi (dictionare imbricate, cu id-uri aleatoare) se converteste cu encode_tree;
+intrebarile deja salvate se convertesc cu python -m cli.encode_minimax_trees.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .minimax_solver import LEAF, MAX_NODE, MIN_NODE, FlatTree, flatten_tree
+
+TREE_ENCODING = "level_order"
+
+_TYPE_CHARS = {MAX_NODE: "X", MIN_NODE: "N", LEAF: "L"}
+_CHAR_TYPES = {char: kind for kind, char in _TYPE_CHARS.items()}
+_TYPE_NAMES = {MAX_NODE: "MAX", MIN_NODE: "MIN"}
+
+
+def is_encoded(tree: Dict[str, Any]) -> bool:
+    return isinstance(tree, dict) and tree.get("encoding") == TREE_ENCODING
+
+
+def encode_flat_tree(flat: FlatTree) -> Dict[str, Any]:
+    kind = flat.kind
+    return {
+        "encoding": TREE_ENCODING,
+        "types": "".join(_TYPE_CHARS[k] for k in kind.tolist()),
+        "arity": flat.child_count[kind != LEAF].tolist(),
+        "values": flat.value[kind == LEAF].tolist(),
+    }
+
+
+def encode_tree(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Arborele imbricat (sau deja codificat) in forma compacta"""
+    if is_encoded(tree):
+        return tree
+    return encode_flat_tree(flatten_tree(tree))
+
+
+def decode_flat_tree(encoded: Dict[str, Any]) -> FlatTree:
+    """Forma compacta direct in tablourile solver-ului (fara dictionare intermediare)"""
+    kind = np.array([_CHAR_TYPES[c] for c in encoded["types"]], dtype=np.int8)
+    internal = kind != LEAF
+
+    child_count = np.zeros(kind.shape[0], dtype=np.int64)
+    child_count[internal] = encoded["arity"]
+    # copiii nodului i urmeaza imediat dupa copiii nodurilor dinaintea lui (radacina e nodul 0)
+    first_child = np.cumsum(child_count) - child_count + 1
+    first_child[~internal] = 0
+
+    values = encoded["values"]
+    value_dtype = np.int64 if all(isinstance(v, int) for v in values) else np.float64
+    value = np.zeros(kind.shape[0], dtype=value_dtype)
+    value[~internal] = values
+    return FlatTree(kind, first_child, child_count, value)
+
+
+def decode_tree(encoded: Dict[str, Any]) -> Dict[str, Any]:
+    """Forma compacta inapoi in dictionare imbricate; id-ul fiecarui nod e pozitia lui (n0, n1, ...)"""
+    flat = decode_flat_tree(encoded)
+    kinds = flat.kind.tolist()
+    values = flat.value.tolist()
+    nodes: List[Dict[str, Any]] = []
+    for position, kind in enumerate(kinds):
+        if kind == LEAF:
+            nodes.append({"id": f"n{position}", "value": values[position]})
+        else:
+            nodes.append({"id": f"n{position}", "type": _TYPE_NAMES[kind], "children": []})
+
+    for position, (first, count) in enumerate(zip(flat.first_child.tolist(), flat.child_count.tolist())):
+        if count:
+            nodes[position]["children"] = nodes[first:first + count]
+    return nodes[0]
+
+
+def to_flat_tree(tree: Dict[str, Any]) -> FlatTree:
+    """Arborele din problem_instance (codificat sau in formatul vechi) ca FlatTree"""
+    return decode_flat_tree(tree) if is_encoded(tree) else flatten_tree(tree)
@@ -1,7 +1,13 @@
+import threading
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import generator_api, answer_api, custom_question_api, test_api
-from .database import engine, Base
+from .routers import generator_api, answer_api, custom_question_api, test_api, health_api, admin_api
+from .database import engine, Base, SessionLocal
+from .core.answer_index import ANSWER_INDEX_ENABLED
+from .core.evaluator import SEMANTIC_MODEL_ENABLED, SEMANTIC_MODEL_WARMUP, rebuild_answer_index, warmup_semantic_model
+from .core.metrics import render_metrics
 
 Base.metadata.create_all(bind=engine)
 
@@ -20,6 +26,30 @@ app.include_router(generator_api.router, prefix="/api", tags=["generator"])
 app.include_router(answer_api.router, prefix="/api", tags=["answers"])
 app.include_router(custom_question_api.router, prefix="/api", tags=["custom-questions"])
 app.include_router(test_api.router, prefix="/api", tags=["tests"])
+app.include_router(health_api.router, prefix="/api", tags=["health"])
+app.include_router(admin_api.router, prefix="/api", tags=["admin"])
+
+
+@app.on_event("startup")
+def warmup_models():
+    # Modelul se incarca in fundal: serverul porneste imediat, iar /api/health/ready
+    # raporteaza cand evaluarea semantica este disponibila
+    if SEMANTIC_MODEL_ENABLED and SEMANTIC_MODEL_WARMUP:
+        threading.Thread(target=_warmup, name="semantic-warmup", daemon=True).start()
+
+
+def _warmup():
+    warmup_semantic_model()
+    if ANSWER_INDEX_ENABLED:
+        # indexul raspunsurilor evaluate se reface din baza de date dupa fiecare repornire
+        rebuild_answer_index(SessionLocal)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    # format text Prometheus (evaluari pe tip/ramura, latente, encode-uri, cache-uri)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 
 @app.get("/")
 def read_root():
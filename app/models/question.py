@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, BigInteger, Integer, Text, ForeignKey, Table,
-    JSON, DateTime, Boolean, SmallInteger, func
+    JSON, DateTime, Boolean, SmallInteger, LargeBinary, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -30,6 +30,10 @@ class Question(Base):
     correct_answer = Column(JSONB)
     reference_solution = Column(Text)
 
+    # embedding-ul (float16) al correct_answer["reference_text"], calculat la generare
+    reference_embedding = Column(LargeBinary)
+    reference_embedding_model = Column(Text)
+
     generated_by = Column(Text)
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
     protected = Column(Boolean, default=False)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+
+from ..database import SessionLocal
+from ..core.evaluator import answer_index_stats, rebuild_answer_index
+from ..core.regrade import REGRADE_CHUNK_SIZE, regrade_status, run_regrade_job, try_start_regrade_job
+
+router = APIRouter()
+
+
+@router.post("/admin/regrade", status_code=202)
+def start_regrade(background_tasks: BackgroundTasks, chunk_size: int = REGRADE_CHUNK_SIZE):
+    """
+    Porneste re-evaluarea tuturor raspunsurilor cu evaluatorul curent, in fundal.
+    Pentru volume mari se recomanda CLI-ul (python -m cli.regrade_answers).
+    """
+    if chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size trebuie sa fie pozitiv")
+    if not try_start_regrade_job():
+        raise HTTPException(status_code=409, detail="O re-evaluare este deja in curs")
+    background_tasks.add_task(run_regrade_job, chunk_size)
+    return regrade_status()
+
+
+@router.get("/admin/regrade")
+def get_regrade_status():
+    """Progresul ultimei re-evaluari pornite din API (randuri procesate, randuri/sec)"""
+    return regrade_status()
+
+
+@router.post("/admin/answer-index/rebuild", status_code=202)
+def start_answer_index_rebuild(background_tasks: BackgroundTasks):
+    """Reface in fundal indexul raspunsurilor evaluate semantic (ANSWER_INDEX_ENABLED=1)"""
+    background_tasks.add_task(rebuild_answer_index, SessionLocal)
+    return answer_index_stats()
+
+
+@router.get("/admin/answer-index")
+def get_answer_index_stats():
+    """Dimensiunea indexului si cate evaluari au fost refolosite"""
+    return answer_index_stats()
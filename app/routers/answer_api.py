@@ -2,7 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from ..database import get_db
 from .. import models, schemas
-from ..core.evaluator import evaluate_answer
+from ..core.evaluator import (
+    evaluate_answer, stored_reference_embedding, set_reference_embedding, inference_stats, cache_stats,
+    SemanticModelUnavailable, SemanticOverloaded, EVALUATOR_VERSION
+)
 import json
 
 router = APIRouter()
@@ -15,7 +18,7 @@ def submit_answer(
 ):
     """
     Acest endpoint primește un răspuns de la utilizator,
-    îl salvează în baza de date și apoi îl evaluează.
+    îl evaluează și apoi salvează răspunsul și evaluarea în baza de date.
     """
 
     # 1. Găsește întrebarea în baza de date
@@ -24,17 +27,7 @@ def submit_answer(
     if not question:
         raise HTTPException(status_code=404, detail="Întrebarea nu a fost găsită.")
 
-    # 2. Salvează răspunsul utilizatorului în tabela 'answer'
-    new_answer = models.Answer(
-        question_id=submission.question_id,
-        answer_text=submission.user_answer,
-        source='USER_UI'  # Setează sursa conform modelului tău
-    )
-    db.add(new_answer)
-    db.commit()
-    db.refresh(new_answer)
-
-    # 3. Evaluează algoritmic răspunsul
+    # 2. Evaluează algoritmic răspunsul
     # Extrage răspunsul corect (stocat ca JSON) din întrebare
     correct_answer_json = question.correct_answer
 
@@ -46,16 +39,35 @@ def submit_answer(
         if hasattr(question.question_type, "name")
         else question.question_type
     )
-    # Apelează algoritmul de evaluare
-    evaluation_result = evaluate_answer(correct_answer_json, submission.user_answer,question_type )
+    # Embedding-ul referintei e calculat la generare; pentru intrebarile vechi e calculat in
+    # pasul semantic (doar daca raspunsul ajunge acolo) si salvat odata cu evaluarea (commit-ul de mai jos)
+    try:
+        evaluation_result = evaluate_answer(
+            correct_answer_json, submission.user_answer, question_type,
+            reference_embedding=stored_reference_embedding(question),
+            question_id=question.id,
+            on_reference_embedding=lambda blob: set_reference_embedding(question, blob)
+        )
+    except SemanticModelUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except SemanticOverloaded as e:
+        # nimic nu a fost salvat inca: clientul retrimite acelasi raspuns dupa Retry-After
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
 
-    # 4. Salvează rezultatul evaluării în tabela 'evaluation'
+    # 3. Salvează răspunsul și rezultatul evaluării (tabelele 'answer' și 'evaluation')
+    # intr-un singur commit, deci nu raman raspunsuri fara evaluare
+    new_answer = models.Answer(
+        question_id=submission.question_id,
+        answer_text=submission.user_answer,
+        source='USER_UI'  # Setează sursa conform modelului tău
+    )
     new_evaluation = models.Evaluation(
-        answer_id=new_answer.id,
-        evaluator="algorithmic_evaluator_v1",  # Poți schimba asta
+        answer=new_answer,
+        evaluator=EVALUATOR_VERSION,
         score=evaluation_result["score"],
         details=evaluation_result["details"]  # Salvează detaliile (ex: cuvinte cheie găsite)
     )
+    db.add(new_answer)
     db.add(new_evaluation)
     db.commit()
 
@@ -63,7 +75,7 @@ def submit_answer(
     if "answer" in correct_answer_json:
         correct_answer_text = correct_answer_json["answer"]
 
-    # 5. Returnează rezultatul evaluării la frontend
+    # 4. Returnează rezultatul evaluării la frontend
     return schemas.EvaluationResult(
         is_correct=evaluation_result["is_correct"],
         score=evaluation_result["score"],
@@ -72,3 +84,20 @@ def submit_answer(
         correct_answer=correct_answer_text
     )
 
+
+@router.get("/answer/inference-stats")
+def get_inference_stats():
+    """
+    Statistici ale cozii de inferenta a modelului semantic:
+    adancimea cozii si dimensiunea loturilor procesate.
+    """
+    return inference_stats()
+
+
+@router.get("/answer/cache-stats")
+def get_cache_stats():
+    """
+    Hit/miss pentru cache-ul de embeddings ale raspunsurilor
+    si pentru cache-ul de rezultate (intrebare, raspuns normalizat).
+    """
+    return cache_stats()
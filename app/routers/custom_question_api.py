@@ -5,6 +5,8 @@ import random
 from ..database import get_db
 from .. import models, schemas
 from ..question_patterns import QUESTION_PATTERNS
+from ..core.evaluator import ensure_reference_embedding
+from ..core.strategy_knowledge import STRATEGY_KNOWLEDGE, theory_reference_texts
 
 try:
     from ..core.minimax_generator import genereaza_intrebare_minimax
@@ -16,52 +18,6 @@ try:
 except ImportError:
     genereaza_intrebare_nash = None
 
-# Baza de cunoștințe despre strategii
-STRATEGY_KNOWLEDGE = {
-    "A* Search": {
-        "description": "algoritm de căutare informată care folosește euristica",
-        "characteristics": "Utilizează funcția de evaluare f(n) = g(n) + h(n)",
-        "usage": "Când avem o euristică bună pentru estimarea costului",
-        "complexity": "O(b^d) timp și spațiu în cel mai rău caz"
-    },
-    "Backtracking": {
-        "description": "tehnică recursivă de explorare sistematică a soluțiilor",
-        "characteristics": "Explorează spațiul soluțiilor și revine când găsește o stare invalidă",
-        "usage": "Când trebuie să găsim toate soluțiile sau să verificăm constrângeri",
-        "complexity": "O(k^n) în cel mai rău caz, unde k este numărul de opțiuni"
-    },
-    "BFS": {
-        "description": "algoritm de căutare nevizată care explorează în lățime",
-        "characteristics": "Explorează nodurile nivel cu nivel folosind o coadă",
-        "usage": "Când căutăm calea cea mai scurtă în grafuri neponderate",
-        "complexity": "O(b^d) timp și spațiu"
-    },
-    "DFS": {
-        "description": "algoritm de căutare nevizată care explorează în adâncime",
-        "characteristics": "Explorează pe o ramură cât mai adânc posibil înainte de backtrack",
-        "usage": "Când spațiul soluțiilor este adânc și soluțiile sunt frecvente",
-        "complexity": "O(b^m) timp și O(bm) spațiu"
-    },
-    "Programare Dinamica": {
-        "description": "metodă de rezolvare prin descompunere în subprobleme suprapuse",
-        "characteristics": "Memorează soluțiile subproblemelor pentru a evita recalcularea",
-        "usage": "Când problema are subprobleme suprapuse și substructură optimă",
-        "complexity": "Depinde de problema specifică, de obicei O(n^2) sau O(n*m)"
-    },
-    "Greedy": {
-        "description": "algoritm care face alegeri local optime la fiecare pas",
-        "characteristics": "Ia decizia cea mai bună în momentul curent fără să privească înainte",
-        "usage": "Când alegerea locală optimă conduce la soluția globală optimă",
-        "complexity": "Variază, de obicei O(n log n) sau O(n^2)"
-    },
-    "Divide et Impera": {
-        "description": "metodă care împarte problema în subprobleme mai mici",
-        "characteristics": "Divide problema, rezolvă subproblemele și combină rezultatele",
-        "usage": "Când problema poate fi împărțită în subprobleme independente",
-        "complexity": "De obicei O(n log n)"
-    }
-}
-
 router = APIRouter()
 
 CHAPTER_BY_PATTERN = {
@@ -112,6 +68,7 @@ def handle_custom_question(
         # Creăm întrebarea
         new_question = models.Question(**question_data)
         new_question.chapters.append(chapter_db)
+        ensure_reference_embedding(new_question)
         
         db.add(new_question)
         db.commit()
@@ -154,6 +111,7 @@ def handle_custom_question(
         # Creăm întrebarea
         new_question = models.Question(**question_data)
         new_question.chapters.append(chapter_db)
+        ensure_reference_embedding(new_question)
         
         db.add(new_question)
         db.commit()
@@ -225,7 +183,7 @@ def handle_custom_question(
                 # Răspunsul corect: domeniul fără valoarea asignată
                 correct_vals = [v for v in domain_vals if v != assigned_value]
                 correct_str = "{" + ", ".join(correct_vals) + "}"
-                correct_answer = {"answer": correct_str}
+                correct_answer = {"answer": correct_str, "key": sorted(correct_vals)}
                 
                 # Generăm opțiuni distractor
                 options = [correct_str]
@@ -376,20 +334,20 @@ def handle_custom_question(
                 desc_words = strategy_info['description'].lower().split()
                 keywords.extend([w for w in desc_words if len(w) > 4])
                 
-                reference_text = (
-                    f"{strategy_name} este un {strategy_info['description']}. "
-                    f"{strategy_info['characteristics']}. "
-                    f"Se folosește {strategy_info['usage']}. "
-                    f"Complexitatea este {strategy_info['complexity']}."
-                )
+                reference_text, paraphrases = theory_reference_texts(strategy_name, strategy_info)
             else:
                 keywords = [strategy_name.lower(), "algoritm", "strategie", "rezolvare", "problema"]
                 reference_text = f"{strategy_name} este o strategie de rezolvare a problemelor care necesită o abordare sistematică."
             
             correct_answer = {
                 "keywords": list(set(keywords)),
-                "reference_text": reference_text
+                "reference_text": reference_text,
+                # cuvintele din descriere conteaza doar intregi ("cost" nu se potriveste in "costisitor")
+                "whole_word_keywords": True
             }
+            if strategy_info:
+                # formulari alternative ale raspunsului corect (scorul semantic e maximul)
+                correct_answer["reference_texts"] = paraphrases
             
         elif pattern_type == "STRATEGY":
             problem_name = inputs.get("problem_name", "Problema")
@@ -460,7 +418,7 @@ def handle_custom_question(
                     pass
                 
                 correct_answer_set = "{" + ", ".join(remaining_values) + "}"
-                correct_answer = {"answer": correct_answer_set}
+                correct_answer = {"answer": correct_answer_set, "key": sorted(remaining_values)}
                 reference_solution = f"Răspunsul corect: {correct_answer_set}"
                 
             elif pattern_id == "MRV":
@@ -491,7 +449,7 @@ def handle_custom_question(
                     vars_list = [v.strip() for v in variables_str.split(",") if v.strip()]
                     correct_answer_set = vars_list[0] if vars_list else "X"
                 
-                correct_answer = {"answer": correct_answer_set}
+                correct_answer = {"answer": correct_answer_set, "key": [correct_answer_set]}
                 reference_solution = f"Răspunsul corect: {correct_answer_set}"
                 
             elif pattern_id == "AC3":
@@ -560,7 +518,7 @@ def handle_custom_question(
                 else:
                     correct_answer_set = "Mulțimea vidă"
                 
-                correct_answer = {"answer": correct_answer_set}
+                correct_answer = {"answer": correct_answer_set, "key": sorted(remaining_values)}
                 reference_solution = f"Răspunsul corect: {correct_answer_set}"
             
             else:
@@ -627,6 +585,7 @@ def handle_custom_question(
 
     new_question = models.Question(**qdata)
     new_question.chapters.append(chapter_db)
+    ensure_reference_embedding(new_question)
 
     db.add(new_question)
     db.commit()
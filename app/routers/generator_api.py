@@ -2,6 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..core.generator import genereaza_intrebare_strategie
+from ..core.evaluator import ensure_reference_embedding
+from ..core.minimax_generator import ALPHABETA_TRACE_KEY
+from ..core.minimax_solver import FlatMinMaxSolver
+from ..core.tree_encoding import to_flat_tree
 from .. import models, schemas
 
 
@@ -44,6 +48,7 @@ def handle_generate_strategy_question(
     # Creează întrebarea
     new_question = models.Question(**question_data)
     new_question.chapters.append(chapter_db)
+    ensure_reference_embedding(new_question)
 
     db.add(new_question)
     db.commit()
@@ -68,4 +73,31 @@ def handle_generate_strategy_question(
     if options:
         question_dict["options"] = options
 
-    return question_dict
\ No newline at end of file
+    return question_dict
+
+
+@router.get("/questions/{question_id}/alphabeta-trace")
+def get_alphabeta_trace(question_id: int, db: Session = Depends(get_db)):
+    """
+    Traseul Alpha-Beta al unei intrebari MINIMAX_TREE (ordinea frunzelor vizitate,
+    alpha/beta/valoarea la iesirea din fiecare nod intern, muchiile taiate).
+    Se calculeaza o singura data: la generare sau, pentru intrebarile mai vechi, la prima cerere.
+    """
+    question = db.get(models.Question, question_id)
+    if question is None:
+        raise HTTPException(status_code=404, detail="Întrebarea nu există")
+    if question.question_type != models.QuestionTypeEnum.MINIMAX_TREE:
+        raise HTTPException(status_code=400, detail="Traseul există doar pentru întrebările MINIMAX_TREE")
+
+    metadata = question.metadata_ or {}
+    trace = metadata.get(ALPHABETA_TRACE_KEY)
+    if trace is None:
+        tree = (question.problem_instance or {}).get("tree")
+        if not tree:
+            raise HTTPException(status_code=400, detail="Întrebarea nu are arbore")
+        _, _, trace = FlatMinMaxSolver(to_flat_tree(tree)).solve_traced()
+        # dict nou: coloana JSONB nu urmareste modificarile in loc
+        question.metadata_ = dict(metadata, **{ALPHABETA_TRACE_KEY: trace})
+        db.commit()
+
+    return {"question_id": question.id, "trace": trace}
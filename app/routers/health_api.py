@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ..core.evaluator import SEMANTIC_MODEL_ENABLED, SEMANTIC_MODEL_NAME, SEMANTIC_BACKEND, is_semantic_model_loaded
+
+router = APIRouter()
+
+
+@router.get("/health/live")
+def liveness():
+    """Procesul raspunde (nu depinde de modelul semantic)."""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def readiness():
+    """
+    Worker-ul e gata sa evalueze raspunsuri text.
+    Un worker doar pentru generare (SEMANTIC_MODEL_ENABLED=0) e mereu gata;
+    altfel raspunde 503 pana cand modelul semantic e incarcat.
+    """
+    loaded = is_semantic_model_loaded()
+    ready = loaded or not SEMANTIC_MODEL_ENABLED
+    body = {
+        "ready": ready,
+        "semantic_model": {
+            "name": SEMANTIC_MODEL_NAME,
+            "backend": SEMANTIC_BACKEND,
+            "enabled": SEMANTIC_MODEL_ENABLED,
+            "loaded": loaded
+        }
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
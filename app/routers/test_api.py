@@ -10,7 +10,10 @@ from ..schemas import GenerationRequest, AnswerSubmission, EvaluationResult
 
 # Import corect pentru generator din app/core/
 from ..core.generator import genereaza_intrebare_strategie
-from ..core.evaluator import evaluate_answer
+from ..core.evaluator import (
+    evaluate_answers_batch, stored_reference_embedding, set_reference_embedding, SemanticModelUnavailable,
+    SemanticOverloaded
+)
 
 router = APIRouter()
 
@@ -50,7 +53,8 @@ def generate_test(num_questions: int = 5, difficulty: int = 2,db: Session = Depe
                 difficulty=question_data.get("difficulty", difficulty),
                 problem_instance=problem_instance_data,
                 correct_answer=question_data["correct_answer"],
-                reference_solution=question_data["reference_solution"]
+                reference_solution=question_data["reference_solution"],
+                metadata_=question_data.get("metadata_")
             )
             db.add(db_question)
             db.commit()
@@ -101,22 +105,41 @@ def submit_test(
     total_score = 0
     correct_count = 0
 
+    # Găsim toate întrebările din DB
+    questions = {
+        q.id: q for q in db.query(Question).filter(Question.id.in_(list(answers.keys()))).all()
+    }
+
+    graded = []
     for question_id, user_answer in answers.items():
-        # Găsim întrebarea în DB
-        db_question = db.query(Question).filter(Question.id == question_id).first()
+        db_question = questions.get(question_id)
         if not db_question:
             results[question_id] = {
                 "error": "Question not found"
             }
             continue
-
-        # Evaluăm răspunsul
-        evaluation = evaluate_answer(
-            db_question.correct_answer,
-            user_answer,
-            db_question.question_type
-        )
-
+        graded.append((question_id, db_question, user_answer))
+
+    # Evaluăm toate răspunsurile deodată (un singur apel al modelului semantic).
+    # Referintele intrebarilor vechi (fara embedding) sunt codificate in acelasi apel,
+    # doar daca raspunsul ajunge la evaluarea semantica, si salvate la commit-ul de mai jos
+    try:
+        evaluations = evaluate_answers_batch([
+            (
+                db_question.correct_answer,
+                user_answer,
+                db_question.question_type,
+                stored_reference_embedding(db_question)
+            )
+            for _, db_question, user_answer in graded
+        ], question_ids=[question_id for question_id, _, _ in graded],
+           on_reference_embedding=lambda i, blob: set_reference_embedding(graded[i][1], blob))
+    except SemanticModelUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except SemanticOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    for (question_id, db_question, user_answer), evaluation in zip(graded, evaluations):
         results[question_id] = {
             "is_correct": evaluation["is_correct"],
             "score": evaluation["score"],
@@ -129,6 +152,9 @@ def submit_test(
         if evaluation["is_correct"]:
             correct_count += 1
 
+    # Salvam embedding-urile de referinta calculate acum pentru intrebarile vechi
+    db.commit()
+
     num_questions = len(answers)
     average_score = total_score / num_questions if num_questions > 0 else 0
 
@@ -0,0 +1,47 @@
+import unicodedata
+
+
+def _normalize_text_slow(text: str) -> str:
+    """Varianta de referinta (NFD + eliminarea semnelor Mn); normalize_text da acelasi rezultat"""
+    text = ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if unicodedata.category(c) != 'Mn'
+    )
+    return text.lower()
+
+
+# Caracterele a caror descompunere contine un semn combinant care nu e Mn (ex. U+1D165):
+# NFD le poate reordona cu caracterele vecine, deci textele care le contin merg pe varianta lenta
+_REORDERING = set()
+
+
+class _StripMarks(dict):
+    """
+    Tabela pentru str.translate: caracter -> descompunerea lui NFD fara semnele Mn.
+    Diacriticele romanesti si Latin-1/Latin Extended sunt precalculate; celelalte
+    caractere se calculeaza la prima aparitie si raman in tabela.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed = unicodedata.normalize('NFD', chr(codepoint))
+        if any(unicodedata.combining(c) and unicodedata.category(c) != 'Mn' for c in decomposed):
+            _REORDERING.add(chr(codepoint))
+        stripped = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+        self[codepoint] = stripped
+        return stripped
+
+
+_STRIP_MARKS = _StripMarks()
+for _codepoint in range(0x80, 0x250):
+    _STRIP_MARKS[_codepoint]
+
+
+def normalize_text(text: str) -> str:
+    """elimina diacritice, normalizeaza textul"""
+    if text.isascii():
+        return text.lower()
+    stripped = text.translate(_STRIP_MARKS)
+    if _REORDERING and not _REORDERING.isdisjoint(text):
+        return _normalize_text_slow(text)
+    # lower() pe tot textul, ca in varianta de referinta (sigma finala depinde de context)
+    return stripped.lower()
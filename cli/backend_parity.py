@@ -0,0 +1,63 @@
+"""
+Verifica abaterea scorurilor de similaritate ale unui backend de embeddings
+fata de modelul fp32 (PyTorch), pe un corpus fix de perechi (raspuns, referinta).
+
+Rulare (din radacina proiectului):
+    python -m cli.backend_parity --backend onnx-int8
+"""
+import argparse
+import json
+
+from app.core.embedding_backends import BACKENDS, load_backend, parity_report
+from app.core.evaluator import SEMANTIC_MODEL_NAME
+from app.core.generator import TEXT_KNOWLEDGE
+
+# Raspunsuri tipice (corecte, partiale, gresite) pentru fiecare descriere din TEXT_KNOWLEDGE
+SAMPLE_ANSWERS = {
+    "A* Search": [
+        "A* foloseste f(n) = g(n) + h(n), costul drumului plus o euristica, si gaseste calea optima.",
+        "Este un algoritm de cautare care foloseste o euristică.",
+        "Sorteaza elementele dintr-un vector.",
+    ],
+    "Backtracking": [
+        "Backtracking exploreaza recursiv solutiile si revine cand ajunge intr-o stare invalida.",
+        "Incearca toate variantele.",
+        "Calculeaza drumul minim intr-un graf ponderat cu Dijkstra.",
+    ],
+    "CSP (Constraint Satisfaction)": [
+        "O problema CSP are variabile, domenii si constrângeri; căutăm o atribuire consistentă.",
+        "Se lucreaza cu variabile.",
+        "Este un protocol de retea.",
+    ],
+    "Programare Dinamica": [
+        "Imparte problema in subprobleme suprapuse si memoreaza rezultatele intr-un tabel.",
+        "Foloseste memoizare.",
+        "Alege mereu optiunea locala cea mai buna fara sa revina.",
+    ],
+}
+
+
+def parity_pairs():
+    pairs = []
+    for entry in TEXT_KNOWLEDGE:
+        for answer in SAMPLE_ANSWERS.get(entry["strategy_name"], []):
+            pairs.append((answer, entry["description"]))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", required=True, choices=sorted(BACKENDS))
+    parser.add_argument("--reference", default="torch", choices=sorted(BACKENDS))
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    reference = load_backend(args.reference, SEMANTIC_MODEL_NAME)
+    candidate = load_backend(args.backend, SEMANTIC_MODEL_NAME)
+    report = parity_report(reference, candidate, parity_pairs(), repeats=args.repeats)
+    report.update({"reference": args.reference, "backend": args.backend, "model": SEMANTIC_MODEL_NAME})
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
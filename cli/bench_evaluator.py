@@ -0,0 +1,195 @@
+"""
+Benchmark pentru evaluator: raspunsuri/sec si latenta p50/p95/p99 pe fiecare ramura
+(match_type), separat pentru evaluarea structurala si cea semantica (model).
+
+Corpusul e generat cu seed fix din generatoarele de intrebari (MinMax, Nash, CSP,
+strategii), cu raspunsuri corecte, partiale si gresite, deci doua rulari pe commit-uri
+diferite masoara acelasi lucru. Rezultatul JSON poate fi comparat cu diff.
+
+Rulare (din radacina proiectului):
+    python -m cli.bench_evaluator --output bench.json
+    python -m cli.bench_evaluator --structural-only     # fara modelul semantic
+"""
+import os
+
+# se masoara evaluatorul, nu cache-urile (cache-ul de gradere ramane, ca in productie)
+os.environ.setdefault("RESULT_CACHE_SIZE", "0")
+os.environ.setdefault("EMBEDDING_CACHE_SIZE", "0")
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from app.core.csp_generator import genereaza_problema_csp
+from app.core.evaluator import SEMANTIC_BACKEND, SEMANTIC_MODEL_NAME, evaluate_answer
+from app.core.generator import genereaza_intrebare_strategie
+from app.core.graders import SemanticRequest, compile_grader
+from app.core.minimax_generator import genereaza_intrebare_minimax
+from app.core.nash_generator import genereaza_intrebare_nash
+
+UNRELATED_ANSWER = "Nu stiu, probabil se sorteaza elementele crescator."
+
+
+def minimax_answers(question):
+    ca = question["correct_answer"]
+    root, leaves = ca["root_value"], ca["visited_leaves"]
+    return [
+        f"Radacina are valoarea {root}. Au fost vizitate {leaves} frunze.",
+        f"{root} si {leaves}",
+        f"Radacina are valoarea {root}.",
+        f"Radacina are valoarea {leaves}. Au fost vizitate {root} frunze.",
+        f"Radacina are valoarea {root + 3}. Au fost vizitate {leaves + 2} frunze.",
+        f"Am calculat pe rand 4, 7, {root} si in final {leaves} frunze vizitate.",
+        UNRELATED_ANSWER,
+    ]
+
+
+def nash_answers(question):
+    ca = question["correct_answer"]
+    correct = ca.get("answer") or ca.get("answer_text")
+    answers = [correct, "Nu exista echilibru Nash pur", UNRELATED_ANSWER]
+    answers += [opt for opt in question.get("options") or [] if opt != correct][:2]
+    if ca.get("reference_text"):
+        answers.append("Verific fiecare celula si aleg best response pentru ambii jucatori.")
+    return answers
+
+
+def csp_answers(question):
+    ca = question["correct_answer"]
+    answers = [ca["answer"], UNRELATED_ANSWER]
+    answers += [opt for opt in question.get("options") or [] if opt != ca["answer"]][:2]
+    key = ca.get("key") or []
+    if len(key) > 1:
+        answers.append("{" + ", ".join(reversed(key)) + "}")
+        answers.append("{" + ", ".join(key[:-1]) + "}")
+    return answers
+
+
+def strategy_answers(question):
+    ca = question["correct_answer"]
+    if "reference_text" in ca:
+        reference = ca["reference_text"]
+        return [reference, reference[:len(reference) // 2], UNRELATED_ANSWER]
+    answers = [ca["answer"], ca["answer"].upper()]
+    answers += [opt for opt in question.get("options") or [] if opt != ca["answer"]][:2]
+    return answers
+
+
+def build_corpus(seed: int, questions_per_kind: int):
+    """Lista de (question_id, question_type, correct_answer, raspuns), determinista pentru un seed"""
+    random.seed(seed)
+    kinds = [
+        (lambda: genereaza_intrebare_minimax(answer_type="multiple", difficulty=random.randint(1, 3)), minimax_answers),
+        (lambda: genereaza_intrebare_minimax(answer_type="text", difficulty=random.randint(1, 3)), minimax_answers),
+        (lambda: genereaza_intrebare_nash(answer_type="multiple", difficulty=random.randint(1, 3)), nash_answers),
+        (lambda: genereaza_intrebare_nash(answer_type="text", difficulty=random.randint(1, 3)), nash_answers),
+        (lambda: genereaza_problema_csp(difficulty=random.randint(1, 3)), csp_answers),
+        (lambda: genereaza_intrebare_strategie(answer_type="multiple", difficulty=random.randint(1, 3)), strategy_answers),
+        (lambda: genereaza_intrebare_strategie(answer_type="text", difficulty=random.randint(1, 3)), strategy_answers),
+    ]
+    corpus = []
+    question_id = 0
+    for generate, make_answers in kinds:
+        for _ in range(questions_per_kind):
+            question = generate()
+            question_id += 1
+            for answer in make_answers(question):
+                corpus.append((question_id, question["question_type"], question["correct_answer"], answer))
+    return corpus
+
+
+def needs_model(question_type, correct_answer, answer) -> bool:
+    return isinstance(compile_grader(correct_answer, question_type).grade(answer), SemanticRequest)
+
+
+def summarize(latencies_ms):
+    latencies = np.asarray(latencies_ms)
+    total_seconds = latencies.sum() / 1000.0
+    return {
+        "count": int(latencies.size),
+        "grades_per_second": round(latencies.size / total_seconds, 1) if total_seconds > 0 else None,
+        "p50_ms": round(float(np.percentile(latencies, 50)), 4),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 4),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 4),
+    }
+
+
+def run(corpus, repeats: int, structural_only: bool):
+    by_branch = defaultdict(list)
+    by_path = defaultdict(list)
+    skipped = 0
+    for question_id, question_type, correct_answer, answer in corpus:
+        path = "semantic" if needs_model(question_type, correct_answer, answer) else "structural"
+        if structural_only and path == "semantic":
+            skipped += 1
+            continue
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = evaluate_answer(correct_answer, answer, question_type, question_id=question_id)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            match_type = result["details"].get("match_type") or result["details"].get("error")
+            by_branch[f"{path}/{question_type}/{match_type}"].append(elapsed_ms)
+            by_path[path].append(elapsed_ms)
+
+    return {
+        "paths": {path: summarize(values) for path, values in sorted(by_path.items())},
+        "branches": {branch: summarize(values) for branch, values in sorted(by_branch.items())},
+        "skipped_semantic": skipped,
+    }
+
+
+def corpus_fingerprint(corpus) -> str:
+    return hashlib.sha1(json.dumps(corpus, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+
+
+def main():
+    # generatoarele itereaza si peste multimi de texte: fara PYTHONHASHSEED fix,
+    # acelasi seed ar da alt corpus la fiecare proces
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        os.environ["PYTHONHASHSEED"] = "0"
+        os.execv(sys.executable, [sys.executable, "-m", "cli.bench_evaluator"] + sys.argv[1:])
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--questions", type=int, default=50, help="intrebari generate pentru fiecare tip")
+    parser.add_argument("--repeats", type=int, default=5, help="de cate ori se evalueaza fiecare raspuns")
+    parser.add_argument("--structural-only", action="store_true", help="sare raspunsurile care au nevoie de model")
+    parser.add_argument("--output", default=None, help="fisierul JSON (implicit stdout)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.seed, args.questions)
+    if not args.structural_only:
+        evaluate_answer({"reference_text": "warmup"}, "warmup", "A_STAR_DESCRIPTION")  # incarcarea modelului nu intra in masuratori
+
+    report = {
+        "config": {
+            "seed": args.seed,
+            "questions_per_kind": args.questions,
+            "answers": len(corpus),
+            "corpus_fingerprint": corpus_fingerprint(corpus),
+            "repeats": args.repeats,
+            "structural_only": args.structural_only,
+            "semantic_model": SEMANTIC_MODEL_NAME,
+            "semantic_backend": SEMANTIC_BACKEND,
+            "python": platform.python_version(),
+        },
+        **run(corpus, args.repeats, args.structural_only),
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Microbenchmark pentru KeywordMatcher (o singura trecere prin raspuns), fata de varianta
+de referinta cu o cautare de subsir pentru fiecare cuvant cheie. Verifica si ca
+cuvintele cheie gasite sunt identice.
+
+Listele de cuvinte cheie sunt construite ca la intrebarile generate (THEORY din
+custom_question_api, TEXT_KNOWLEDGE din generator), plus liste mai lungi pentru a vedea
+cum creste costul cu numarul de cuvinte cheie.
+
+Rulare (din radacina proiectului):
+    python -m cli.bench_keywords
+    python -m cli.bench_keywords --words 2000 --repeats 100
+"""
+import argparse
+import json
+import random
+import timeit
+
+from app.core.generator import TEXT_KNOWLEDGE
+from app.core.keyword_matcher import KeywordMatcher, _occurs
+from app.core.strategy_knowledge import STRATEGY_KNOWLEDGE
+from app.utils.text import normalize_text
+
+
+def theory_keywords(strategy_name: str) -> list:
+    """Cuvintele cheie ale unei intrebari THEORY generate pentru strategie"""
+    info = STRATEGY_KNOWLEDGE[strategy_name]
+    keywords = [strategy_name.lower(), "algoritm", "strategie", "metoda", "complexitate", "eficient", "optim"]
+    keywords.extend(w for w in info["description"].lower().split() if len(w) > 4)
+    return list(set(keywords))
+
+
+def vocabulary() -> list:
+    words = set()
+    for info in STRATEGY_KNOWLEDGE.values():
+        for value in info.values():
+            words.update(normalize_text(w) for w in str(value).split())
+    return sorted(words)
+
+
+def reference_find(keywords_normalized, text_normalized: str, whole_word: bool) -> set:
+    """Varianta de referinta: o cautare pentru fiecare cuvant cheie (deja normalizat)"""
+    return {kw for kw in keywords_normalized if _occurs(kw, text_normalized, whole_word)}
+
+
+def measure(fn, repeats: int) -> float:
+    """Cel mai bun timp (µs) pentru un apel"""
+    return min(timeit.repeat(fn, number=repeats, repeat=5)) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--words", type=int, default=400, help="lungimea raspunsului lung (cuvinte)")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = vocabulary()
+    strategy = next(iter(STRATEGY_KNOWLEDGE))
+    keyword_lists = {
+        "text_knowledge": TEXT_KNOWLEDGE[0]["keywords"],
+        "theory": theory_keywords(strategy),
+        "vocabulary_64": rng.sample(words, min(64, len(words))),
+        "vocabulary_all": words,
+    }
+    answers = {
+        "sentence": " ".join(rng.choice(words) for _ in range(15)),
+        "long_answer": " ".join(rng.choice(words) for _ in range(args.words)),
+    }
+
+    report = {}
+    for list_name, keywords in keyword_lists.items():
+        for whole_word in (False, True):
+            matcher = KeywordMatcher(keywords, whole_word)
+            distinct = {kw for kw in matcher.normalized if kw}
+            for answer_name, answer in answers.items():
+                text = normalize_text(answer)
+                if matcher.find(text) != reference_find(distinct, text, whole_word):
+                    raise SystemExit(f"rezultat diferit pentru {list_name}/{answer_name}")
+                baseline = measure(lambda: reference_find(distinct, text, whole_word), args.repeats)
+                current = measure(lambda: matcher.find(text), args.repeats)
+                name = f"{list_name}{'_whole_word' if whole_word else ''}/{answer_name}"
+                report[name] = {
+                    "keywords": len(distinct),
+                    "chars": len(text),
+                    "per_keyword_scan_us": round(baseline, 2),
+                    "matcher_us": round(current, 2),
+                }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
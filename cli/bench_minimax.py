@@ -0,0 +1,129 @@
+"""
+Microbenchmark pentru FlatMinMaxSolver (alpha-beta iterativ pe tablouri) fata de
+MinMaxSolver (recursiv, pe dictionare). Arborele e complet, cu frunze aleatoare;
+pe arborele mic verifica si ca ambele dau acelasi (valoare_radacina, frunze_vizitate).
+Masoara si solve_batch (multi arbori uniformi, rezolvati vectorizat) fata de
+FlatMinMaxSolver apelat pe fiecare arbore, plus timpul flatten_tree pentru aceiasi
+arbori in JSON imbricat. Castigul mare e doar pe matricea de frunze (solve_uniform_batch);
+prin solve_batch, costul per arbore (forma, extragerea frunzelor) ramane in Python.
+
+Rulare (din radacina proiectului):
+    python -m cli.bench_minimax
+    python -m cli.bench_minimax --branching 2 --depth 20
+    python -m cli.bench_minimax --batch-trees 50000 --batch-branching 3 --batch-depth 4
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.core.minimax_batch import solve_batch, solve_uniform_batch
+from app.core.minimax_solver import (
+    LEAF, MAX_NODE, MIN_NODE, FlatMinMaxSolver, FlatTree, MinMaxSolver, flatten_tree
+)
+
+
+def complete_tree(branching: int, depth: int, rng: np.random.Generator) -> FlatTree:
+    """Arbore complet direct in forma FlatTree (fara dictionare); radacina MAX"""
+    level_sizes = [branching ** d for d in range(depth + 1)]
+    internal = sum(level_sizes[:-1])
+    total = internal + level_sizes[-1]
+
+    kind = np.full(total, LEAF, dtype=np.int8)
+    start = 0
+    for d, size in enumerate(level_sizes[:-1]):
+        kind[start:start + size] = MAX_NODE if d % 2 == 0 else MIN_NODE
+        start += size
+    first_child = np.zeros(total, dtype=np.int64)
+    first_child[:internal] = np.arange(internal, dtype=np.int64) * branching + 1
+    child_count = np.zeros(total, dtype=np.int64)
+    child_count[:internal] = branching
+    value = np.zeros(total, dtype=np.int64)
+    value[internal:] = rng.integers(1, 21, size=level_sizes[-1])
+    return FlatTree(kind, first_child, child_count, value)
+
+
+def to_dict(tree: FlatTree, node: int = 0):
+    if tree.kind[node] == LEAF:
+        return {"value": int(tree.value[node])}
+    first = int(tree.first_child[node])
+    return {
+        "type": "MAX" if tree.kind[node] == MAX_NODE else "MIN",
+        "children": [to_dict(tree, child) for child in range(first, first + int(tree.child_count[node]))],
+    }
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--branching", type=int, default=2)
+    parser.add_argument("--depth", type=int, default=20, help="2^20 ~ 10^6 frunze")
+    parser.add_argument("--compare-depth", type=int, default=14, help="arborele pe care se compara cu MinMaxSolver")
+    parser.add_argument("--batch-trees", type=int, default=20000)
+    parser.add_argument("--batch-branching", type=int, default=2)
+    parser.add_argument("--batch-depth", type=int, default=4)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    small = complete_tree(args.branching, args.compare_depth, rng)
+    small_dict = to_dict(small)
+    expected, recursive_s = timed(MinMaxSolver(small_dict).solve)
+    compare_got, flat_s = timed(FlatMinMaxSolver(small).solve)
+    if compare_got != expected:
+        raise SystemExit(f"rezultat diferit: {compare_got} != {expected}")
+
+    large = complete_tree(args.branching, args.depth, rng)
+    (root_value, visited), large_s = timed(FlatMinMaxSolver(large).solve)
+
+    shape = complete_tree(args.batch_branching, args.batch_depth, rng)
+    leaf_count = shape.num_leaves
+    batch = [
+        shape._replace(value=np.concatenate([shape.value[:-leaf_count], rng.integers(1, 21, size=leaf_count)]))
+        for _ in range(args.batch_trees)
+    ]
+    expected, scalar_s = timed(lambda: [FlatMinMaxSolver(tree).solve() for tree in batch])
+    batch_got, batch_s = timed(lambda: solve_batch(batch))
+    if batch_got != expected:
+        raise SystemExit("rezultat diferit intre solve_batch si FlatMinMaxSolver")
+    # arborii ca JSON imbricat: conversia in FlatTree se plateste inainte de orice solver
+    batch_dicts = [to_dict(tree) for tree in batch]
+    _, flatten_s = timed(lambda: [flatten_tree(tree) for tree in batch_dicts])
+    # fara FlatTree-uri individuale: frunzele tuturor arborilor intr-o singura matrice
+    leaves = np.stack([tree.value[-leaf_count:] for tree in batch])
+    _, matrix_s = timed(lambda: solve_uniform_batch(leaves, args.batch_branching, args.batch_depth))
+
+    print(json.dumps({
+        "compare": {
+            "leaves": small.num_leaves,
+            "recursive_ms": round(recursive_s * 1000, 2),
+            "flat_ms": round(flat_s * 1000, 2),
+            "result": list(compare_got),
+        },
+        "large": {
+            "leaves": large.num_leaves,
+            "flat_ms": round(large_s * 1000, 2),
+            "root_value": root_value,
+            "visited_leaves": visited,
+        },
+        "batch": {
+            "trees": args.batch_trees,
+            "leaves_per_tree": leaf_count,
+            "flatten_tree_ms": round(flatten_s * 1000, 2),
+            "scalar_ms": round(scalar_s * 1000, 2),
+            "batch_ms": round(batch_s * 1000, 2),
+            "speedup": round(scalar_s / batch_s, 1),
+            "leaf_matrix_ms": round(matrix_s * 1000, 2),
+            "leaf_matrix_speedup": round(scalar_s / matrix_s, 1),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
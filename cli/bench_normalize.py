@@ -0,0 +1,65 @@
+"""
+Microbenchmark pentru normalize_text (eliminarea diacriticelor), fata de varianta
+de referinta NFD + filtrare caracter cu caracter. Verifica si ca rezultatele sunt identice.
+
+Rulare (din radacina proiectului):
+    python -m cli.bench_normalize
+    python -m cli.bench_normalize --words 2000 --repeats 200
+"""
+import argparse
+import json
+import random
+import timeit
+
+from app.utils.text import _normalize_text_slow, normalize_text
+
+WORDS = (
+    "Algoritmul A* foloseste o functie euristica admisibila și costul drumului parcurs până acum. "
+    "Strategia de căutare în adâncime explorează întâi ramura cea mai adâncă, iar căutarea în lățime "
+    "vizitează nodurile nivel cu nivel. Retezarea alfa-beta nu schimbă valoarea rădăcinii, dar "
+    "reduce numărul de frunze vizitate. Într-un echilibru Nash niciun jucător nu câștigă "
+    "schimbându-și singur strategia. Forward checking elimină valorile incompatibile din domenii."
+).split()
+
+
+def make_text(words: int, ascii_only: bool, seed: int) -> str:
+    rng = random.Random(seed)
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return _normalize_text_slow(text) if ascii_only else text
+
+
+def measure(fn, text: str, repeats: int) -> float:
+    """Cel mai bun timp (µs) pentru un apel"""
+    return min(timeit.repeat(lambda: fn(text), number=repeats, repeat=5)) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--words", type=int, default=400, help="lungimea raspunsului lung (cuvinte)")
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+
+    cases = {
+        "keyword": "căutare în adâncime",
+        "sentence": make_text(15, False, args.seed),
+        "long_answer": make_text(args.words, False, args.seed),
+        "long_answer_ascii": make_text(args.words, True, args.seed),
+    }
+    report = {}
+    for name, text in cases.items():
+        if normalize_text(text) != _normalize_text_slow(text):
+            raise SystemExit(f"rezultat diferit pentru {name}")
+        baseline = measure(_normalize_text_slow, text, args.repeats)
+        current = measure(normalize_text, text, args.repeats)
+        report[name] = {
+            "chars": len(text),
+            "baseline_us": round(baseline, 2),
+            "normalize_text_us": round(current, 2),
+            "speedup": round(baseline / current, 1),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Construieste depozitul de embeddings pentru textele de referinta statice
+(TEXT_KNOWLEDGE, STRATEGY_KNOWLEDGE), citit apoi de workeri cu mmap.
+
+Rulare (din radacina proiectului), dupa o schimbare a textelor sau a modelului:
+    python -m cli.build_reference_store
+"""
+import json
+
+from app.core.evaluator import get_semantic_model, load_reference_store, semantic_model_id
+from app.core.reference_store import REFERENCE_STORE_PATH
+
+
+def main():
+    store = load_reference_store(get_semantic_model().encode, rebuild=True)
+    if store is None:
+        raise SystemExit(f"Depozitul nu a putut fi scris in {REFERENCE_STORE_PATH}.npy")
+    print(json.dumps({
+        "path": REFERENCE_STORE_PATH + ".npy",
+        "texts": len(store),
+        "dimension": int(store.vectors.shape[1]),
+        "model": semantic_model_id(),
+        "fingerprint": store.fingerprint,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Porneste serviciul de embeddings partajat (un singur model pentru toti workerii).
+
+Rulare (din radacina proiectului), apoi workerii cu SEMANTIC_BACKEND=sidecar:
+    python -m cli.embedding_sidecar --backend torch
+    SEMANTIC_BACKEND=sidecar uvicorn app.main:app --workers 4
+"""
+import argparse
+
+from app.core.embedding_backends import BACKENDS
+from app.core.embedding_sidecar import SEMANTIC_SIDECAR_SOCKET, serve
+from app.core.evaluator import SEMANTIC_BATCH_MAX_SIZE, SEMANTIC_BATCH_MAX_WAIT_MS, SEMANTIC_MODEL_NAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=SEMANTIC_SIDECAR_SOCKET)
+    parser.add_argument("--backend", default="torch", choices=sorted(set(BACKENDS) - {"sidecar"}))
+    parser.add_argument("--max-batch-size", type=int, default=SEMANTIC_BATCH_MAX_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=SEMANTIC_BATCH_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    print(f"Sidecar embeddings: {SEMANTIC_MODEL_NAME} ({args.backend}) pe {args.socket}")
+    serve(args.socket, args.backend, SEMANTIC_MODEL_NAME, args.max_batch_size, args.max_wait_ms)
+
+
+if __name__ == "__main__":
+    main()
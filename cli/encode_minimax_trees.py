@@ -0,0 +1,58 @@
+"""
+Converteste arborii intrebarilor MINIMAX_TREE salvate in formatul vechi (dictionare
+imbricate) in codificarea compacta pe niveluri (app/core/tree_encoding.py).
+Intrebarile deja convertite sunt sarite, deci comanda poate fi rulata de mai multe ori.
+
+Rulare (din radacina proiectului):
+    python -m cli.encode_minimax_trees
+    python -m cli.encode_minimax_trees --chunk-size 1000
+"""
+import argparse
+
+from sqlalchemy import select
+
+from app.core.tree_encoding import encode_tree, is_encoded
+from app.database import SessionLocal
+from app.models import Question, QuestionTypeEnum
+
+
+def encode_stored_trees(session_factory=SessionLocal, chunk_size: int = 500) -> int:
+    """Intoarce numarul de intrebari convertite"""
+    query = (
+        select(Question.id, Question.problem_instance)
+        .where(Question.question_type == QuestionTypeEnum.MINIMAX_TREE)
+        .order_by(Question.id)
+    )
+    converted = 0
+    # ca la re-evaluare: citirea (cursor pe server) si scrierea pe conexiuni separate
+    read_db = session_factory()
+    write_db = session_factory()
+    try:
+        result = read_db.execute(query.execution_options(stream_results=True, yield_per=chunk_size))
+        for rows in result.partitions(chunk_size):
+            for row in rows:
+                instance = row.problem_instance or {}
+                if "tree" not in instance or is_encoded(instance["tree"]):
+                    continue
+                question = write_db.get(Question, row.id)
+                # dict nou: coloana JSONB nu urmareste modificarile in loc
+                question.problem_instance = dict(instance, tree=encode_tree(instance["tree"]))
+                converted += 1
+            write_db.commit()
+    finally:
+        read_db.close()
+        write_db.close()
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    converted = encode_stored_trees(chunk_size=args.chunk_size)
+    print(f"{converted} arbori convertiti")
+
+
+if __name__ == "__main__":
+    main()
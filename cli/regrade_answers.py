@@ -0,0 +1,43 @@
+"""
+Re-evalueaza raspunsurile salvate cu evaluatorul curent si salveaza evaluari noi
+sub eticheta EVALUATOR_VERSION (evaluarile vechi raman in tabela).
+
+Rulare (din radacina proiectului):
+    python -m cli.regrade_answers
+    python -m cli.regrade_answers --chunk-size 1000 --limit 50000
+
+Un job intrerupt se reia de la checkpoint (--checkpoint sau regrade-<versiune>.json).
+"""
+import argparse
+import json
+import sys
+
+from app.core.regrade import REGRADE_CHUNK_SIZE, regrade_answers
+
+
+def print_progress(stats):
+    print(
+        f"{stats['processed']} raspunsuri, ultimul id {stats['last_answer_id']}, "
+        f"{stats['rows_per_second']} randuri/sec",
+        file=sys.stderr
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=REGRADE_CHUNK_SIZE)
+    parser.add_argument("--checkpoint", default=None, help="fisierul de checkpoint")
+    parser.add_argument("--limit", type=int, default=None, help="numarul maxim de raspunsuri re-evaluate")
+    args = parser.parse_args()
+
+    stats = regrade_answers(
+        chunk_size=args.chunk_size,
+        checkpoint_file=args.checkpoint,
+        limit=args.limit,
+        report=print_progress
+    )
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
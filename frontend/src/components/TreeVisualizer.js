@@ -1,7 +1,39 @@
 import React from "react";
 import { GitBranch } from "lucide-react";
 
-export default function TreeVisualizer({ tree }) {
+const NODE_TYPES = { X: "MAX", N: "MIN" };
+
+// Arborele vine codificat pe niveluri ({encoding: "level_order", types, arity, values},
+// vezi app/core/tree_encoding.py); îl refacem în noduri imbricate, cu id = poziția nodului.
+// Întrebările salvate înainte de codificare au deja arborele imbricat.
+export function decodeTree(tree) {
+  if (!tree || tree.encoding !== "level_order") return tree;
+
+  const nodes = [];
+  let leaf = 0;
+  for (let i = 0; i < tree.types.length; i++) {
+    const code = tree.types[i];
+    nodes.push(
+      code === "L"
+        ? { id: `n${i}`, value: tree.values[leaf++] }
+        : { id: `n${i}`, type: NODE_TYPES[code], children: [] }
+    );
+  }
+
+  // copiii fiecărui nod intern urmează, în ordine, după copiii nodurilor dinaintea lui
+  let next = 1;
+  let internal = 0;
+  for (const node of nodes) {
+    if (!node.children) continue;
+    const count = tree.arity[internal++];
+    node.children = nodes.slice(next, next + count);
+    next += count;
+  }
+  return nodes[0];
+}
+
+export default function TreeVisualizer({ tree: encodedTree }) {
+  const tree = decodeTree(encodedTree);
   if (!tree) return null;
 
   // Calculează layout-ul (width pentru fiecare subarbore)
@@ -0,0 +1,98 @@
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+from app import models
+from app.core.evaluator import SemanticOverloaded
+from app.database import Base, get_db
+from app.routers import answer_api
+
+
+# tabelele Postgres, create pe sqlite in memorie
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_on_sqlite(type_, compiler, **kw):
+    return "INTEGER"  # sqlite genereaza id-ul doar pentru INTEGER PRIMARY KEY
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(answer_api.router, prefix="/api")
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+@pytest.fixture
+def question_id(session_factory):
+    with session_factory() as db:
+        question = models.Question(
+            title="Strategie", prompt="Ce strategie se potriveste?",
+            question_type=models.QuestionTypeEnum.N_QUEENS,
+            correct_answer={"answer": "Backtracking"},
+            reference_solution="Răspunsul corect este: Backtracking",
+        )
+        db.add(question)
+        db.commit()
+        return question.id
+
+
+def saved_rows(session_factory):
+    with session_factory() as db:
+        return db.query(models.Answer).count(), db.query(models.Evaluation).count()
+
+
+def test_retry_after_503_saves_one_answer(client, session_factory, question_id, monkeypatch):
+    evaluate_answer = answer_api.evaluate_answer
+
+    def overloaded(*args, **kwargs):
+        raise SemanticOverloaded(retry_after=2)
+
+    submission = {"question_id": question_id, "user_answer": "Backtracking"}
+    monkeypatch.setattr(answer_api, "evaluate_answer", overloaded)
+    response = client.post("/api/answer/submit", json=submission)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert saved_rows(session_factory) == (0, 0)
+
+    monkeypatch.setattr(answer_api, "evaluate_answer", evaluate_answer)
+    response = client.post("/api/answer/submit", json=submission)
+    assert response.status_code == 200
+    assert response.json()["score"] == 100.0
+    assert saved_rows(session_factory) == (1, 1)
+
+
+def test_answer_and_evaluation_are_saved_together(client, session_factory, question_id):
+    response = client.post("/api/answer/submit", json={"question_id": question_id, "user_answer": "Greedy"})
+    assert response.status_code == 200
+    with session_factory() as db:
+        answer = db.query(models.Answer).one()
+        assert answer.answer_text == "Greedy"
+        assert [float(e.score) for e in answer.evaluations] == [0.0]
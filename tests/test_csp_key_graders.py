@@ -0,0 +1,51 @@
+from app.core.graders import compile_grader, parse_value_set
+
+
+def grade(correct_answer, user_answer):
+    return compile_grader(correct_answer, "CSP_PROBLEM").grade(user_answer)
+
+
+def test_value_set_keeps_multi_word_values():
+    assert parse_value_set("{Verde deschis, Roșu}") == {"verdedeschis", "rosu"}
+    assert parse_value_set("rosu;  verde   deschis") == {"verdedeschis", "rosu"}
+    assert parse_value_set("Mulțimea vidă") == frozenset()
+
+
+def test_forward_checking_multi_word_values():
+    correct = {"answer": "{Rosu, Verde deschis}", "key": ["Rosu", "Verde deschis"]}
+    assert grade(correct, "{Verde deschis, Rosu}")["score"] == 100.0
+    assert grade(correct, "verde deschis, roșu")["score"] == 100.0
+    assert grade(correct, "{Verde, Rosu}")["score"] == 0.0
+
+
+def test_numeric_values_any_order():
+    correct = {"answer": "{1, 3}", "key": ["1", "3"]}
+    assert grade(correct, "3,1")["score"] == 100.0
+    assert grade(correct, "{1}")["score"] == 0.0
+
+
+def test_empty_set():
+    correct = {"answer": "Multimea vida", "key": []}
+    assert grade(correct, "mulțimea vidă")["is_correct"]
+    assert not grade(correct, "{1}")["is_correct"]
+
+
+def test_mrv_multi_word_variable():
+    correct = {"answer": "Tara A", "key": ["Tara A"]}
+    assert grade(correct, "Tara A")["score"] == 100.0
+    assert grade(correct, "Variabila Țara A are cele mai puține valori")["score"] == 100.0
+    assert grade(correct, "TaraA")["score"] == 100.0
+    assert grade(correct, "Tara B")["score"] == 0.0
+
+
+def test_mrv_single_letter_variable():
+    correct = {"answer": "X", "key": ["X"]}
+    assert grade(correct, "Variabila X")["score"] == 100.0
+    assert grade(correct, "X are cele mai putine valori")["score"] == 100.0
+    assert grade(correct, "Y")["score"] == 0.0
+
+
+def test_extra_values_accepted_as_before_keys():
+    # comparatia pe textul afisat (regula de dinaintea cheilor) ramane valabila
+    correct = {"answer": "{1, 3}", "key": ["1", "3"]}
+    assert grade(correct, "{1, 3, 5}")["score"] == 100.0
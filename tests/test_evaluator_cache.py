@@ -0,0 +1,25 @@
+from app.core.evaluator import evaluate_answer, evaluate_answers_batch
+
+CHOICE = {"answer": "Programare Dinamica"}
+
+
+def test_answer_is_graded_as_submitted():
+    assert evaluate_answer(CHOICE, "programare\ndinamica", "STRATEGY", question_id=601)["score"] == 0.0
+    assert evaluate_answer(CHOICE, "Programare Dinamica", "STRATEGY", question_id=601)["score"] == 100.0
+
+
+def test_whitespace_variant_does_not_reuse_cached_result():
+    assert evaluate_answer(CHOICE, "programare dinamica", "STRATEGY", question_id=602)["score"] == 100.0
+    assert evaluate_answer(CHOICE, "programare\ndinamica", "STRATEGY", question_id=602)["score"] == 0.0
+    assert evaluate_answer(CHOICE, " programare dinamica ", "STRATEGY", question_id=602)["score"] == 100.0
+
+
+def test_cached_result_matches_fresh_result():
+    first = evaluate_answer(CHOICE, "programare dinamica", "STRATEGY", question_id=603)
+    assert evaluate_answer(CHOICE, "programare dinamica", "STRATEGY", question_id=603) == first
+
+
+def test_batch_matches_single_items():
+    answers = ["programare\ndinamica", "Programare Dinamica", "greedy", "  programare   dinamica"]
+    batch = evaluate_answers_batch([(CHOICE, answer, "STRATEGY") for answer in answers])
+    assert batch == [evaluate_answer(CHOICE, answer, "STRATEGY") for answer in answers]
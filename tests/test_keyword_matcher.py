@@ -0,0 +1,45 @@
+import random
+
+from app.core.graders import compile_grader
+from app.core.keyword_matcher import KeywordMatcher, _occurs
+from app.utils.text import normalize_text
+
+KEYWORDS = ["alpha", "alpha-beta", "beta", "g(n)", "h(n)", "cost", "optim", "ab", "bc"]
+
+
+def reference_find(keywords, text, whole_word):
+    return {normalize_text(kw) for kw in keywords if _occurs(normalize_text(kw), text, whole_word)}
+
+
+def test_same_keywords_as_one_scan_per_keyword():
+    rng = random.Random(7)
+    pieces = KEYWORDS + ["abc", "optimal", "costisitor", " ", ",", "-", "(", "x"]
+    for whole_word in (False, True):
+        matcher = KeywordMatcher(KEYWORDS, whole_word)
+        for _ in range(500):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            assert matcher.find(text) == reference_find(KEYWORDS, text, whole_word), (text, whole_word)
+
+
+def test_overlapping_and_contained_keywords():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert matcher.find("abc") == {"ab", "bc"}
+    assert matcher.find("alpha-beta") == {"alpha", "alpha-beta", "beta"}
+
+
+def test_whole_word():
+    matcher = KeywordMatcher(["cost", "optim", "g(n)"], whole_word=True)
+    assert matcher.find("costisitor si optimal") == set()
+    assert matcher.find("costul e optim, f(n) = g(n) + h(n)") == {"optim", "g(n)"}
+
+
+def test_score_counts_repeated_keywords():
+    matcher = KeywordMatcher(["Căutare", "cautare", "optim", ""])
+    assert matcher.score(normalize_text("căutare")) == 0.75
+
+
+def test_hybrid_grader_uses_whole_word_flag():
+    correct = {"keywords": ["cost"], "reference_text": "x"}
+    assert compile_grader(correct, "THEORY").keywords.find("costisitor") == {"cost"}
+    correct["whole_word_keywords"] = True
+    assert compile_grader(correct, "THEORY").keywords.find("costisitor") == set()
@@ -0,0 +1,35 @@
+from app.core.graders import compile_grader
+
+TWO_EQUILIBRIA = {"answer": "(Sus, Centru) si (Jos, Stanga)", "key": [[0, 1], [2, 0]]}
+ONE_EQUILIBRIUM = {"answer": "(Sus, Stanga)", "key": [[0, 0]]}
+
+
+def grade(correct_answer, user_answer):
+    return compile_grader(correct_answer, "GAME_MATRIX").grade(user_answer)
+
+
+def test_exact_answer():
+    result = grade(TWO_EQUILIBRIA, "(Sus, Centru) si (Jos, Stanga)")
+    assert result["is_correct"] and result["score"] == 100.0
+
+
+def test_all_equilibria_in_other_words():
+    result = grade(TWO_EQUILIBRIA, "Jos-Stânga, apoi Sus cu Centru")
+    assert result["is_correct"] and result["score"] == 100.0
+
+
+def test_partial_answer_keeps_matched_over_total():
+    result = grade(TWO_EQUILIBRIA, "(Sus, Centru)")
+    assert result["is_correct"] and result["score"] == 50.0
+
+
+def test_compact_and_diacritics():
+    assert grade(ONE_EQUILIBRIUM, "SusStanga")["score"] == 100.0
+    assert grade(ONE_EQUILIBRIUM, "(Sus, Stânga)")["score"] == 100.0
+
+
+def test_no_equilibrium():
+    none = {"answer": "Nu exista echilibru Nash pur", "key": []}
+    assert grade(none, "Nu există")["is_correct"]
+    assert not grade(none, "(Sus, Stanga)")["is_correct"]
+    assert not grade(ONE_EQUILIBRIUM, "nu exista echilibru")["is_correct"]
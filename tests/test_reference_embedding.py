@@ -0,0 +1,87 @@
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core import evaluator
+
+THEORY = {
+    "keywords": ["euristica", "cost"],
+    "reference_text": "A* extinde nodul cu f(n) = g(n) + h(n) minim.",
+    "reference_texts": ["A* aduna costul drumului cu estimarea euristica."],
+}
+
+
+class FakeModel:
+    """Vectori deterministi pentru fiecare text; retine textele codificate"""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        vectors = np.stack([
+            np.random.default_rng(zlib.crc32(text.encode())).normal(size=8) for text in texts
+        ]).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(evaluator, "get_semantic_model", lambda: fake)
+    # cheile din cache-ul de embeddings si blob-urile salvate raman ale modelului de test
+    monkeypatch.setattr(evaluator, "SEMANTIC_MODEL_ID", "test-model/fake")
+    monkeypatch.setattr(evaluator, "SEMANTIC_MODEL_ENABLED", True)
+    monkeypatch.setattr(evaluator, "_embedding_dim", None)
+    return fake
+
+
+def new_question():
+    return SimpleNamespace(question_type="A_STAR_DESCRIPTION", correct_answer=THEORY,
+                           reference_embedding=None, reference_embedding_model=None)
+
+
+def test_generation_computes_embedding(model):
+    question = new_question()
+    blob = evaluator.ensure_reference_embedding(question)
+
+    assert blob is not None
+    assert question.reference_embedding_model == "test-model/fake"
+    assert evaluator.stored_reference_embedding(question) == blob
+
+    # la evaluare modelul codifica doar raspunsul
+    model.encoded.clear()
+    answer = "A* foloseste costul si o euristica"
+    evaluator.evaluate_answer(THEORY, answer, question.question_type, reference_embedding=blob)
+    assert model.encoded == [answer]
+
+
+def test_worker_without_model_fills_embedding_at_first_evaluation(model, monkeypatch):
+    question = new_question()
+    monkeypatch.setattr(evaluator, "SEMANTIC_MODEL_ENABLED", False)
+    assert evaluator.ensure_reference_embedding(question) is None
+    assert question.reference_embedding is None
+    assert model.encoded == []
+
+    monkeypatch.setattr(evaluator, "SEMANTIC_MODEL_ENABLED", True)
+    evaluator.evaluate_answer(
+        THEORY, "costul drumului plus euristica", question.question_type,
+        reference_embedding=evaluator.stored_reference_embedding(question),
+        on_reference_embedding=lambda blob: evaluator.set_reference_embedding(question, blob)
+    )
+    assert question.reference_embedding == evaluator.ensure_reference_embedding(new_question())
+    assert question.reference_embedding_model == "test-model/fake"
+
+
+def test_unwritable_reference_store_is_logged(monkeypatch, caplog):
+    def read_only(*args, **kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(evaluator, "load_store", lambda *args: None)
+    monkeypatch.setattr(evaluator, "build_store", read_only)
+    monkeypatch.setattr(evaluator, "_reference_store", None)
+    with caplog.at_level("WARNING", logger="app.core.evaluator"):
+        assert evaluator.load_reference_store(FakeModel().encode) is None
+    assert "read-only file system" in caplog.text
@@ -0,0 +1,28 @@
+import random
+
+from app.utils.input import token_overlap_score
+from app.utils.text import _normalize_text_slow, normalize_text
+
+
+def test_normalize_text_matches_reference_on_every_code_point():
+    for codepoint in range(0x110000):
+        if 0xD800 <= codepoint <= 0xDFFF:
+            continue
+        char = chr(codepoint)
+        assert normalize_text(char) == _normalize_text_slow(char), hex(codepoint)
+
+
+def test_normalize_text_matches_reference_on_mixed_text():
+    rng = random.Random(15)
+    alphabet = "aăâîșşțţĂÂÎȘȚ éèêëçñöüÖÜ ΣσςΑά ̧́ \U0001D165xyz.,"
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert normalize_text(text) == _normalize_text_slow(text), repr(text)
+
+
+def test_romanian_answer():
+    assert normalize_text("Programare Dinamică și Căutare în Lățime") == "programare dinamica si cautare in latime"
+
+
+def test_token_overlap_uses_shared_normalizer():
+    assert token_overlap_score("Căutare în lățime", "cautare in latime") == 100.0